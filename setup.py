@@ -21,6 +21,7 @@ setup(
         'console_scripts': [
             'ftb=treescript_builder.__main__:main',
             'treescript-builder=treescript_builder.__main__:main',
+            'ftb-migrate=treescript_builder.__main__:migrate',
         ],
     },
     python_requires='>=3.11',
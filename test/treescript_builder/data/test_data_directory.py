@@ -1,12 +1,13 @@
 """Testing Data Directory
 """
+import os
 from pathlib import Path
 from re import escape
 
 import pytest
 
 from treescript_builder.data import data_directory
-from treescript_builder.data.data_directory import DataDirectory, get_data_dir_validator
+from treescript_builder.data.data_directory import DataDirectory, get_data_dir_validator, migrate_to_sharded
 from treescript_builder.data.tree_data import TreeData
 
 
@@ -14,9 +15,9 @@ ftb_path = Path('.ftb/')
 data_label = 'data_label'
 
 
-def yield_path(_, x):
-    """Generator used to mock the Path object glob method."""
-    yield ftb_path / data_label
+def scan_data_label(_):
+    """Used to mock the DataDirectory scan method, finding one DataLabel."""
+    return {data_label}
 
 
 @pytest.mark.parametrize(
@@ -68,7 +69,7 @@ def test_search_label_does_not_exist_returns_none(test_input):
         instance = DataDirectory(Path('data_dir'))
         # When the Label is searched, the Path does not exist
         m.setattr(Path, 'exists', lambda c: False)
-        m.setattr(Path, 'glob', lambda c, d: iter([]))
+        m.setattr(data_directory, '_scan_data_dir', lambda _: set())
         assert instance._search_label(test_input) is None
 
 
@@ -87,10 +88,36 @@ def test_search_label_exists_returns_path(test_input):
         m.setattr(Path, 'exists', lambda c: True)
         instance = DataDirectory(data_dir_path)
         #
-        m.setattr(Path, 'glob', lambda c, d: iter([data_dir_path / test_input]))
+        m.setattr(data_directory, '_scan_data_dir', lambda _: {test_input})
         assert instance._search_label(test_input) == data_dir_path / test_input
 
 
+def test_search_label_scans_data_dir_once():
+    scan_calls = []
+    def mock_scan(path):
+        scan_calls.append(path)
+        return {data_label}
+    with pytest.MonkeyPatch().context() as m:
+        m.setattr(Path, 'exists', lambda c: True)
+        m.setattr(data_directory, '_scan_data_dir', mock_scan)
+        instance = DataDirectory(ftb_path)
+        for _ in range(3):
+            assert instance._search_label(data_label) == ftb_path / data_label
+            assert instance._search_label('other_label') is None
+    assert scan_calls == [ftb_path]
+
+
+def test_scan_data_dir_real_directory_returns_names(tmp_path):
+    (tmp_path / 'label_a').touch()
+    (tmp_path / 'label_b.txt').touch()
+    (tmp_path / 'sub_dir').mkdir()
+    assert data_directory._scan_data_dir(tmp_path) == {'label_a', 'label_b.txt', 'sub_dir'}
+
+
+def test_scan_data_dir_missing_directory_returns_empty_set(tmp_path):
+    assert data_directory._scan_data_dir(tmp_path / 'missing') == set()
+
+
 @pytest.mark.parametrize(
     "test_input,expect",
     [
@@ -101,7 +128,7 @@ def test_search_label_exists_returns_path(test_input):
 def test_validate_build_input_file_returns_data(test_input, expect):
     with pytest.MonkeyPatch().context() as c:
         c.setattr(Path, 'exists', lambda _: True) # The DataDir Exists
-        c.setattr(Path, 'glob', yield_path)
+        c.setattr(data_directory, '_scan_data_dir', scan_data_label)
         assert DataDirectory(ftb_path).validate_build(test_input) == expect
 
 
@@ -109,7 +136,7 @@ def test_validate_build_empty_data_label_returns_none():
     test_input = TreeData(1, 0, False, "file_name", '')
     with pytest.MonkeyPatch().context() as c:
         c.setattr(Path, 'exists', lambda _: True) # The DataDir Exists
-        c.setattr(Path, 'glob', yield_path)
+        c.setattr(data_directory, '_scan_data_dir', scan_data_label)
         assert DataDirectory(ftb_path).validate_build(test_input) is None
 
 
@@ -118,7 +145,7 @@ def test_validate_build_isdir_plus_empty_data_label_returns_none():
     test_input = TreeData(1, 0, True, "file_name", '')
     with pytest.MonkeyPatch().context() as c:
         c.setattr(Path, 'exists', lambda _: True) # The DataDir Exists
-        c.setattr(Path, 'glob', yield_path)
+        c.setattr(data_directory, '_scan_data_dir', scan_data_label)
         # Empty DataLabel should return None for compatibility with 0.1.x
         assert DataDirectory(ftb_path).validate_build(test_input) is None
 
@@ -127,7 +154,7 @@ def test_validate_build_isdir_returns_path_anyway():
     test_input = TreeData(1, 0, True, "file_name", data_label)
     with pytest.MonkeyPatch().context() as c:
         c.setattr(Path, 'exists', lambda _: True) # The DataDir Exists
-        c.setattr(Path, 'glob', yield_path)
+        c.setattr(data_directory, '_scan_data_dir', scan_data_label)
         assert DataDirectory(ftb_path).validate_build(test_input) == ftb_path / data_label
 
 
@@ -182,7 +209,7 @@ def test_validate_build_invalid_datalabel_raises_exit(test_input):
 def test_validate_trim_data_file_does_not_yet_exist_returns_path(test_input, expect):
     with pytest.MonkeyPatch().context() as c:
         c.setattr(Path, 'exists', lambda _: True)
-        c.setattr(Path, 'glob', lambda _, x: iter([]))
+        c.setattr(data_directory, '_scan_data_dir', lambda _: set())
         assert DataDirectory(ftb_path).validate_trim(test_input) == expect
 
 
@@ -217,7 +244,7 @@ def test_validate_trim_isdir_does_not_exist_returns_path():
 def test_validate_trim_data_file_already_exists_raises_exit(test_input):
     with pytest.MonkeyPatch().context() as c:
         c.setattr(Path, 'exists', lambda _: True) # The DataDir exists.
-        c.setattr(Path, 'glob', yield_path) # The DataFile exists.
+        c.setattr(data_directory, '_scan_data_dir', scan_data_label) # The DataFile exists.
         with pytest.raises(SystemExit, match=data_directory._DATA_FILE_EXISTS_MSG):
             DataDirectory(ftb_path).validate_trim(test_input)
 
@@ -237,6 +264,15 @@ def test_validate_trim_duplicate_data_labels_raises_exit():
             data_dir.validate_trim(test_input3)
 
 
+def test_validate_trim_reserves_label_in_index():
+    with pytest.MonkeyPatch().context() as c:
+        c.setattr(Path, 'exists', lambda _: True)
+        c.setattr(data_directory, '_scan_data_dir', lambda _: set())
+        data_dir = DataDirectory(ftb_path)
+        assert data_dir.validate_trim(TreeData(1, 0, False, "f1", data_label)) == ftb_path / data_label
+        assert data_dir._search_label(data_label) == ftb_path / data_label
+
+
 @pytest.mark.parametrize(
     "tree_data", [
         TreeData(1, 0, True, "src", ''),
@@ -283,3 +319,257 @@ def test_get_data_dir_validator_trim_no_data_dir_tree_data_with_data_label_raise
     validator = get_data_dir_validator(None, is_trim=True)
     with pytest.raises(SystemExit):
         validator(tree_data)
+
+
+def test_persisted_index_is_written_and_excluded_from_labels(tmp_path):
+    (tmp_path / data_label).touch()
+    data_dir = DataDirectory(tmp_path, use_index=True)
+    assert (tmp_path / data_directory._INDEX_FILE_NAME).exists()
+    assert data_dir._search_label(data_label) == tmp_path / data_label
+    assert data_dir._search_label(data_directory._INDEX_FILE_NAME) is None
+
+
+def test_persisted_index_unchanged_dir_skips_scan(tmp_path):
+    (tmp_path / data_label).touch()
+    DataDirectory(tmp_path, use_index=True)
+    with pytest.MonkeyPatch().context() as c:
+        c.setattr(data_directory, '_scan_data_dir', lambda _: pytest.fail('Unexpected DataDirectory scan'))
+        data_dir = DataDirectory(tmp_path, use_index=True)
+        assert data_dir._search_label(data_label) == tmp_path / data_label
+
+
+def test_persisted_index_changed_dir_rescans(tmp_path):
+    DataDirectory(tmp_path, use_index=True)
+    (tmp_path / data_label).touch()
+    # Ensure the Directory modification time differs, on coarse timestamp file systems
+    os.utime(tmp_path, ns=(0, 1_000_000_000))
+    data_dir = DataDirectory(tmp_path, use_index=True)
+    assert data_dir._search_label(data_label) == tmp_path / data_label
+
+
+def test_persisted_index_rebuild_rescans(tmp_path):
+    DataDirectory(tmp_path, use_index=True)
+    index_path = tmp_path / data_directory._INDEX_FILE_NAME
+    # Replace the index contents with a stale label, without changing the Directory
+    header = index_path.read_text().split('\n')[0].split(' ')
+    header[2] = '1'
+    index_path.write_text(' '.join(header) + '\nstale_label\n')
+    assert DataDirectory(tmp_path, use_index=True)._search_label('stale_label') is not None
+    data_dir = DataDirectory(tmp_path, rebuild_index=True)
+    assert data_dir._search_label('stale_label') is None
+
+
+def test_persisted_index_partial_file_rescans(tmp_path):
+    (tmp_path / data_label).touch()
+    DataDirectory(tmp_path, use_index=True)
+    index_path = tmp_path / data_directory._INDEX_FILE_NAME
+    # Truncate the label lines, as if the write was interrupted
+    index_path.write_text(index_path.read_text().split('\n')[0] + '\n')
+    assert DataDirectory(tmp_path, use_index=True)._search_label(data_label) == tmp_path / data_label
+
+
+def test_validate_build_index_file_label_raises_exit(tmp_path):
+    DataDirectory(tmp_path, use_index=True)
+    test_input = TreeData(3, 0, False, "file", data_directory._INDEX_FILE_NAME)
+    with pytest.raises(SystemExit, match=escape(data_directory._DATA_LABEL_INVALID_MSG + '3')):
+        DataDirectory(tmp_path).validate_build(test_input)
+
+
+def test_get_fingerprint_changes_with_labels(tmp_path):
+    (tmp_path / 'a').touch()
+    fingerprint = DataDirectory(tmp_path).get_fingerprint()
+    assert fingerprint == DataDirectory(tmp_path).get_fingerprint()
+    (tmp_path / 'b').touch()
+    assert fingerprint != DataDirectory(tmp_path).get_fingerprint()
+
+
+_DIGEST_A = 'a' * 64
+_DIGEST_B = 'b' * 64
+
+
+def _write_manifest(data_dir: Path, manifest: dict[str, str]):
+    (data_dir / data_directory._MANIFEST_FILE_NAME).write_text(
+        f'ftb-manifest 1 {len(manifest)}\n' + ''.join(f'{digest} {label}\n' for label, digest in manifest.items())
+    )
+
+
+def test_content_addressed_without_manifest_is_flat(tmp_path):
+    assert not DataDirectory(tmp_path).is_content_addressed()
+    assert DataDirectory(tmp_path, content_addressed=True).is_content_addressed()
+
+
+def test_content_addressed_manifest_is_detected(tmp_path):
+    _write_manifest(tmp_path, {data_label: _DIGEST_A})
+    assert (data_dir := DataDirectory(tmp_path)).is_content_addressed()
+    assert tmp_path / data_directory._BLOB_DIR_NAME / _DIGEST_A == data_dir._search_label(data_label)
+    assert data_dir._search_label('other_label') is None
+
+
+def test_content_addressed_validate_build_returns_blob_path(tmp_path):
+    _write_manifest(tmp_path, {data_label: _DIGEST_A, 'other_label': _DIGEST_A})
+    (tmp_path / 'flat_label').touch()
+    data_dir = DataDirectory(tmp_path)
+    blob_path = tmp_path / data_directory._BLOB_DIR_NAME / _DIGEST_A
+    assert blob_path == data_dir.validate_build(TreeData(1, 0, False, 'file', data_label))
+    assert blob_path == data_dir.validate_build(TreeData(2, 0, False, 'file', 'other_label'))
+    assert tmp_path / 'flat_label' == data_dir.validate_build(TreeData(3, 0, False, 'file', 'flat_label'))
+
+
+def test_content_addressed_validate_trim_manifest_label_raises_exit(tmp_path):
+    _write_manifest(tmp_path, {data_label: _DIGEST_A})
+    test_input = TreeData(4, 0, False, 'file', data_label)
+    with pytest.raises(SystemExit, match=escape(data_directory._DATA_FILE_EXISTS_MSG + '4')):
+        DataDirectory(tmp_path).validate_trim(test_input)
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        'ftb-manifest 1 1\n',
+        'ftb-manifest 2 0\n',
+        f'ftb-manifest 1 1\n{_DIGEST_A}\n',
+        f'ftb-manifest 1 1\n{_DIGEST_A} {data_label}',
+    ]
+)
+def test_content_addressed_invalid_manifest_raises_exit(tmp_path, test_input):
+    (tmp_path / data_directory._MANIFEST_FILE_NAME).write_text(test_input)
+    with pytest.raises(SystemExit, match=escape(data_directory._DATA_MANIFEST_INVALID_MSG)):
+        DataDirectory(tmp_path)
+
+
+def test_add_blob_labels_writes_manifest(tmp_path):
+    data_dir = DataDirectory(tmp_path, content_addressed=True)
+    assert data_dir.add_blob_labels({data_label: _DIGEST_A, 'other_label': _DIGEST_B})
+    assert data_dir.get_blob_path(_DIGEST_B) == data_dir._search_label('other_label')
+    reloaded = DataDirectory(tmp_path)
+    assert reloaded.is_content_addressed()
+    assert reloaded._manifest == {data_label: _DIGEST_A, 'other_label': _DIGEST_B}
+    assert not (tmp_path / data_directory._MANIFEST_TEMP_FILE_NAME).exists()
+
+
+@pytest.mark.parametrize("name", sorted(data_directory._RESERVED_NAMES))
+def test_content_addressed_reserved_names_are_not_labels(tmp_path, name):
+    _write_manifest(tmp_path, {})
+    (tmp_path / data_directory._BLOB_DIR_NAME).mkdir()
+    assert DataDirectory(tmp_path)._search_label(name) is None
+    with pytest.raises(SystemExit, match=escape(data_directory._DATA_LABEL_INVALID_MSG + '5')):
+        DataDirectory(tmp_path).validate_trim(TreeData(5, 0, False, 'file', name))
+
+
+def test_get_fingerprint_changes_with_manifest(tmp_path):
+    _write_manifest(tmp_path, {data_label: _DIGEST_A})
+    fingerprint = DataDirectory(tmp_path).get_fingerprint()
+    _write_manifest(tmp_path, {data_label: _DIGEST_B})
+    assert fingerprint != DataDirectory(tmp_path).get_fingerprint()
+
+
+def _get_sharded_path(data_dir: Path, label: str) -> Path:
+    shard = data_directory._get_label_shard(label)
+    return data_dir / shard[0:2] / shard[2:4] / label
+
+
+def test_sharded_new_data_dir_is_marked(tmp_path):
+    assert not DataDirectory(tmp_path).is_sharded()
+    assert DataDirectory(tmp_path, sharded=True).is_sharded()
+    # The layout is detected without the argument
+    assert DataDirectory(tmp_path).is_sharded()
+
+
+def test_sharded_flat_data_dir_raises_exit(tmp_path):
+    (tmp_path / data_label).touch()
+    with pytest.raises(SystemExit, match=escape(data_directory._DATA_DIR_NOT_SHARDED_MSG)):
+        DataDirectory(tmp_path, sharded=True)
+
+
+def test_sharded_validate_build_returns_sharded_path(tmp_path):
+    data_dir = DataDirectory(tmp_path, sharded=True)
+    (expected := _get_sharded_path(tmp_path, data_label)).parent.mkdir(parents=True)
+    expected.touch()
+    assert expected == data_dir.validate_build(TreeData(1, 0, False, 'file', data_label))
+
+
+def test_sharded_validate_build_missing_label_raises_exit(tmp_path):
+    data_dir = DataDirectory(tmp_path, sharded=True)
+    with pytest.raises(SystemExit, match=escape(data_directory._DATA_LABEL_NOT_FOUND_MSG + '2')):
+        data_dir.validate_build(TreeData(2, 0, False, 'file', data_label))
+
+
+def test_sharded_validate_trim_reserves_label(tmp_path):
+    data_dir = DataDirectory(tmp_path, sharded=True)
+    expected = _get_sharded_path(tmp_path, data_label)
+    assert expected == data_dir.validate_trim(TreeData(1, 0, False, 'file', data_label))
+    assert not expected.parent.exists()
+    data_dir.make_shard_dirs([expected, None, expected])
+    assert expected.parent.is_dir()
+    with pytest.raises(SystemExit, match=escape(data_directory._DATA_LABEL_DUPLICATE_MSG + '2')):
+        data_dir.validate_trim(TreeData(2, 0, False, 'file', data_label))
+
+
+def test_sharded_get_blob_path(tmp_path):
+    data_dir = DataDirectory(tmp_path, sharded=True, content_addressed=True)
+    assert tmp_path / data_directory._BLOB_DIR_NAME / 'aa' / 'aa' / _DIGEST_A == data_dir.get_blob_path(_DIGEST_A)
+
+
+def test_get_fingerprint_changes_with_sharded_labels(tmp_path, monkeypatch):
+    fingerprint = DataDirectory(tmp_path).get_fingerprint()
+    sharded_fingerprint = DataDirectory(tmp_path, sharded=True).get_fingerprint()
+    assert fingerprint != sharded_fingerprint
+    # The shard Directories are never scanned
+    monkeypatch.setattr(data_directory, 'scandir', None)
+    assert sharded_fingerprint == (data_dir := DataDirectory(tmp_path)).get_fingerprint()
+    data_dir.make_shard_dirs([data_dir.validate_trim(TreeData(1, 0, False, 'file', data_label))])
+    assert sharded_fingerprint != DataDirectory(tmp_path).get_fingerprint()
+
+
+def test_sharded_flat_blobs_raise_exit(tmp_path):
+    _write_manifest(tmp_path, {data_label: _DIGEST_A})
+    (tmp_path / data_directory._BLOB_DIR_NAME).mkdir()
+    (tmp_path / data_directory._BLOB_DIR_NAME / _DIGEST_A).touch()
+    with pytest.raises(SystemExit, match=escape(data_directory._DATA_DIR_NOT_SHARDED_MSG)):
+        DataDirectory(tmp_path, sharded=True)
+    assert not (tmp_path / data_directory._SHARDED_FILE_NAME).exists()
+
+
+def test_has_blob_requires_blob_file(tmp_path):
+    _write_manifest(tmp_path, {data_label: _DIGEST_A})
+    assert not (data_dir := DataDirectory(tmp_path)).has_blob(_DIGEST_A)
+    data_dir.get_blob_path(_DIGEST_A).parent.mkdir()
+    data_dir.get_blob_path(_DIGEST_A).touch()
+    assert data_dir.has_blob(_DIGEST_A)
+
+
+def test_migrate_to_sharded_moves_labels_and_blobs(tmp_path):
+    # A DataLabel named like a shard Directory is moved aside before the shards are created
+    labels = [data_label, 'other_label', 'ab', '00']
+    for label in labels:
+        (tmp_path / label).write_text(label)
+    _write_manifest(tmp_path, {'blob_label': _DIGEST_A})
+    (tmp_path / data_directory._BLOB_DIR_NAME).mkdir()
+    (tmp_path / data_directory._BLOB_DIR_NAME / _DIGEST_A).write_text('blob')
+    (tmp_path / data_directory._INDEX_FILE_NAME).touch()
+    assert 5 == migrate_to_sharded(tmp_path)
+    data_dir = DataDirectory(tmp_path)
+    assert data_dir.is_sharded()
+    for label in labels:
+        assert label == _get_sharded_path(tmp_path, label).read_text()
+        assert _get_sharded_path(tmp_path, label) == data_dir.validate_build(TreeData(1, 0, False, 'file', label))
+    assert 'blob' == data_dir.validate_build(TreeData(2, 0, False, 'file', 'blob_label')).read_text()
+    assert not (tmp_path / data_directory._INDEX_FILE_NAME).exists()
+    assert not (tmp_path / data_directory._MIGRATION_DIR_NAME).exists()
+    # Running the migration again moves nothing
+    assert 0 == migrate_to_sharded(tmp_path)
+
+
+def test_migrate_to_sharded_resumes_interrupted_migration(tmp_path):
+    (pending_dir := tmp_path / data_directory._MIGRATION_DIR_NAME).mkdir()
+    (pending_dir / 'ab').write_text('ab')
+    (tmp_path / data_label).write_text(data_label)
+    assert 2 == migrate_to_sharded(tmp_path)
+    assert 'ab' == _get_sharded_path(tmp_path, 'ab').read_text()
+    assert data_label == _get_sharded_path(tmp_path, data_label).read_text()
+    assert not pending_dir.exists()
+
+
+def test_migrate_to_sharded_missing_dir_raises_exit(tmp_path):
+    with pytest.raises(SystemExit, match=escape(data_directory._DATA_DIR_PATH_DOES_NOT_EXIST_MSG)):
+        migrate_to_sharded(tmp_path / 'missing')
@@ -0,0 +1,129 @@
+"""Testing the Compact Instruction Plan.
+"""
+from pathlib import Path
+
+import pytest
+
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+
+
+_DATA_DIR = Path('.ftb/data')
+
+_INSTRUCTIONS = (
+    InstructionData(True, Path('module1/src/main')),
+    InstructionData(False, Path('module1/src/main/AndroidManifest.xml'), _DATA_DIR / 'manifest'),
+    InstructionData(False, Path('module1/src/main/build.gradle'), _DATA_DIR / 'gradle'),
+    InstructionData(True, Path('module1/src/test')),
+    InstructionData(False, Path('module1/src/test/build.gradle'), _DATA_DIR / 'gradle'),
+    InstructionData(False, Path('README.md')),
+    InstructionData(True, Path('module2')),
+)
+
+
+@pytest.fixture
+def plan() -> InstructionPlan:
+    return InstructionPlan.from_instructions(_INSTRUCTIONS)
+
+
+def test_instruction_plan_initial_condition_is_empty():
+    plan = InstructionPlan()
+    assert 0 == len(plan)
+    assert () == tuple(plan)
+
+
+def test_instruction_plan_iter_returns_instructions(plan):
+    assert tuple(plan) == _INSTRUCTIONS
+
+
+def test_instruction_plan_getitem_returns_instruction(plan):
+    assert plan[0] == _INSTRUCTIONS[0]
+    assert plan[2] == _INSTRUCTIONS[2]
+    assert plan[-1] == _INSTRUCTIONS[-1]
+
+
+def test_instruction_plan_fields_match_instructions(plan):
+    for index, i in enumerate(_INSTRUCTIONS):
+        assert plan.is_dir(index) == i.is_dir
+        assert plan.get_path(index) == i.path
+        assert plan.get_name(index) == i.path.name
+        assert plan.get_data_path(index) == i.data_path
+        assert plan.get_dir_parts(plan.get_parent(index)) == i.path.parent.parts
+
+
+def test_instruction_plan_directories_are_stored_once(plan):
+    # module1, src, main and test
+    assert 4 == len(plan._dir_parents)
+    assert plan.get_parent(1) == plan.get_parent(2)
+    # The gradle Data Path is shared
+    assert 3 == len(plan._data_paths)
+
+
+def test_instruction_plan_find_dir_id_does_not_add_directory(plan):
+    module1 = plan.find_dir_id(-1, 'module1')
+    assert plan.get_dir_id(-1, 'module1') == module1
+    assert plan.find_dir_id(module1, 'src') is not None
+    assert plan.find_dir_id(-1, 'module2') is None
+    assert plan.find_dir_id(-1, 'unknown') is None
+    assert 4 == plan.get_dir_count()
+
+
+def test_instruction_plan_iter_entries_returns_fields(plan):
+    assert tuple(plan.iter_entries()) == tuple(
+        (i.is_dir, i.path.parent.parts, i.path.name, i.data_path) for i in _INSTRUCTIONS
+    )
+
+
+def test_instruction_plan_equals_plan_with_same_instructions(plan):
+    assert plan == InstructionPlan.from_instructions(_INSTRUCTIONS)
+    assert plan != InstructionPlan.from_instructions(_INSTRUCTIONS[:-1])
+
+
+@pytest.mark.parametrize("indices", [(), (0, 1), (4, 5), (1, 4, 6), tuple(range(len(_INSTRUCTIONS)))])
+def test_instruction_plan_select_returns_chosen_instructions(plan, indices):
+    result = plan.select(indices)
+    assert tuple(result) == tuple(_INSTRUCTIONS[x] for x in indices)
+
+
+def test_instruction_plan_select_adds_required_directories(plan):
+    # module1, src and test
+    assert 3 == len(plan.select([4, 5])._dir_parents)
+
+
+def test_instruction_plan_to_bytes_round_trip(plan):
+    result = InstructionPlan.from_bytes(plan.to_bytes())
+    assert list(_INSTRUCTIONS) == list(result)
+    # The decoded Plan can be extended
+    result.append(InstructionData(False, Path('module1/src/test/Test.kt')))
+    assert Path('module1/src/test/Test.kt') == result[-1].path
+    assert len(plan._dir_parents) == len(result._dir_parents)
+
+
+def test_instruction_plan_to_bytes_empty_round_trip():
+    assert 0 == len(InstructionPlan.from_bytes(InstructionPlan().to_bytes()))
+
+
+@pytest.mark.parametrize(
+    "trim",
+    [1, 8, 33]
+)
+def test_instruction_plan_from_bytes_truncated_raises_value_error(plan, trim):
+    with pytest.raises(ValueError):
+        InstructionPlan.from_bytes(plan.to_bytes()[:-trim])
+
+
+def test_instruction_plan_from_bytes_extra_data_raises_value_error(plan):
+    with pytest.raises(ValueError):
+        InstructionPlan.from_bytes(plan.to_bytes() + b'\0')
+
+
+def test_instruction_plan_from_bytes_directory_cycle_raises_value_error(plan):
+    plan._dir_parents[0] = len(plan._dir_parents) - 1
+    with pytest.raises(ValueError):
+        InstructionPlan.from_bytes(plan.to_bytes())
+
+
+def test_instruction_plan_from_bytes_invalid_name_raises_value_error(plan):
+    plan._names[0] = len(plan._strings)
+    with pytest.raises(ValueError):
+        InstructionPlan.from_bytes(plan.to_bytes())
@@ -151,6 +151,37 @@ class TestPathStack(unittest.TestCase):
             2, self.instance.get_depth()
         )
 
+    def test_join_stack_returns_same_path_until_stack_changes(self):
+        self.instance.push("src")
+        path = self.instance.join_stack()
+        self.assertIs(
+            path, self.instance.join_stack()
+        )
+        self.instance.push("main")
+        self.assertIsNot(
+            path, self.instance.join_stack()
+        )
+        self.instance.pop()
+        self.assertIs(
+            path, self.instance.join_stack()
+        )
+
+    def test_join_stack_after_reduce_depth_returns_valid_path(self):
+        for dir_name in ("src", "main", "java", "com"):
+            self.instance.push(dir_name)
+        self.instance.reduce_depth(1)
+        self.assertEqual(
+            Path("./src/"), self.instance.join_stack()
+        )
+        self.instance.push("test")
+        self.assertEqual(
+            Path("./src/test/"), self.instance.join_stack()
+        )
+        self.instance.reduce_depth(0)
+        self.assertEqual(
+            Path("./"), self.instance.join_stack()
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
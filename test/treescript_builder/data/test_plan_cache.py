@@ -0,0 +1,80 @@
+"""Testing the Instruction Plan Cache.
+"""
+from pathlib import Path
+
+import pytest
+
+from treescript_builder.data.data_directory import DataDirectory
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.data.plan_cache import get_plan_key, load_plan, save_plan
+
+
+_TREE_INPUT = 'src/\n  main.py\n'
+
+
+@pytest.fixture
+def plan() -> InstructionPlan:
+    return InstructionPlan.from_instructions((
+        InstructionData(True, Path('src')),
+        InstructionData(False, Path('src/main.py'), Path('data/main')),
+    ))
+
+
+def test_get_plan_key_lines_returns_none():
+    assert get_plan_key(iter(_TREE_INPUT.splitlines()), False, None) is None
+
+
+def test_get_plan_key_str_and_bytes_are_equal():
+    assert get_plan_key(_TREE_INPUT, False, None) == get_plan_key(_TREE_INPUT.encode(), False, None)
+
+
+def test_get_plan_key_depends_on_mode_and_input():
+    key = get_plan_key(_TREE_INPUT, False, None)
+    assert key != get_plan_key(_TREE_INPUT, True, None)
+    assert key != get_plan_key(_TREE_INPUT + '  test.py\n', False, None)
+
+
+def test_get_plan_key_depends_on_data_dir(tmp_path):
+    key = get_plan_key(_TREE_INPUT, False, None)
+    data_key = get_plan_key(_TREE_INPUT, False, DataDirectory(tmp_path))
+    assert key != data_key
+    (tmp_path / 'main').touch()
+    assert data_key != get_plan_key(_TREE_INPUT, False, DataDirectory(tmp_path))
+
+
+def test_save_plan_load_plan_returns_plan(tmp_path, plan):
+    key = get_plan_key(_TREE_INPUT, False, None)
+    save_plan(cache_path := tmp_path / 'plan.cache', key, plan)
+    assert list(plan) == list(load_plan(cache_path, key))
+    assert not (tmp_path / 'plan.cache.tmp').exists()
+
+
+def test_save_plan_load_plan_surrogate_data_path_returns_plan(tmp_path):
+    plan = InstructionPlan.from_instructions((
+        InstructionData(False, Path('main\udcff.py'), Path('data/\udcff')),
+    ))
+    key = get_plan_key(_TREE_INPUT, False, None)
+    save_plan(cache_path := tmp_path / 'plan.cache', key, plan)
+    assert list(plan) == list(load_plan(cache_path, key))
+
+
+def test_load_plan_different_key_returns_none(tmp_path, plan):
+    save_plan(cache_path := tmp_path / 'plan.cache', get_plan_key(_TREE_INPUT, False, None), plan)
+    assert load_plan(cache_path, get_plan_key(_TREE_INPUT, True, None)) is None
+
+
+def test_load_plan_missing_file_returns_none(tmp_path):
+    assert load_plan(tmp_path / 'plan.cache', get_plan_key(_TREE_INPUT, False, None)) is None
+
+
+def test_load_plan_truncated_file_returns_none(tmp_path, plan):
+    key = get_plan_key(_TREE_INPUT, False, None)
+    save_plan(cache_path := tmp_path / 'plan.cache', key, plan)
+    cache_path.write_bytes(cache_path.read_bytes()[:-4])
+    assert load_plan(cache_path, key) is None
+
+
+def test_save_plan_unwritable_path_is_ignored(tmp_path, plan):
+    save_plan(tmp_path / 'missing' / 'plan.cache', get_plan_key(_TREE_INPUT, False, None), plan)
+    assert not (tmp_path / 'missing').exists()
@@ -0,0 +1,98 @@
+"""Testing the Compact Tree Node Store.
+"""
+import pytest
+
+from test.treescript_builder.tree.conftest import generate_complex_tree
+from treescript_builder.data.tree_data import TreeData
+from treescript_builder.data.tree_store import TreeStore
+
+
+@pytest.fixture
+def complex_store() -> TreeStore:
+    store = TreeStore()
+    for node in generate_complex_tree():
+        store.append_node(node)
+    return store
+
+
+def test_tree_store_initial_condition_is_empty():
+    store = TreeStore()
+    assert 0 == len(store)
+    assert [] == list(store)
+
+
+def test_tree_store_iter_returns_appended_nodes(complex_store):
+    assert list(complex_store) == list(generate_complex_tree())
+
+
+def test_tree_store_getitem_returns_node(complex_store):
+    nodes = list(generate_complex_tree())
+    assert complex_store[0] == nodes[0]
+    assert complex_store[-1] == nodes[-1]
+    assert complex_store[len(nodes) // 2] == nodes[len(nodes) // 2]
+
+
+def test_tree_store_columns_match_nodes(complex_store):
+    nodes = list(generate_complex_tree())
+    assert list(complex_store.depths) == [n.depth for n in nodes]
+    assert list(complex_store.line_numbers) == [n.line_number for n in nodes]
+    for index, node in enumerate(nodes):
+        assert complex_store.is_dir(index) == node.is_dir
+        assert complex_store.get_name(index) == node.name
+        assert complex_store.get_data_label(index) == node.data_label
+
+
+def test_tree_store_dir_bits_past_byte_boundary():
+    store = TreeStore()
+    for n in range(20):
+        store.append(n + 1, 0, n % 3 == 0, f'node{n}')
+    assert [store.is_dir(n) for n in range(20)] == [n % 3 == 0 for n in range(20)]
+
+
+def test_tree_store_repeated_names_are_stored_once():
+    store = TreeStore()
+    for n in range(100):
+        store.append(n + 1, 0, False, 'README.md', 'readme')
+    # The empty string, the name and the DataLabel
+    assert 3 == len(store._strings)
+    assert store[99] == TreeData(100, 0, False, 'README.md', 'readme')
+
+
+def test_tree_store_depth_out_of_range_raises_overflow_error():
+    with pytest.raises(OverflowError):
+        TreeStore().append(1, 1 << 16, False, 'file')
+
+
+def test_tree_store_append_ids_returns_node():
+    store = TreeStore()
+    name_id = store.get_string_id('data.txt')
+    assert name_id == store.get_string_id('data.txt')
+    store.append_ids(3, 1, False, name_id, store.get_string_id('Label'))
+    store.append_ids(4, 1, False, name_id, 0)
+    assert [TreeData(3, 1, False, 'data.txt', 'Label'), TreeData(4, 1, False, 'data.txt')] == list(store)
+
+
+@pytest.mark.parametrize(
+    "first_count,second_count",
+    [
+        (0, 5),
+        (8, 9),
+        (3, 0),
+        (3, 4),
+        (5, 21),
+        (13, 3),
+    ]
+)
+def test_tree_store_extend_returns_nodes(first_count, second_count):
+    nodes = [
+        TreeData(n + 1, n % 3, n % 2 == 0 or n % 7 == 0, f'name_{n % 5}', f'label_{n % 4}')
+        for n in range(first_count + second_count)
+    ]
+    first, second = TreeStore(), TreeStore()
+    for node in nodes[:first_count]:
+        first.append_node(node)
+    for node in nodes[first_count:]:
+        second.append_node(node)
+    first.extend(second)
+    assert nodes == list(first)
+    assert (len(nodes) + 7) // 8 == len(first._dir_bits)
@@ -6,6 +6,12 @@ NUMERICAL_CHARS = [chr(i) for i in range(48,57 + 1)]      # 10
 UPPER_CASE_LETTERS = [chr(i) for i in range(65,90 + 1)]   # 26
 LOWER_CASE_LETTERS = [chr(i) for i in range(97,122 + 1)]  # 26
 
+# Every line boundary of str.splitlines
+LINE_BREAK_TREESCRIPT = (
+    'src/\r  a.txt\x0b  b.txt\x0c  c.txt\x1c  d.txt\x1d  e.txt\x1e  f.txt\x85'
+    '  g.txt\u2028  h.txt\u2029  i.txt\r\n  j.txt\n  k.txt\r\r\n  l.txt\r'
+)
+
 
 def generate_basenames():
     """ A Generator of simple File basenames, built from simple character sets.
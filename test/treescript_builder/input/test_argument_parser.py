@@ -2,7 +2,7 @@
 """
 import pytest
 
-from treescript_builder.input import parse_arguments
+from treescript_builder.input import parse_arguments, parse_migrate_arguments
 from treescript_builder.input.argument_data import ArgumentData
 
 
@@ -15,6 +15,28 @@ from treescript_builder.input.argument_data import ArgumentData
         (["--data"]),
         (["-f"]),
         (["tree_file", "--data_dir="]),
+        (["tree_file", "--size-limit=-1"]),
+        (["tree_file", "--size-limit=kb"]),
+        (["--data_dir=data"]),
+        (["tree_file", "--stdin"]),
+        (["tree_file", "--jobs=0"]),
+        (["tree_file", "-j"]),
+        (["tree_file", "--copy-mode=teleport"]),
+        (["tree_file", "--dir-fd", "--jobs=2"]),
+        (["tree_file", "--parse-jobs=0"]),
+        (["tree_file", "--parse-jobs=2", "--pipeline"]),
+        (["--stdin", "--parse-jobs=2"]),
+        (["-", "--parse-jobs=2"]),
+        (["tree_file", "--plan-cache=plan.cache", "--pipeline"]),
+        (["tree_file", "--plan-cache= "]),
+        (["tree_file", "--incremental=size"]),
+        (["tree_file", "--data_dir=data", "--incremental", "--trim"]),
+        (["tree_file", "--incremental", "--pipeline"]),
+        (["tree_file", "--data_dir=data", "--reconcile", "--trim"]),
+        (["tree_file", "--reconcile", "--pipeline"]),
+        (["tree_file", "--dedup"]),
+        (["tree_file", "--data_dir=data", "--dedup", "--pipeline"]),
+        (["tree_file", "--shard"]),
     ]
 )
 def test_parse_arguments_raises_value_error(test_input):
@@ -33,7 +55,47 @@ def test_parse_arguments_raises_value_error(test_input):
         (["tree_file", "-r"], ArgumentData("tree_file", None, True)),
         (["tree_file", "--reverse"], ArgumentData("tree_file", None, True)),
         (["tree_file", "--trim"], ArgumentData("tree_file", None, True)),
+        (["tree_file", "--data_dir=data", "--index"], ArgumentData("tree_file", "data", False, True, False)),
+        (["tree_file", "--data_dir=data", "--rebuild-index"], ArgumentData("tree_file", "data", False, False, True)),
+        (["-"], ArgumentData("-", None, False)),
+        (["--stdin"], ArgumentData("-", None, False)),
+        (["-", "--stdin", "-r"], ArgumentData("-", None, True)),
+        (["tree_file", "--stream"], ArgumentData("tree_file", None, False, is_streaming=True)),
+        (["tree_file", "--stream", "--size-limit=1024"], ArgumentData("tree_file", None, False, is_streaming=True, size_limit_kb=1024)),
+        (["tree_file", "--size-limit", "0"], ArgumentData("tree_file", None, False, size_limit_kb=0)),
+        (["tree_file", "--pipeline"], ArgumentData("tree_file", None, False, is_pipelined=True)),
+        (["tree_file", "-j", "8"], ArgumentData("tree_file", None, False, jobs=8)),
+        (["tree_file", "--jobs=2"], ArgumentData("tree_file", None, False, jobs=2)),
+        (["tree_file", "--copy-mode=auto"], ArgumentData("tree_file", None, False, copy_mode='auto')),
+        (["tree_file", "--copy-mode", "hardlink"], ArgumentData("tree_file", None, False, copy_mode='hardlink')),
+        (["tree_file", "--dir-fd"], ArgumentData("tree_file", None, False, use_dir_fd=True)),
+        (["tree_file", "--fast-reader"], ArgumentData("tree_file", None, False, use_fast_reader=True)),
+        (["tree_file", "--parse-jobs=4"], ArgumentData("tree_file", None, False, parse_jobs=4)),
+        (["tree_file", "--plan-cache", "plan.cache"], ArgumentData("tree_file", None, False, plan_cache_path_str='plan.cache')),
+        (["tree_file", "--incremental"], ArgumentData("tree_file", None, False, incremental='mtime')),
+        (["tree_file", "--incremental=hash"], ArgumentData("tree_file", None, False, incremental='hash')),
+        (["tree_file", "--reconcile"], ArgumentData("tree_file", None, False, is_reconciled=True)),
+        (["tree_file", "--data_dir=data", "--trim", "--dedup"], ArgumentData("tree_file", "data", True, is_content_addressed=True)),
+        (["tree_file", "--data_dir=data", "--trim", "--shard"], ArgumentData("tree_file", "data", True, is_sharded=True)),
+        (["tree_file", "--data_dir=data", "--shard", "--pipeline"], ArgumentData("tree_file", "data", False, is_pipelined=True, is_sharded=True)),
     ]
 )
 def test_parse_arguments_returns_data(test_input, expect):
-    assert parse_arguments(test_input) == expect
\ No newline at end of file
+    assert parse_arguments(test_input) == expect
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        ([]),
+        ([" "]),
+        (["data", "other"]),
+        (["--shard"]),
+    ]
+)
+def test_parse_migrate_arguments_raises_exit(test_input):
+    with pytest.raises(SystemExit):
+        parse_migrate_arguments(test_input)
+
+
+def test_parse_migrate_arguments_returns_data_dir():
+    assert 'data' == parse_migrate_arguments(['data'])
@@ -0,0 +1,201 @@
+"""Testing Bytes Line Reader Methods.
+"""
+from mmap import ACCESS_READ, mmap
+
+import pytest
+
+from test.treescript_builder.input.conftest import LINE_BREAK_TREESCRIPT
+from test.treescript_builder.tree.conftest import sample_treescript_1, sample_treedata_1, sample_treedata_2, \
+    sample_treescript_2, sample_treescript_2_crlf
+from treescript_builder.input import bytes_line_reader
+from treescript_builder.input.bytes_line_reader import _parse_line_bytes, _split_chunks, _split_parts, \
+    read_input_store_bytes, read_input_store_parallel, read_input_tree_bytes
+from treescript_builder.input.line_reader import read_input_store, read_input_tree
+
+
+_MIXED_TREESCRIPT = (
+    "# A Comment\n"
+    "src/ # The Source Directory\n"
+    "  main.py Main_Data\n"
+    "  pkg/\n"
+    "    __init__.py # Empty\n"
+    "    module.py module-data.txt extra\n"
+    "\n"
+    "   \n"
+    "  \\docs\n"
+    "    README.md\n"
+    "tests\\\n"
+    "  test_main.py\n"
+)
+
+
+@pytest.mark.parametrize(
+    "test_input,expect",
+    [
+        (sample_treescript_1(), sample_treedata_1()),
+        (sample_treescript_2(), sample_treedata_2()),
+        (sample_treescript_2_crlf(), sample_treedata_2()),
+    ]
+)
+def test_read_input_tree_bytes_sample_returns_data(test_input, expect):
+    assert list(read_input_tree_bytes(test_input.encode())) == expect
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        _MIXED_TREESCRIPT,
+        _MIXED_TREESCRIPT.replace('\n', '\r\n'),
+        _MIXED_TREESCRIPT.rstrip('\n'),
+        # Names that are decoded with the whole line
+        "src/\n  données.txt\n  数据/\n    ファイル.txt Data\n",
+        # Leading tabs are read by the Default Input Reader
+        "src/\n\t\tdata.txt\n",
+        # DataLabels are validated after the Input is read
+        "src/\n  data.txt ..\n",
+    ]
+)
+def test_read_input_tree_bytes_matches_read_input_tree(test_input):
+    assert list(read_input_tree_bytes(test_input.encode())) == list(read_input_tree(test_input))
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        LINE_BREAK_TREESCRIPT,
+        _MIXED_TREESCRIPT.replace('\n', '\r'),
+        _MIXED_TREESCRIPT.replace('\n', '\u2028'),
+        _MIXED_TREESCRIPT + 'src/\x0c  data.txt Data\n',
+    ]
+)
+def test_read_input_tree_bytes_other_line_breaks_match_read_input_tree(test_input):
+    assert list(read_input_tree_bytes(test_input.encode())) == list(read_input_tree(test_input))
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        bytearray(_MIXED_TREESCRIPT.encode()),
+        memoryview(_MIXED_TREESCRIPT.encode()),
+    ]
+)
+def test_read_input_tree_bytes_buffer_types_returns_data(test_input):
+    assert list(read_input_tree_bytes(test_input)) == list(read_input_tree(_MIXED_TREESCRIPT))
+
+
+def test_read_input_tree_dispatches_bytes():
+    assert list(read_input_tree(_MIXED_TREESCRIPT.encode())) == list(read_input_tree(_MIXED_TREESCRIPT))
+
+
+def test_read_input_tree_bytes_mmap_returns_data(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_bytes(_MIXED_TREESCRIPT.encode())
+    with input_file.open('rb') as f, mmap(f.fileno(), 0, access=ACCESS_READ) as data:
+        assert list(read_input_tree_bytes(data)) == list(read_input_tree(_MIXED_TREESCRIPT))
+
+
+def test_read_input_tree_bytes_small_chunks_returns_data(monkeypatch):
+    monkeypatch.setattr(bytes_line_reader, '_CHUNK_SIZE', 7)
+    test_input = _MIXED_TREESCRIPT + 'a_very_long_file_name_that_exceeds_the_chunk.txt\n'
+    assert list(read_input_tree_bytes(test_input.encode())) == list(read_input_tree(test_input))
+
+
+@pytest.mark.parametrize("chunk_size", [3, 7, 16])
+def test_read_input_tree_bytes_small_chunks_other_line_breaks_returns_data(monkeypatch, chunk_size):
+    monkeypatch.setattr(bytes_line_reader, '_CHUNK_SIZE', chunk_size)
+    assert list(read_input_tree_bytes(LINE_BREAK_TREESCRIPT.encode())) == list(read_input_tree(LINE_BREAK_TREESCRIPT))
+
+
+def test_read_input_tree_bytes_repeated_lines_returns_line_numbers():
+    test_input = 'src/\n  data.txt\n' * 3
+    assert [1, 2, 3, 4, 5, 6] == [node.line_number for node in read_input_tree_bytes(test_input.encode())]
+
+
+@pytest.mark.parametrize(
+    "test_input,line_number",
+    [
+        (b"src/\n   data.txt\n", 2),
+        (b"src/\n  data.txt\n dir/\n", 3),
+        (b"src/\n  da\xfft.txt\n", 2),
+        (b"src/\n  \xff\n", 2),
+        (b"src/\n  ../\n", 2),
+    ]
+)
+def test_read_input_tree_bytes_invalid_line_raises_exit(test_input, line_number):
+    with pytest.raises(SystemExit, match=f'Line: {line_number}$'):
+        list(read_input_tree_bytes(test_input))
+
+
+def test_read_input_store_bytes_matches_read_input_store():
+    assert list(read_input_store_bytes(_MIXED_TREESCRIPT.encode())) == list(read_input_store(_MIXED_TREESCRIPT))
+
+
+def test_read_input_store_dispatches_bytes():
+    store = read_input_store(sample_treescript_2().encode())
+    assert list(store) == sample_treedata_2()
+
+
+@pytest.mark.parametrize(
+    "test_input,expect",
+    [
+        (b"", None),
+        (b"  ", None),
+        (b"  # Comment", None),
+        (b"\r", None),
+        (b"src/\r", (0, True, 'src', '')),
+        (b"  data.txt  ", (1, False, 'data.txt', '')),
+        (b"  data.txt Label # Comment", (1, False, 'data.txt', 'Label')),
+        (b"data.txt #Label", (0, False, 'data.txt', '')),
+    ]
+)
+def test_parse_line_bytes_returns_properties(test_input, expect):
+    assert _parse_line_bytes(1, test_input) == expect
+
+
+def test_split_chunks_long_line_returns_lines(monkeypatch):
+    monkeypatch.setattr(bytes_line_reader, '_CHUNK_SIZE', 4)
+    assert [[b'a'], [b'long_line'], [b'b', b'']] == list(_split_chunks(b'a\nlong_line\nb\n'))
+
+
+@pytest.mark.parametrize(
+    "test_input,count,expect",
+    [
+        (b"a\nb\nc\nd\n", 1, [(b"a\nb\nc\nd\n", 1)]),
+        (b"a\nb\nc\nd\n", 2, [(b"a\nb\nc", 1), (b"d\n", 4)]),
+        (b"a\n\nc\nd", 3, [(b"a\n", 1), (b"c", 3), (b"d", 4)]),
+        (b"long_line\nb\n", 4, [(b"long_line", 1), (b"b\n", 2)]),
+    ]
+)
+def test_split_parts_returns_line_numbers(monkeypatch, test_input, count, expect):
+    monkeypatch.setattr(bytes_line_reader, '_PARALLEL_PART_SIZE', 1)
+    assert expect == _split_parts(test_input, count)
+
+
+def test_split_parts_small_input_returns_single_part():
+    assert [(b"src/\n", 1)] == _split_parts(b"src/\n", 8)
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 3])
+def test_read_input_store_parallel_matches_read_input_store(monkeypatch, jobs):
+    monkeypatch.setattr(bytes_line_reader, '_PARALLEL_PART_SIZE', 16)
+    test_input = _MIXED_TREESCRIPT * 4
+    assert list(read_input_store_parallel(test_input.encode(), jobs)) == list(read_input_store(test_input))
+
+
+@pytest.mark.parametrize("jobs", [2, 3])
+def test_read_input_store_parallel_other_line_breaks_matches_read_input_store(monkeypatch, jobs):
+    monkeypatch.setattr(bytes_line_reader, '_PARALLEL_PART_SIZE', 16)
+    test_input = LINE_BREAK_TREESCRIPT * 3
+    assert list(read_input_store_parallel(test_input.encode(), jobs)) == list(read_input_store(test_input))
+
+
+def test_read_input_store_dispatches_parallel(monkeypatch):
+    monkeypatch.setattr(bytes_line_reader, '_PARALLEL_PART_SIZE', 16)
+    store = read_input_store(sample_treescript_2().encode(), jobs=2)
+    assert list(store) == sample_treedata_2()
+
+
+def test_read_input_store_parallel_invalid_line_raises_exit(monkeypatch):
+    monkeypatch.setattr(bytes_line_reader, '_PARALLEL_PART_SIZE', 16)
+    test_input = b"src/\n  data.txt\n" * 4 + b"  dat\xff.txt\n" + b"src/\n" * 4 + b"   odd.txt\n"
+    with pytest.raises(SystemExit, match='Invalid Name in Line: 9$'):
+        read_input_store_parallel(test_input, 3)
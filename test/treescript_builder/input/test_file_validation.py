@@ -1,13 +1,17 @@
 """ Testing File Validation Methods.
 """
+import io
+import sys
 from itertools import repeat
 from pathlib import Path
 
 import pytest
 
 from test.treescript_builder.conftest import raise_exception
-from test.treescript_builder.input.conftest import generate_filenames, MockPathStat
-from treescript_builder.input import validate_input_file, validate_directory, file_validation
+from test.treescript_builder.input.conftest import generate_filenames, LINE_BREAK_TREESCRIPT, MockPathStat
+from treescript_builder.input import validate_input_file, validate_directory, file_validation, stream_input_file, \
+    map_input_file, is_large_input_file
+from treescript_builder.input.line_reader import read_input_tree
 
 
 @pytest.mark.parametrize(
@@ -140,3 +144,110 @@ def test_validate_directory_exists_returns_data_dir():
         c.setattr(Path, 'exists', lambda _: True)
         c.setattr(Path, 'is_dir', lambda _: True)
         assert Path('dir1') == validate_directory("dir1")
+
+
+def test_validate_input_file_size_limit_disabled_returns_data():
+    expected_data = 'abcdefg\n' * file_validation._FILE_SIZE_LIMIT
+    with pytest.MonkeyPatch().context() as c:
+        c.setattr(Path, 'exists', lambda _: True)
+        c.setattr(Path, 'read_text', lambda _: expected_data)
+        c.setattr(Path, 'lstat', lambda _: MockPathStat(len(expected_data)))
+        assert expected_data == validate_input_file('any', None)
+
+
+def test_validate_input_file_custom_size_limit_raises_exit():
+    with pytest.MonkeyPatch().context() as c:
+        c.setattr(Path, 'exists', lambda _: True)
+        c.setattr(Path, 'lstat', lambda _: MockPathStat(4 * 1024 + 1))
+        with pytest.raises(SystemExit, match='File larger than 4 KB Limit.'):
+            validate_input_file('any', 4 * 1024)
+
+
+def test_stream_input_file_returns_lines(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text('src/\n  data.txt\n' * 4096)
+    generator = stream_input_file(str(input_file))
+    assert next(generator) == 'src/'
+    assert next(generator) == '  data.txt'
+    assert 8190 == len(list(generator))
+
+
+def test_stream_input_file_size_limit_raises_exit(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text('src/\n  data.txt\n' * 4096)
+    with pytest.raises(SystemExit, match='File larger than 32 KB Limit.'):
+        stream_input_file(str(input_file), file_validation._FILE_SIZE_LIMIT)
+
+
+def test_stream_input_file_empty_raises_exit(tmp_path):
+    (input_file := tmp_path / 'input.tree').touch()
+    with pytest.raises(SystemExit, match=file_validation._FILE_VALIDATION_ERROR_MSG):
+        stream_input_file(str(input_file))
+
+
+def test_stream_input_file_does_not_exist_raises_exit(tmp_path):
+    with pytest.raises(SystemExit, match=file_validation._FILE_DOES_NOT_EXIST_MSG):
+        stream_input_file(str(tmp_path / 'input.tree'))
+
+
+def test_stream_input_file_stdin_returns_lines(monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('src/\n  data.txt\n'))
+    assert ['src/', '  data.txt'] == list(stream_input_file(file_validation.STDIN_FILE_NAME))
+
+
+def test_stream_input_file_other_line_breaks_match_read_input_tree(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text(LINE_BREAK_TREESCRIPT, newline='')
+    assert list(read_input_tree(LINE_BREAK_TREESCRIPT)) == list(read_input_tree(stream_input_file(str(input_file))))
+
+
+def test_stream_input_file_stdin_other_line_breaks_match_read_input_tree(monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(LINE_BREAK_TREESCRIPT, newline=None))
+    assert list(read_input_tree(LINE_BREAK_TREESCRIPT)) == list(read_input_tree(stream_input_file(file_validation.STDIN_FILE_NAME)))
+
+
+def test_map_input_file_returns_bytes(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text('src/\n  data.txt\n')
+    with map_input_file(str(input_file)) as data:
+        assert b'src/\n  data.txt\n' == data[:]
+
+
+def test_map_input_file_size_limit_raises_exit(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text('src/\n  data.txt\n' * 4096)
+    with pytest.raises(SystemExit, match='File larger than 32 KB Limit.'):
+        map_input_file(str(input_file))
+
+
+def test_map_input_file_size_limit_disabled_returns_bytes(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text('src/\n  data.txt\n' * 4096)
+    with map_input_file(str(input_file), None) as data:
+        assert 16 * 4096 == len(data)
+
+
+def test_map_input_file_empty_raises_exit(tmp_path):
+    (input_file := tmp_path / 'input.tree').touch()
+    with pytest.raises(SystemExit, match=file_validation._FILE_VALIDATION_ERROR_MSG):
+        map_input_file(str(input_file))
+
+
+@pytest.mark.parametrize("size", [1, 3 * 1024 * 1024])
+def test_map_input_file_blank_raises_exit(tmp_path, size):
+    (input_file := tmp_path / 'input.tree').write_text(' \n' * size)
+    with pytest.raises(SystemExit, match=file_validation._FILE_VALIDATION_ERROR_MSG):
+        map_input_file(str(input_file), None)
+
+
+def test_map_input_file_late_character_returns_bytes(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text(' ' * (file_validation._STREAM_BUFFER_SIZE - 1) + '\u2028src/\n')
+    with map_input_file(str(input_file), None) as data:
+        assert data[-5:] == b'src/\n'
+
+
+def test_map_input_file_does_not_exist_raises_exit(tmp_path):
+    with pytest.raises(SystemExit, match=file_validation._FILE_DOES_NOT_EXIST_MSG):
+        map_input_file(str(tmp_path / 'input.tree'))
+
+
+def test_is_large_input_file_returns_bool(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text('src/\n')
+    assert not is_large_input_file(str(input_file))
+    assert not is_large_input_file(str(tmp_path / 'missing.tree'))
+    input_file.write_bytes(b'src/\n' * (file_validation._FAST_READER_SIZE // 5 + 1))
+    assert is_large_input_file(str(input_file))
@@ -1,12 +1,15 @@
 """Testing Line Reader Methods.
 """
+import io
+
 import pytest
 
 from test.treescript_builder.conftest import create_depth
 from test.treescript_builder.tree.conftest import sample_treescript_1, sample_treedata_1, sample_treedata_2, \
     sample_treescript_2, sample_treescript_2_crlf
 from treescript_builder.data.tree_data import TreeData
-from treescript_builder.input.line_reader import _calculate_depth, _process_line, _validate_node_name, read_input_tree
+from treescript_builder.input.line_reader import _calculate_depth, _parse_node_name, _process_line, \
+    _validate_node_name, read_input_tree, read_input_store
 
 # Directory Variants: A tuple of all possible ways that a directory may be represented.
 dir_variants = ('/dir', 'dir/', '\\dir', 'dir\\')
@@ -344,4 +347,56 @@ def test_read_input_tree_sample_treescript_2_returns_tree_data():
 def test_read_input_tree_sample_treescript_2_crlf_returns_tree_data():
     test_input = sample_treescript_2_crlf()
     result = list(read_input_tree(test_input))
-    assert result == sample_treedata_2()
\ No newline at end of file
+    assert result == sample_treedata_2()
+
+def test_read_input_tree_lines_iterable_returns_tree_data():
+    test_input = iter(io.StringIO(sample_treescript_2()))
+    result = list(read_input_tree(test_input))
+    assert result == sample_treedata_2()
+
+
+def test_read_input_tree_lines_iterable_is_consumed_lazily():
+    lines = iter(sample_treescript_2().splitlines(keepends=True))
+    generator = read_input_tree(lines)
+    assert next(generator) == TreeData(1, 0, True, "build")
+    # Only the first line has been read from the Iterable
+    assert next(lines) == "  empty.txt\n"
+
+
+def test_read_input_store_returns_tree_data():
+    assert list(read_input_store(sample_treescript_2())) == sample_treedata_2()
+
+
+def test_read_input_store_lines_iterable_returns_tree_data():
+    assert list(read_input_store(io.StringIO(sample_treescript_1()))) == sample_treedata_1()
+
+
+def test_read_input_store_invalid_line_raises_exit():
+    with pytest.raises(SystemExit, match='Invalid Indentation'):
+        read_input_store('src/\n   file.txt\n')
+
+
+def test_read_input_store_depth_out_of_range_raises_exit():
+    with pytest.raises(SystemExit, match='Invalid Indentation'):
+        read_input_store(' ' * (2 << 16) + 'file.txt\n')
+
+
+def test_read_input_tree_repeated_names_share_one_string():
+    nodes = list(read_input_tree(''.join(f'pkg{n}/\n  __init__.py\n  tests/\n' for n in range(10))))
+    init_names = [node.name for node in nodes if node.name == '__init__.py']
+    dir_names = [node.name for node in nodes if node.name == 'tests']
+    assert all(name is init_names[0] for name in init_names)
+    assert all(name is dir_names[0] for name in dir_names)
+
+
+def test_validate_node_name_repeated_name_uses_cache():
+    _parse_node_name.cache_clear()
+    for line_number in range(1, 11):
+        assert _validate_node_name(line_number, 'src/') == (True, 'src')
+    assert 9 == _parse_node_name.cache_info().hits
+
+
+def test_validate_node_name_repeated_invalid_name_raises_exit_with_line_number():
+    for line_number in (3, 7):
+        with pytest.raises(SystemExit, match=f'Invalid Name in Line: {line_number}$'):
+            _validate_node_name(line_number, 'src/main/')
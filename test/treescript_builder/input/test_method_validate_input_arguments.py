@@ -1,5 +1,6 @@
 """ Testing Input Package Method: validate_input_arguments.
 """
+from mmap import mmap
 from pathlib import Path
 
 import pytest
@@ -45,3 +46,28 @@ def test_validate_input_arguments_unknown_argument_raises_error():
         c.setattr(Path, 'lstat', lambda _: MockPathStat(file_validation._FILE_SIZE_LIMIT))
         with pytest.raises(SystemExit):
             validate_input_arguments(['tree_input', 'random-arg'])
+
+
+def test_validate_input_arguments_fast_reader_returns_mmap(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text('src/\n  data.txt\n')
+    result = validate_input_arguments([str(input_file), '--fast-reader'])
+    assert b'src/\n  data.txt\n' == result.tree_input[:]
+
+
+def test_validate_input_arguments_large_stream_returns_mmap(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_bytes(b'src/\n' * (file_validation._FAST_READER_SIZE // 5 + 1))
+    result = validate_input_arguments([str(input_file), '--stream'])
+    assert isinstance(result.tree_input, mmap)
+
+
+def test_validate_input_arguments_fast_reader_size_limit_raises_exit(tmp_path):
+    (input_file := tmp_path / 'input.tree').write_text('src/\n  data.txt\n' * 4096)
+    with pytest.raises(SystemExit, match='File larger than 32 KB Limit.'):
+        validate_input_arguments([str(input_file), '--fast-reader'])
+
+
+@pytest.mark.parametrize("argument", ['--fast-reader', '--parse-jobs=2'])
+def test_validate_input_arguments_mapped_blank_input_raises_exit(tmp_path, argument):
+    (input_file := tmp_path / 'input.tree').write_text(' \n\t\n')
+    with pytest.raises(SystemExit, match=file_validation._FILE_VALIDATION_ERROR_MSG):
+        validate_input_arguments([str(input_file), argument])
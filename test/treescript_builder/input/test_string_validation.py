@@ -96,6 +96,37 @@ def test_validate_data_label_name_shortcut_returns_true():
     assert validate_data_label('!')
 
 
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        '._', '.-', '_.', '_-', '-.', '-_', '--', '__',
+    ]
+)
+def test_validate_data_label_small_punctuation_returns_false(test_input):
+    assert not validate_data_label(test_input)
+
+
+@pytest.mark.parametrize(
+    "test_input,expect",
+    [
+        ('a' * 99, True),
+        ('a' * 100, False),
+        ('._a', True),
+        ('label\n', False),
+        ('\u00e9', False),
+    ]
+)
+def test_validate_data_label_length_and_charset(test_input, expect):
+    assert validate_data_label(test_input) == expect
+
+
+def test_validate_data_label_repeated_label_uses_cache():
+    validate_data_label.cache_clear()
+    for _ in range(100):
+        assert validate_data_label('repeated_label')
+    assert 99 == validate_data_label.cache_info().hits
+
+
 def test_validate_dir_name_returns_str():
     assert validate_dir_name('dir/') == 'dir'
 
@@ -2,16 +2,21 @@
  Author: DK96-OS 2024 - 2025
 """
 import builtins
+import io
 import os
 import sys
 from itertools import chain
+from pathlib import Path
 from typing import Callable
 
 import pytest
 
 from test.conftest import TEST_INPUT_FILE, TEST_DATA_DIR, get_basic_tree_script, get_nested_tree_script, \
     get_empty_dirs_tree_script
-from treescript_builder.__main__ import main
+from treescript_builder.__main__ import main, migrate
+from treescript_builder import tree
+from treescript_builder.tree import tree_builder
+from treescript_builder.input import bytes_line_reader
 
 
 class PrintCollector:
@@ -232,3 +237,372 @@ def test_main_reverse_option_basic_tree(monkeypatch, mock_basic_tree):
     main()
     collector.assert_expected('')
     assert 1 == len(list(mock_basic_tree.rglob('*')))
+
+
+def test_main_data_index_basic_tree_writes_sidecar(monkeypatch, mock_basic_tree):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data', TEST_DATA_DIR, '--index']
+    os.chdir(mock_basic_tree)
+    (mock_basic_tree / TEST_DATA_DIR).mkdir()
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert (mock_basic_tree / TEST_DATA_DIR / '.ftb_index').exists()
+
+
+def test_main_stream_large_tree(monkeypatch, tmp_path):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--stream']
+    os.chdir(tmp_path)
+    # A TreeScript larger than the default size limit
+    (tmp_path / TEST_INPUT_FILE).write_text(
+        'src/\n' + ''.join(f'  file_{n}.txt\n' for n in range(3000))
+    )
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert 3000 == len(list((tmp_path / 'src').iterdir()))
+
+
+@pytest.mark.parametrize(
+    'extra_args', [
+        ['--fast-reader', '--stream'],
+        ['--fast-reader', '--size-limit=0', '--pipeline'],
+    ]
+)
+def test_main_fast_reader_large_tree(monkeypatch, tmp_path, extra_args):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, *extra_args]
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE).write_text(
+        'src/\n' + ''.join(f'  file_{n}.txt\n' for n in range(3000))
+    )
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert 3000 == len(list((tmp_path / 'src').iterdir()))
+
+
+def test_main_parse_jobs_large_tree(monkeypatch, tmp_path):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--parse-jobs=2', '--size-limit=0']
+    os.chdir(tmp_path)
+    monkeypatch.setattr(bytes_line_reader, '_PARALLEL_PART_SIZE', 1024)
+    (tmp_path / TEST_INPUT_FILE).write_text(
+        'src/\n' + ''.join(f'  file_{n}.txt\n' for n in range(3000))
+    )
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert 3000 == len(list((tmp_path / 'src').iterdir()))
+
+
+@pytest.mark.parametrize(
+    'extra_args', [
+        [],
+        ['--trim'],
+    ]
+)
+def test_main_plan_cache_reuses_plan(monkeypatch, tmp_path, extra_args):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', TEST_DATA_DIR, '--plan-cache', 'plan.cache', *extra_args]
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / TEST_DATA_DIR).mkdir()
+    if len(extra_args) == 0:
+        (data_dir / 'license').write_text('License Text')
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n  LICENSE license\n  main.py\n')
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    for run in range(2):
+        if len(extra_args) > 0:
+            (tmp_path / 'src').mkdir()
+            (tmp_path / 'src' / 'LICENSE').write_text('License Text')
+            (tmp_path / 'src' / 'main.py').touch()
+        main()
+        collector.assert_expected('')
+        assert (tmp_path / 'plan.cache').exists()
+        if len(extra_args) == 0:
+            assert (tmp_path / 'src' / 'LICENSE').read_text() == 'License Text'
+            (tmp_path / 'src' / 'LICENSE').unlink()
+            (tmp_path / 'src' / 'main.py').unlink()
+            (tmp_path / 'src').rmdir()
+        else:
+            assert not (tmp_path / 'src').exists()
+            (data_dir / 'license').unlink()
+        # The next run loads the cached Plan, without reading the Tree
+        monkeypatch.setattr(tree, 'read_input_store', lambda *_: pytest.fail('Tree was read'))
+
+
+@pytest.mark.parametrize(
+    'extra_args', [
+        ['--incremental'],
+        ['--incremental=hash', '--copy-mode=auto'],
+    ]
+)
+def test_main_incremental_rebuild_executes_nothing(monkeypatch, tmp_path, extra_args):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', TEST_DATA_DIR, *extra_args]
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / TEST_DATA_DIR).mkdir()
+    (data_dir / 'license').write_text('License Text')
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n  LICENSE license\n  pkg/\n    module.py\n  main.py\n')
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    assert (tmp_path / 'src' / 'LICENSE').read_text() == 'License Text'
+    (tmp_path / 'src' / 'main.py').unlink()
+    executed = []
+    monkeypatch.setattr(tree_builder, '_build', lambda i, copier=None: executed.append(i.path) or True)
+    main()
+    collector.assert_expected('')
+    assert [Path('src/main.py')] == executed
+
+
+@pytest.mark.parametrize(
+    'extra_args', [
+        ['--reconcile'],
+        ['--reconcile', '--incremental=hash', '--jobs=2'],
+        ['--reconcile', '--dir-fd'],
+    ]
+)
+def test_main_reconcile_tree(monkeypatch, tmp_path, extra_args):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', 'src/data', *extra_args]
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / 'src' / 'data').mkdir(parents=True)
+    (data_dir / 'license').write_text('License Text')
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n  LICENSE license\n  pkg/\n    module.py\n  main.py\n')
+    (tmp_path / 'src' / 'LICENSE').write_text('Old License')
+    (tmp_path / 'src' / 'pkg' / 'stray').mkdir(parents=True)
+    (tmp_path / 'src' / 'pkg' / 'stray' / 'file.txt').touch()
+    (tmp_path / 'src' / 'stray.txt').touch()
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert {'LICENSE', 'data', 'main.py', 'pkg'} == {x.name for x in (tmp_path / 'src').iterdir()}
+    assert ['module.py'] == [x.name for x in (tmp_path / 'src' / 'pkg').iterdir()]
+    assert (tmp_path / 'src' / 'LICENSE').read_text() == 'License Text'
+    assert (data_dir / 'license').read_text() == 'License Text'
+
+
+def test_main_reconcile_keeps_tree_file(monkeypatch, tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'src').mkdir()
+    (tree_file := tmp_path / 'src' / 'tree.txt').write_text('src/\n  main.py\n')
+    (tmp_path / 'src' / 'stray.txt').touch()
+    sys.argv = ['treescript-builder', 'src/tree.txt', '--reconcile']
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert {'main.py', 'tree.txt'} == {x.name for x in (tmp_path / 'src').iterdir()}
+    assert 'src/\n  main.py\n' == tree_file.read_text()
+
+
+def test_main_dedup_trim_then_build(monkeypatch, tmp_path):
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / 'data').mkdir()
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n  LICENSE license\n  pkg/\n    LICENSE pkg_license\n')
+    (tmp_path / 'src' / 'pkg').mkdir(parents=True)
+    (tmp_path / 'src' / 'LICENSE').write_text('License Text')
+    (tmp_path / 'src' / 'pkg' / 'LICENSE').write_text('License Text')
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', 'data', '--trim', '--dedup', '--jobs=2']
+    main()
+    assert not (tmp_path / 'src').exists()
+    assert 1 == len(list((data_dir / '.ftb_blobs').iterdir()))
+    # The manifest is detected without the Dedup argument
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', 'data', '--copy-mode=hardlink']
+    main()
+    collector.assert_expected('')
+    assert (tmp_path / 'src' / 'LICENSE').samefile(tmp_path / 'src' / 'pkg' / 'LICENSE')
+    assert 'License Text' == (tmp_path / 'src' / 'pkg' / 'LICENSE').read_text()
+
+
+@pytest.mark.parametrize(
+    'pipeline_args', [
+        [],
+        ['--pipeline'],
+    ]
+)
+def test_main_shard_trim_then_build(monkeypatch, tmp_path, pipeline_args):
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / 'data').mkdir()
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n  LICENSE license\n  pkg/\n    README.md readme\n')
+    (tmp_path / 'src' / 'pkg').mkdir(parents=True)
+    (tmp_path / 'src' / 'LICENSE').write_text('License Text')
+    (tmp_path / 'src' / 'pkg' / 'README.md').write_text('Readme Text')
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', 'data', '--trim', '--shard', *pipeline_args]
+    main()
+    assert not (tmp_path / 'src').exists()
+    assert not (data_dir / 'license').exists()
+    # The sharded layout is detected without the Shard argument
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', 'data', *pipeline_args]
+    main()
+    collector.assert_expected('')
+    assert 'License Text' == (tmp_path / 'src' / 'LICENSE').read_text()
+    assert 'Readme Text' == (tmp_path / 'src' / 'pkg' / 'README.md').read_text()
+
+
+def test_migrate_then_build(capsys, tmp_path):
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / 'data').mkdir()
+    (data_dir / 'license').write_text('License Text')
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n  LICENSE license\n')
+    sys.argv = ['ftb-migrate', 'data']
+    migrate()
+    assert 'Moved 1 Files into the sharded layout.\n' == capsys.readouterr().out
+    assert not (data_dir / 'license').exists()
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', 'data']
+    main()
+    assert 'License Text' == (tmp_path / 'src' / 'LICENSE').read_text()
+
+
+@pytest.mark.parametrize(
+    'extra_args,expect', [
+        ([], 'Invalid Name in Line: 3'),
+        (['--stream'], 'Invalid Name in Line: 3'),
+        (['--pipeline'], 'Invalid Tree Indentation on Line: 2'),
+    ]
+)
+def test_main_name_error_precedes_depth_error(tmp_path, extra_args, expect):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, *extra_args]
+    os.chdir(tmp_path)
+    # The depth error on line 2 precedes the name error on line 3
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n    deep.txt\n  ../\n')
+    with pytest.raises(SystemExit, match=f'^{expect}$'):
+        main()
+    assert not (tmp_path / 'src').exists()
+
+
+def test_main_large_tree_without_stream_raises_exit(tmp_path):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE]
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE).write_text(
+        'src/\n' + ''.join(f'  file_{n}.txt\n' for n in range(3000))
+    )
+    with pytest.raises(SystemExit, match='File larger than 32 KB Limit.'):
+        main()
+
+
+@pytest.mark.parametrize(
+    'stdin_args', [
+        ['-'],
+        ['--stdin'],
+    ]
+)
+def test_main_stdin_nested_tree(monkeypatch, tmp_path, stdin_args):
+    sys.argv = ['treescript-builder', *stdin_args]
+    os.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(get_nested_tree_script()))
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert (tmp_path / 'src' / 'main' / 'SourceClass.java').exists()
+
+
+def test_main_pipeline_nested_tree(monkeypatch, tmp_path):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--pipeline']
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE).write_text(get_nested_tree_script())
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert (tmp_path / 'src' / 'main' / 'SourceClass.java').exists()
+
+
+def test_main_pipeline_trim_nested_tree(monkeypatch, mock_nested_tree):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--pipeline', '--trim']
+    os.chdir(mock_nested_tree)
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert 1 == len(list(mock_nested_tree.rglob('*')))
+
+
+def test_main_pipeline_invalid_tree_raises_exit(tmp_path):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--pipeline']
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n  data.txt\n      deep.txt\n')
+    with pytest.raises(SystemExit, match='Invalid Tree Indentation on Line: 3'):
+        main()
+    # Instructions before the invalid node were executed
+    assert (tmp_path / 'src' / 'data.txt').exists()
+
+
+@pytest.mark.parametrize(
+    'extra_args', [
+        ['--jobs', '4'],
+        ['--jobs', '4', '--pipeline'],
+    ]
+)
+def test_main_jobs_nested_tree(monkeypatch, tmp_path, extra_args):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, *extra_args]
+    os.chdir(tmp_path)
+    (tmp_path / TEST_INPUT_FILE).write_text(
+        'src/\n' + ''.join(f'  dir{d}/\n' + ''.join(f'    file{f}.txt\n' for f in range(5)) for d in range(5))
+    )
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert 25 == len(list((tmp_path / 'src').rglob('*.txt')))
+
+
+def test_main_jobs_trim_nested_tree(monkeypatch, mock_nested_tree):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--trim', '--jobs', '4']
+    os.chdir(mock_nested_tree)
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert 1 == len(list(mock_nested_tree.rglob('*')))
+
+
+def test_main_copy_mode_auto_data_tree(monkeypatch, tmp_path):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', TEST_DATA_DIR, '--copy-mode', 'auto', '-j', '2']
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / TEST_DATA_DIR).mkdir()
+    (data_dir / 'license').write_text('License Text')
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n  LICENSE license\n  COPYING license\n')
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert (tmp_path / 'src' / 'LICENSE').read_text() == 'License Text'
+    assert (tmp_path / 'src' / 'COPYING').read_text() == 'License Text'
+
+
+@pytest.mark.parametrize(
+    'extra_args', [
+        ['--dir-fd'],
+        ['--dir-fd', '--pipeline'],
+    ]
+)
+def test_main_dir_fd_data_tree(monkeypatch, tmp_path, extra_args):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--data_dir', TEST_DATA_DIR, *extra_args]
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / TEST_DATA_DIR).mkdir()
+    (data_dir / 'license').write_text('License Text')
+    (tmp_path / TEST_INPUT_FILE).write_text('src/\n  LICENSE license\n  pkg/\n    module.py\n  main.py\n')
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert (tmp_path / 'src' / 'LICENSE').read_text() == 'License Text'
+    assert (tmp_path / 'src' / 'pkg' / 'module.py').exists()
+    assert (tmp_path / 'src' / 'main.py').exists()
+
+
+def test_main_dir_fd_trim_nested_tree(monkeypatch, mock_nested_tree):
+    sys.argv = ['treescript-builder', TEST_INPUT_FILE, '--trim', '--dir-fd']
+    os.chdir(mock_nested_tree)
+    collector, mock_print = setup_mock_print_collector()
+    monkeypatch.setattr(builtins, 'print', mock_print)
+    main()
+    collector.assert_expected('')
+    assert 1 == len(list(mock_nested_tree.rglob('*')))
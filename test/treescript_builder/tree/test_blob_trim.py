@@ -0,0 +1,131 @@
+"""Testing the Content-Addressed Trim.
+"""
+import os
+from hashlib import sha256
+from pathlib import Path
+
+import pytest
+
+from treescript_builder.data.data_directory import DataDirectory
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree import blob_trim
+from treescript_builder.tree.blob_trim import trim_blobs
+from treescript_builder.tree.tree_builder import build
+
+
+_LICENSE = 'License Text'
+_LICENSE_DIGEST = sha256(_LICENSE.encode()).hexdigest()
+
+_INSTRUCTIONS = (
+    InstructionData(False, Path('src/LICENSE'), Path('data/license')),
+    InstructionData(False, Path('src/pkg/LICENSE'), Path('data/pkg_license')),
+    InstructionData(False, Path('src/pkg/module.py'), Path('data/module')),
+    InstructionData(False, Path('src/pkg/__init__.py')),
+    InstructionData(True, Path('src/pkg')),
+    InstructionData(True, Path('src')),
+)
+
+
+@pytest.fixture
+def tree(tmp_path) -> Path:
+    os.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'src' / 'pkg').mkdir(parents=True)
+    (tmp_path / 'src' / 'LICENSE').write_text(_LICENSE)
+    (tmp_path / 'src' / 'pkg' / 'LICENSE').write_text(_LICENSE)
+    (tmp_path / 'src' / 'pkg' / 'module.py').write_text('print("module")')
+    (tmp_path / 'src' / 'pkg' / '__init__.py').touch()
+    return tmp_path
+
+
+@pytest.fixture
+def plan() -> InstructionPlan:
+    return InstructionPlan.from_instructions(_INSTRUCTIONS)
+
+
+def _list_blobs(data_dir: DataDirectory) -> list[str]:
+    return sorted(x.name for x in data_dir.get_blob_path(_LICENSE_DIGEST).parent.iterdir())
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_trim_blobs_stores_each_content_once(tree, plan, jobs):
+    data_dir = DataDirectory(Path('data'), content_addressed=True)
+    assert all(trim_blobs(plan, data_dir, jobs))
+    assert not (tree / 'src').exists()
+    assert sorted([_LICENSE_DIGEST, sha256(b'print("module")').hexdigest()]) == _list_blobs(data_dir)
+    reloaded = DataDirectory(Path('data'))
+    assert reloaded._search_label('license') == reloaded._search_label('pkg_license')
+    assert _LICENSE == reloaded._search_label('license').read_text()
+
+
+def test_trim_blobs_existing_blob_removes_file(tree, plan):
+    data_dir = DataDirectory(Path('data'), content_addressed=True)
+    (blob_path := data_dir.get_blob_path(_LICENSE_DIGEST)).parent.mkdir()
+    blob_path.write_text(_LICENSE)
+    blob_inode = blob_path.stat().st_ino
+    assert all(trim_blobs(plan, data_dir))
+    assert not (tree / 'src').exists()
+    assert blob_inode == blob_path.stat().st_ino
+    assert 2 == len(_list_blobs(data_dir))
+
+
+def test_trim_blobs_failed_removal_does_not_share_blob(tree, plan, monkeypatch):
+    monkeypatch.setattr(blob_trim, '_unlink', lambda path: False)
+    data_dir = DataDirectory(Path('data'), content_addressed=True)
+    assert (False, False, False, True, False, False) == trim_blobs(plan, data_dir)
+    # The File left in the Tree is changed, but the blob keeps the trimmed content
+    (tree / 'src' / 'LICENSE').write_text('Changed')
+    assert not (tree / 'src' / 'LICENSE').samefile(data_dir.get_blob_path(_LICENSE_DIGEST))
+    assert _LICENSE == data_dir.get_blob_path(_LICENSE_DIGEST).read_text()
+
+
+def test_trim_blobs_failed_manifest_keeps_tree(tree, plan):
+    # The temporary manifest path is a Directory, so the manifest cannot be written
+    (tree / 'data' / '.ftb_manifest.tmp').mkdir()
+    data_dir = DataDirectory(Path('data'), content_addressed=True)
+    assert (False, False, False, True, False, False) == trim_blobs(plan, data_dir)
+    assert _LICENSE == (tree / 'src' / 'LICENSE').read_text()
+    assert _LICENSE == (tree / 'src' / 'pkg' / 'LICENSE').read_text()
+    assert (tree / 'src' / 'pkg' / 'module.py').exists()
+    assert not data_dir.get_blob_path(_LICENSE_DIGEST).exists()
+    assert not (tree / 'data' / '.ftb_manifest').exists()
+    assert data_dir._search_label('license') is None
+
+
+def test_trim_blobs_unreadable_file_is_kept(tree, plan):
+    (tree / 'src' / 'pkg' / 'module.py').unlink()
+    (tree / 'src' / 'pkg' / 'module.py').mkdir()
+    data_dir = DataDirectory(Path('data'), content_addressed=True)
+    assert (True, True, False, True, False, False) == trim_blobs(plan, data_dir)
+    assert (tree / 'src' / 'pkg' / 'module.py').is_dir()
+    assert 'module' not in DataDirectory(Path('data'))._manifest
+
+
+def test_trim_blobs_failed_store_keeps_duplicates(tree, plan, monkeypatch):
+    monkeypatch.setattr(blob_trim, '_store_blob', lambda copier, data_dir, digest, path: False)
+    data_dir = DataDirectory(Path('data'), content_addressed=True)
+    assert (False, False, False, True, False, False) == trim_blobs(plan, data_dir)
+    assert (tree / 'src' / 'LICENSE').exists()
+    assert (tree / 'src' / 'pkg' / 'LICENSE').exists()
+
+
+def test_trim_blobs_without_data_files_trims_plan(tree):
+    plan = InstructionPlan.from_instructions(_INSTRUCTIONS[3:5])
+    assert (True, False) == trim_blobs(plan, DataDirectory(Path('data'), content_addressed=True))
+    assert not (tree / 'src' / 'pkg' / '__init__.py').exists()
+
+
+@pytest.mark.parametrize("copy_mode", ['copy', 'hardlink'])
+def test_trim_blobs_then_build_restores_tree(tree, plan, copy_mode):
+    assert all(trim_blobs(plan, DataDirectory(Path('data'), content_addressed=True)))
+    data_dir = DataDirectory(Path('data'))
+    build_plan = InstructionPlan.from_instructions((
+        InstructionData(True, Path('src/pkg')),
+        InstructionData(False, Path('src/LICENSE'), data_dir._search_label('license')),
+        InstructionData(False, Path('src/pkg/LICENSE'), data_dir._search_label('pkg_license')),
+    ))
+    assert all(build(build_plan, copy_mode=copy_mode))
+    assert _LICENSE == (tree / 'src' / 'pkg' / 'LICENSE').read_text()
+    if copy_mode == 'hardlink':
+        assert (tree / 'src' / 'LICENSE').samefile(data_dir.get_blob_path(_LICENSE_DIGEST))
@@ -0,0 +1,81 @@
+"""Testing the Build Plan Optimizer.
+"""
+from pathlib import Path
+
+import pytest
+
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.build_optimizer import optimize_build
+
+
+def _optimize(*instructions: InstructionData) -> list[InstructionData]:
+    return list(optimize_build(InstructionPlan.from_instructions(instructions)))
+
+
+def test_optimize_build_empty_plan_returns_empty():
+    assert [] == _optimize()
+
+
+def test_optimize_build_without_redundancy_returns_same_plan():
+    plan = InstructionPlan.from_instructions((
+        InstructionData(True, Path('src/pkg')),
+        InstructionData(False, Path('src/pkg/module.py')),
+        InstructionData(True, Path('test')),
+    ))
+    assert plan is optimize_build(plan)
+
+
+def test_optimize_build_repeated_directory_is_removed():
+    assert [
+        InstructionData(True, Path('src')),
+        InstructionData(False, Path('src/a.txt')),
+        InstructionData(False, Path('src/b.txt')),
+    ] == _optimize(
+        InstructionData(True, Path('src')),
+        InstructionData(False, Path('src/a.txt')),
+        InstructionData(True, Path('src')),
+        InstructionData(False, Path('src/b.txt')),
+    )
+
+
+@pytest.mark.parametrize(
+    "parent",
+    [Path('src'), Path('src/pkg')]
+)
+def test_optimize_build_created_parent_directory_is_removed(parent):
+    assert [
+        InstructionData(True, Path('src/pkg/inner')),
+        InstructionData(False, Path(parent, 'data.txt')),
+    ] == _optimize(
+        InstructionData(True, Path('src/pkg/inner')),
+        InstructionData(True, parent),
+        InstructionData(False, Path(parent, 'data.txt')),
+    )
+
+
+def test_optimize_build_parent_directory_before_child_is_kept():
+    instructions = [
+        InstructionData(True, Path('src')),
+        InstructionData(False, Path('src/data.txt')),
+        InstructionData(True, Path('src/pkg')),
+    ]
+    assert instructions == _optimize(*instructions)
+
+
+def test_optimize_build_same_name_in_other_directory_is_kept():
+    instructions = [
+        InstructionData(True, Path('a/src')),
+        InstructionData(True, Path('b/src')),
+        InstructionData(True, Path('src')),
+    ]
+    assert instructions == _optimize(*instructions)
+
+
+def test_optimize_build_file_instructions_are_kept():
+    instructions = [
+        InstructionData(True, Path('src')),
+        InstructionData(False, Path('src/data.txt'), Path('data/label')),
+        InstructionData(False, Path('src/data.txt'), Path('data/label')),
+    ]
+    assert instructions == _optimize(*instructions)
@@ -9,7 +9,9 @@ from test.treescript_builder.tree.conftest import generate_simple_tree, generate
 from treescript_builder.data.data_directory import DataDirectory
 from treescript_builder.data.instruction_data import InstructionData
 from treescript_builder.data.tree_data import TreeData
-from treescript_builder.tree.build_validation import validate_build
+from treescript_builder.data.tree_store import TreeStore
+from treescript_builder.input.line_reader import read_input_store
+from treescript_builder.tree.build_validation import plan_build, validate_build
 
 
 def test_validate_build_simple_tree_returns_data():
@@ -139,3 +141,36 @@ def test_validate_build_with_data_dir_invalid_tree_raises_exit(generator):
         data_dir_path = Path('.ftb/data/')
         with pytest.raises(SystemExit):
             validate_build(generator, data_dir_path)
+
+
+def test_validate_build_tree_store_complex_tree_returns_data():
+    store = TreeStore()
+    for node in generate_complex_tree():
+        store.append_node(node)
+    assert validate_build(store) == validate_build(generate_complex_tree())
+
+
+def test_plan_build_complex_tree_returns_plan():
+    assert tuple(plan_build(generate_complex_tree())) == validate_build(generate_complex_tree())
+
+
+def test_plan_build_invalid_tree_raises_exit():
+    with pytest.raises(SystemExit):
+        plan_build(generate_invalid_tree_line_1())
+
+
+@pytest.mark.parametrize(
+    'generator', [
+        generate_simple_tree, generate_gradle_module_tree, generate_python_package_tree, generate_complex_tree,
+    ]
+)
+def test_plan_build_tree_store_matches_generator(generator):
+    store = TreeStore()
+    for node in generator():
+        store.append_node(node)
+    assert tuple(plan_build(store)) == validate_build(generator())
+
+
+def test_plan_build_tree_store_invalid_tree_raises_exit():
+    with pytest.raises(SystemExit, match='Invalid Tree Indentation on Line: 2'):
+        plan_build(read_input_store("src/\n    data.txt"))
@@ -0,0 +1,124 @@
+"""Testing Bulk Subtree Removal.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.bulk_trim import _index_subtrees, remove_subtrees
+from treescript_builder.tree.tree_trimmer import trim
+
+
+_INSTRUCTIONS = (
+    InstructionData(False, Path('scratch/a/file1.txt')),
+    InstructionData(False, Path('scratch/a/file2.txt')),
+    InstructionData(True, Path('scratch/a')),
+    InstructionData(True, Path('scratch/empty')),
+    InstructionData(False, Path('scratch/file3.txt')),
+    InstructionData(True, Path('scratch')),
+    InstructionData(False, Path('src/module.py'), Path('data/module')),
+    InstructionData(False, Path('src/pkg/file4.txt')),
+    InstructionData(True, Path('src/pkg')),
+    InstructionData(True, Path('src')),
+)
+
+
+def _build_tree(root: Path):
+    root.mkdir(exist_ok=True)
+    os.chdir(root)
+    (root / 'data').mkdir()
+    for i in _INSTRUCTIONS:
+        if i.is_dir:
+            i.path.mkdir(parents=True, exist_ok=True)
+        else:
+            i.path.parent.mkdir(parents=True, exist_ok=True)
+            i.path.touch()
+
+
+def _list_tree(root: Path) -> set[str]:
+    return {x.relative_to(root).as_posix() for x in root.rglob('*')}
+
+
+@pytest.fixture
+def plan() -> InstructionPlan:
+    return InstructionPlan.from_instructions(_INSTRUCTIONS)
+
+
+def test_index_subtrees_excludes_data_files(plan):
+    files, dirs, roots = _index_subtrees(plan)
+    assert [
+        (Path('scratch'), [5]),
+        (Path('src/pkg'), [8]),
+    ] == [(path, indices) for path, _, indices in roots]
+
+
+def test_index_subtrees_excludes_directories_without_instructions():
+    plan = InstructionPlan.from_instructions((
+        InstructionData(False, Path('a/b/file.txt')),
+        InstructionData(True, Path('a')),
+    ))
+    assert [] == _index_subtrees(plan)[2]
+
+
+def test_remove_subtrees_removes_plan_entries(tmp_path, plan):
+    _build_tree(tmp_path)
+    assert {0, 1, 2, 3, 4, 5, 7, 8} == remove_subtrees(plan)
+    assert {'data', 'src', 'src/module.py'} == _list_tree(tmp_path)
+
+
+def test_remove_subtrees_keeps_entries_outside_plan(tmp_path, plan):
+    _build_tree(tmp_path)
+    (tmp_path / 'scratch' / 'a' / 'keep.txt').touch()
+    (tmp_path / 'scratch' / 'empty' / 'keep').mkdir()
+    assert {0, 1, 4, 7, 8} == remove_subtrees(plan)
+    assert {
+        'data', 'src', 'src/module.py', 'scratch', 'scratch/a', 'scratch/a/keep.txt', 'scratch/empty', 'scratch/empty/keep',
+    } == _list_tree(tmp_path)
+
+
+def test_remove_subtrees_does_not_follow_symlinks(tmp_path):
+    os.chdir(tmp_path)
+    (outside := tmp_path / 'outside').mkdir()
+    (outside / 'file.txt').touch()
+    (tmp_path / 'scratch').mkdir()
+    (tmp_path / 'scratch' / 'link').symlink_to(outside, target_is_directory=True)
+    plan = InstructionPlan.from_instructions((
+        InstructionData(False, Path('scratch/link/file.txt')),
+        InstructionData(True, Path('scratch/link')),
+        InstructionData(True, Path('scratch')),
+    ))
+    assert set() == remove_subtrees(plan)
+    assert (outside / 'file.txt').exists()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda root: None,
+        lambda root: (root / 'scratch' / 'a' / 'keep.txt').touch(),
+        lambda root: (root / 'scratch' / 'a' / 'file1.txt').unlink(),
+        lambda root: (root / 'scratch' / 'file3.txt').unlink() or (root / 'scratch' / 'file3.txt').mkdir(),
+        lambda root: (root / 'scratch' / 'empty').rmdir(),
+        lambda root: (root / 'data' / 'module').touch(),
+    ]
+)
+def test_trim_plan_matches_individual_instructions(tmp_path, plan, jobs, change):
+    _build_tree(bulk_root := tmp_path / 'bulk')
+    change(bulk_root)
+    bulk_results = trim(plan, jobs)
+    _build_tree(single_root := tmp_path / 'single')
+    change(single_root)
+    single_results = trim(tuple(plan), jobs)
+    assert single_results == bulk_results
+    assert _list_tree(single_root) == _list_tree(bulk_root)
+
+
+def test_trim_plan_removes_tree_and_extracts_data(tmp_path, plan):
+    _build_tree(tmp_path)
+    (tmp_path / 'src' / 'module.py').write_text('print("module")')
+    assert all(trim(plan))
+    assert {'data', 'data/module'} == _list_tree(tmp_path)
+    assert 'print("module")' == (tmp_path / 'data' / 'module').read_text()
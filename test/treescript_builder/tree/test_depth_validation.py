@@ -0,0 +1,41 @@
+"""Testing the Bulk Depth Validation.
+"""
+import pytest
+
+from test.treescript_builder.tree.conftest import generate_complex_tree, generate_simple_tree
+from treescript_builder.data.tree_store import TreeStore
+from treescript_builder.input.line_reader import read_input_store
+from treescript_builder.tree.depth_validation import validate_depths
+
+
+def _create_store(nodes) -> TreeStore:
+    store = TreeStore()
+    for node in nodes:
+        store.append_node(node)
+    return store
+
+
+def test_validate_depths_empty_store_returns_empty():
+    assert [] == list(validate_depths(TreeStore()))
+
+
+def test_validate_depths_simple_tree_returns_parents():
+    assert [-1, 0] == list(validate_depths(_create_store(generate_simple_tree())))
+
+
+def test_validate_depths_complex_tree_returns_parents():
+    parents = validate_depths(_create_store(generate_complex_tree()))
+    assert list(parents) == [-1, 0, -1, 2, 2, 4, 5, 6, 7, 8, 4, 10, 11, 12, 13, -1, -1, -1]
+
+
+@pytest.mark.parametrize(
+    'test_input,line_number', [
+        ('  src/\n', 1),
+        ('src/\n    data.txt\n', 2),
+        ('src/\n  data.txt\n    deep.txt\n', 3),
+        ('src/\n  main/\n\n# Comment\n      deep.txt\n', 5),
+    ]
+)
+def test_validate_depths_invalid_tree_raises_exit(test_input, line_number):
+    with pytest.raises(SystemExit, match=f'Invalid Tree Indentation on Line: {line_number}$'):
+        validate_depths(read_input_store(test_input))
@@ -0,0 +1,160 @@
+"""Testing the Directory File Descriptor Executor.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree import dir_fd_executor, file_mover
+from treescript_builder.tree.dir_fd_executor import DirFdExecutor, execute_dir_fd, is_dir_fd_supported
+from treescript_builder.tree.file_mover import FileMover
+
+
+pytestmark = pytest.mark.skipif(not is_dir_fd_supported(), reason='Directory file descriptors are not supported')
+
+
+def test_execute_dir_fd_build_nested_tree(tmp_path):
+    os.chdir(tmp_path)
+    instructions = [
+        InstructionData(True, Path('src')),
+        InstructionData(False, Path('src/main.py')),
+        InstructionData(True, Path('src/pkg')),
+        InstructionData(False, Path('src/pkg/module.py')),
+        InstructionData(False, Path('src/readme.md')),
+        InstructionData(True, Path('test')),
+    ]
+    assert all(execute_dir_fd(instructions, False))
+    assert (tmp_path / 'src' / 'main.py').is_file()
+    assert (tmp_path / 'src' / 'pkg' / 'module.py').is_file()
+    assert (tmp_path / 'src' / 'readme.md').is_file()
+    assert (tmp_path / 'test').is_dir()
+
+
+def test_execute_dir_fd_build_creates_missing_parents(tmp_path):
+    os.chdir(tmp_path)
+    assert all(execute_dir_fd([InstructionData(False, Path('a/b/c.txt'))], False))
+    assert (tmp_path / 'a' / 'b' / 'c.txt').is_file()
+
+
+def test_execute_dir_fd_build_existing_file_keeps_contents(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'file.txt').write_text('Contents')
+    assert all(execute_dir_fd([InstructionData(False, Path('file.txt'))], False))
+    assert (tmp_path / 'file.txt').read_text() == 'Contents'
+
+
+@pytest.mark.parametrize('copy_mode', ['copy', 'auto', 'hardlink'])
+def test_execute_dir_fd_build_data_file(tmp_path, copy_mode):
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / 'data').mkdir()
+    (data_file := data_dir / 'label').write_text('Data')
+    os.utime(data_file, ns=(1_000_000_000, 1_000_000_000))
+    instructions = [
+        InstructionData(True, Path('src')),
+        InstructionData(False, Path('src/data.txt'), data_file),
+    ]
+    assert all(execute_dir_fd(instructions, False, copy_mode))
+    assert (target := tmp_path / 'src' / 'data.txt').read_text() == 'Data'
+    assert target.stat().st_mtime_ns == 1_000_000_000
+
+
+def test_execute_dir_fd_build_missing_data_file_returns_false(tmp_path):
+    os.chdir(tmp_path)
+    instructions = [InstructionData(False, Path('data.txt'), tmp_path / 'missing')]
+    assert (False,) == tuple(execute_dir_fd(instructions, False))
+
+
+def test_execute_dir_fd_build_parent_is_file_returns_false(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'src').write_text('')
+    assert (False,) == tuple(execute_dir_fd([InstructionData(False, Path('src/main.py'))], False))
+
+
+def test_execute_dir_fd_trim_nested_tree(tmp_path):
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / 'data').mkdir()
+    (tmp_path / 'src' / 'pkg').mkdir(parents=True)
+    (tmp_path / 'src' / 'main.py').write_text('Main')
+    (tmp_path / 'src' / 'pkg' / 'module.py').write_text('')
+    instructions = [
+        InstructionData(False, Path('src/main.py'), data_dir / 'main'),
+        InstructionData(False, Path('src/pkg/module.py')),
+        InstructionData(True, Path('src/pkg')),
+        InstructionData(False, Path('src/missing.py')),
+        InstructionData(True, Path('src')),
+    ]
+    assert all(execute_dir_fd(instructions, True))
+    assert not (tmp_path / 'src').exists()
+    assert (data_dir / 'main').read_text() == 'Main'
+
+
+def test_execute_dir_fd_trim_non_empty_dir_returns_false(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'extra.txt').write_text('')
+    assert (False,) == tuple(execute_dir_fd([InstructionData(True, Path('src'))], True))
+
+
+def test_execute_dir_fd_trim_cross_device_copies_file(tmp_path, monkeypatch):
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / 'data').mkdir()
+    (tmp_path / 'file.txt').write_text('Contents')
+    monkeypatch.setattr(FileMover, 'is_same_device', lambda self, data: False)
+    def rename_not_expected(*args, **kwargs):
+        raise AssertionError('Rename is not used across devices')
+    monkeypatch.setattr(file_mover.os, 'rename', rename_not_expected)
+    instructions = [InstructionData(False, Path('file.txt'), data_dir / 'label')]
+    assert all(execute_dir_fd(instructions, True))
+    assert not (tmp_path / 'file.txt').exists()
+    assert 'Contents' == (data_dir / 'label').read_text()
+
+
+def test_dir_fd_executor_reuses_open_directories(tmp_path, monkeypatch):
+    os.chdir(tmp_path)
+    (tmp_path / 'src').mkdir()
+    opened = []
+    real_open = os.open
+    def record_open(path, flags, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, flags, *args, **kwargs)
+    with DirFdExecutor() as executor:
+        monkeypatch.setattr(dir_fd_executor.os, 'open', record_open)
+        for n in range(10):
+            assert executor.build(InstructionData(False, Path(f'src/file{n}.txt')))
+    # The src Directory is opened once, followed by one open for each new File
+    assert opened.count('src') == 1
+    assert 11 == len(opened)
+
+
+def test_dir_fd_executor_close_releases_descriptors(tmp_path):
+    os.chdir(tmp_path)
+    executor = DirFdExecutor()
+    assert executor.build(InstructionData(False, Path('a/b/c.txt')))
+    fds = list(executor._fds)
+    executor.close()
+    for fd in fds:
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+
+def test_execute_dir_fd_instruction_plan_build_and_trim(tmp_path):
+    os.chdir(tmp_path)
+    build_plan = InstructionPlan.from_instructions([
+        InstructionData(True, Path('src/pkg')),
+        InstructionData(False, Path('src/pkg/module.py')),
+        InstructionData(False, Path('src/pkg/__init__.py')),
+        InstructionData(True, Path('test')),
+    ])
+    assert all(execute_dir_fd(build_plan, False))
+    assert (tmp_path / 'src' / 'pkg' / '__init__.py').is_file()
+    trim_plan = InstructionPlan.from_instructions([
+        InstructionData(False, Path('src/pkg/module.py')),
+        InstructionData(False, Path('src/pkg/__init__.py')),
+        InstructionData(True, Path('src/pkg')),
+        InstructionData(True, Path('src')),
+        InstructionData(True, Path('test')),
+    ])
+    assert all(execute_dir_fd(trim_plan, True))
+    assert [] == list(tmp_path.iterdir())
@@ -0,0 +1,173 @@
+"""Testing the Data File Copy Strategies.
+"""
+import os
+import sys
+from errno import ENOSPC, EOPNOTSUPP
+
+import pytest
+
+from treescript_builder.tree import file_copier
+from treescript_builder.tree.file_copier import FileCopier
+
+
+_DATA = 'Data File Contents\n' * 100
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    (data_path := tmp_path / 'data_label').write_text(_DATA)
+    os.utime(data_path, ns=(1_000_000_000, 1_000_000_000))
+    return data_path
+
+
+def test_file_copier_unknown_mode_raises_value_error():
+    with pytest.raises(ValueError):
+        FileCopier('teleport')
+
+
+@pytest.mark.parametrize('mode', ['copy', 'auto'])
+def test_file_copier_copies_data_and_mtime(tmp_path, data_file, mode):
+    target = tmp_path / 'target.txt'
+    assert FileCopier(mode).copy(data_file, target)
+    assert target.read_text() == _DATA
+    assert target.stat().st_mtime_ns == data_file.stat().st_mtime_ns
+    assert not target.samefile(data_file)
+
+
+def test_file_copier_auto_replaces_existing_file(tmp_path, data_file):
+    (target := tmp_path / 'target.txt').write_text('Old Contents, which are longer than the Data File' * 100)
+    assert FileCopier('auto').copy(data_file, target)
+    assert target.read_text() == _DATA
+
+
+def test_file_copier_hardlink_links_data_file(tmp_path, data_file):
+    target = tmp_path / 'target.txt'
+    assert FileCopier('hardlink').copy(data_file, target)
+    assert target.samefile(data_file)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Symlinks require elevated privileges on Windows')
+def test_file_copier_symlink_links_data_file(tmp_path, data_file):
+    target = tmp_path / 'target.txt'
+    assert FileCopier('symlink').copy(data_file, target)
+    assert target.is_symlink()
+    assert target.read_text() == _DATA
+
+
+def test_file_copier_auto_does_not_truncate_linked_data_file(tmp_path, data_file):
+    target = tmp_path / 'target.txt'
+    assert FileCopier('hardlink').copy(data_file, target)
+    assert FileCopier('auto').copy(data_file, target)
+    assert data_file.read_text() == _DATA
+    assert target.read_text() == _DATA
+
+
+def test_file_copier_missing_data_file_returns_false(tmp_path):
+    # A Symlink to a missing Data File can be created
+    for mode in ('auto', 'reflink', 'copy', 'hardlink'):
+        assert not FileCopier(mode).copy(tmp_path / 'missing', tmp_path / f'target_{mode}')
+
+
+def test_file_copier_unsupported_method_is_chosen_once_per_device_pair(tmp_path, data_file, monkeypatch):
+    calls = []
+    def unsupported(src_fd, dst_fd, size):
+        calls.append('unsupported')
+        raise OSError(EOPNOTSUPP, 'Operation not supported')
+    def supported(src_fd, dst_fd, size):
+        calls.append('supported')
+        os.write(dst_fd, os.read(src_fd, size))
+    monkeypatch.setattr(file_copier, '_get_auto_methods', lambda: (unsupported, supported))
+    copier = FileCopier('auto')
+    for n in range(3):
+        assert copier.copy(data_file, tmp_path / f'target{n}.txt')
+        assert (tmp_path / f'target{n}.txt').read_text() == _DATA
+    assert calls == ['unsupported', 'supported', 'supported', 'supported']
+
+
+def test_file_copier_all_methods_unsupported_falls_back_to_copy2(tmp_path, data_file, monkeypatch):
+    def unsupported(src_fd, dst_fd, size):
+        os.write(dst_fd, b'partial')
+        raise OSError(EOPNOTSUPP, 'Operation not supported')
+    monkeypatch.setattr(file_copier, '_get_auto_methods', lambda: (unsupported,))
+    assert FileCopier('auto').copy(data_file, target := tmp_path / 'target.txt')
+    assert target.read_text() == _DATA
+
+
+def _copy_nothing(*args):
+    return 0
+
+
+def _copy_one_chunk():
+    """ Copy one chunk, then report the end of the File. """
+    calls = []
+    def copy(*args):
+        calls.append(args)
+        return 0 if len(calls) > 1 else 64
+    return copy
+
+
+def _copy_at(copier: FileCopier, data_file, tmp_path) -> bool:
+    dir_fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        return copier.copy_at(data_file, 'target.txt', dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+@pytest.mark.parametrize('is_partial', [False, True])
+@pytest.mark.parametrize('use_dir_fd', [False, True])
+def test_file_copier_short_copy_file_range_falls_back(tmp_path, data_file, monkeypatch, is_partial, use_dir_fd):
+    monkeypatch.setattr(file_copier.os, 'copy_file_range', _copy_one_chunk() if is_partial else _copy_nothing, raising=False)
+    monkeypatch.setattr(file_copier, '_get_auto_methods', lambda: (file_copier._copy_file_range,))
+    copier = FileCopier('auto')
+    if use_dir_fd:
+        assert _copy_at(copier, data_file, tmp_path)
+    else:
+        assert copier.copy(data_file, tmp_path / 'target.txt')
+    assert (tmp_path / 'target.txt').read_text() == _DATA
+    # The method is not chosen again for this pair of devices
+    assert [1] == list(copier._device_methods.values())
+
+
+@pytest.mark.skipif(not hasattr(os, 'sendfile'), reason='sendfile is not available')
+def test_file_copier_short_sendfile_falls_back(tmp_path, data_file, monkeypatch):
+    monkeypatch.setattr(file_copier.os, 'sendfile', _copy_nothing)
+    monkeypatch.setattr(file_copier, '_get_auto_methods', lambda: (file_copier._sendfile,))
+    assert _copy_at(FileCopier('auto'), data_file, tmp_path)
+    assert (tmp_path / 'target.txt').read_text() == _DATA
+
+
+def test_file_copier_method_failure_returns_false(tmp_path, data_file, monkeypatch):
+    def no_space(src_fd, dst_fd, size):
+        raise OSError(ENOSPC, 'No space left on device')
+    monkeypatch.setattr(file_copier, '_get_auto_methods', lambda: (no_space,))
+    assert not FileCopier('auto').copy(data_file, tmp_path / 'target.txt')
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='Reflinks are only attempted on Linux')
+def test_file_copier_reflink_unsupported_returns_false(tmp_path, data_file, monkeypatch):
+    def unsupported(src_fd, dst_fd, size):
+        raise OSError(EOPNOTSUPP, 'Operation not supported')
+    monkeypatch.setattr(file_copier, '_reflink', unsupported)
+    assert not FileCopier('reflink').copy(data_file, tmp_path / 'target.txt')
+
+
+@pytest.mark.parametrize('mode', ['copy', 'auto', 'hardlink'])
+def test_file_copier_copy_at_creates_file_in_directory(tmp_path, data_file, mode):
+    (target_dir := tmp_path / 'target_dir').mkdir()
+    (target_dir / 'target.txt').write_text('Old Contents')
+    dir_fd = os.open(target_dir, os.O_RDONLY)
+    try:
+        assert FileCopier(mode).copy_at(data_file, 'target.txt', dir_fd)
+    finally:
+        os.close(dir_fd)
+    assert (target_dir / 'target.txt').read_text() == _DATA
+    assert (target_dir / 'target.txt').stat().st_mtime_ns == data_file.stat().st_mtime_ns
+
+
+def test_file_copier_copy_at_missing_data_file_returns_false(tmp_path):
+    dir_fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        assert not FileCopier('copy').copy_at(tmp_path / 'missing', 'target.txt', dir_fd)
+    finally:
+        os.close(dir_fd)
@@ -0,0 +1,126 @@
+"""Testing the Data File Move Strategy.
+"""
+import os
+from errno import EXDEV
+from pathlib import Path
+
+import pytest
+
+from treescript_builder.tree import file_mover
+from treescript_builder.tree.file_copier import FileCopier
+from treescript_builder.tree.file_mover import FileMover
+
+
+@pytest.fixture
+def tree(tmp_path) -> Path:
+    os.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'file.txt').write_text('Contents')
+    os.utime(tmp_path / 'src' / 'file.txt', ns=(1_000_000_000, 2_000_000_000))
+    return tmp_path
+
+
+def _cross_device(monkeypatch):
+    monkeypatch.setattr(FileMover, 'is_same_device', lambda self, data: False)
+    def rename_not_expected(*args, **kwargs):
+        raise AssertionError('Rename is not used across devices')
+    monkeypatch.setattr(file_mover.os, 'rename', rename_not_expected)
+
+
+def test_is_same_device_checks_once(tree, monkeypatch):
+    mover = FileMover()
+    assert mover.is_same_device(Path('data/label'))
+    stats = []
+    monkeypatch.setattr(file_mover.os, 'stat', lambda *args, **kwargs: stats.append(args))
+    assert mover.is_same_device(Path('data/other'))
+    assert [] == stats
+
+
+def test_is_same_device_missing_data_directory_raises_os_error(tree):
+    with pytest.raises(OSError):
+        FileMover().is_same_device(Path('missing/label'))
+
+
+def test_move_same_device_renames_file(tree, monkeypatch):
+    renames = []
+    rename = os.rename
+    monkeypatch.setattr(file_mover.os, 'rename', lambda *args, **kwargs: renames.append(args) or rename(*args, **kwargs))
+    assert FileMover().move(Path('src/file.txt'), Path('data/label'))
+    assert [(Path('src/file.txt'), Path('data/label'))] == renames
+    assert 'Contents' == (tree / 'data' / 'label').read_text()
+    assert not (tree / 'src' / 'file.txt').exists()
+
+
+def test_move_cross_device_copies_and_unlinks(tree, monkeypatch):
+    _cross_device(monkeypatch)
+    (tree / 'data' / 'label').write_text('Previous Data')
+    assert FileMover().move(Path('src/file.txt'), Path('data/label'))
+    assert 'Contents' == (tree / 'data' / 'label').read_text()
+    assert 2_000_000_000 == (tree / 'data' / 'label').stat().st_mtime_ns
+    assert not (tree / 'src' / 'file.txt').exists()
+
+
+@pytest.mark.parametrize("use_dir_fd", [False, True])
+def test_move_cross_device_failed_copy_keeps_file(tree, monkeypatch, use_dir_fd):
+    _cross_device(monkeypatch)
+    monkeypatch.setattr(FileCopier, 'copy_fd', lambda self, src_fd, dst_fd: False)
+    if use_dir_fd:
+        dir_fd = os.open('src', os.O_RDONLY)
+        try:
+            assert not FileMover().move_at('file.txt', dir_fd, Path('data/label'))
+        finally:
+            os.close(dir_fd)
+    else:
+        assert not FileMover().move(Path('src/file.txt'), Path('data/label'))
+    assert 'Contents' == (tree / 'src' / 'file.txt').read_text()
+    assert not (tree / 'data' / 'label').exists()
+
+
+@pytest.mark.parametrize("use_dir_fd", [False, True])
+def test_move_cross_device_short_copy_keeps_file(tree, monkeypatch, use_dir_fd):
+    _cross_device(monkeypatch)
+    # A kernel copy that stopped early, but still reported success
+    monkeypatch.setattr(FileCopier, 'copy_fd', lambda self, src_fd, dst_fd: os.write(dst_fd, os.read(src_fd, 3)) > 0)
+    if use_dir_fd:
+        dir_fd = os.open('src', os.O_RDONLY)
+        try:
+            assert not FileMover().move_at('file.txt', dir_fd, Path('data/label'))
+        finally:
+            os.close(dir_fd)
+    else:
+        assert not FileMover().move(Path('src/file.txt'), Path('data/label'))
+    assert 'Contents' == (tree / 'src' / 'file.txt').read_text()
+    assert not (tree / 'data' / 'label').exists()
+
+
+def test_move_at_cross_device_copies_and_unlinks(tree, monkeypatch):
+    _cross_device(monkeypatch)
+    dir_fd = os.open('src', os.O_RDONLY)
+    try:
+        assert FileMover().move_at('file.txt', dir_fd, Path('data/label'))
+    finally:
+        os.close(dir_fd)
+    assert 'Contents' == (tree / 'data' / 'label').read_text()
+    assert not (tree / 'src' / 'file.txt').exists()
+
+
+def test_move_rejected_rename_copies_file(tree, monkeypatch):
+    def rename_cross_device(*args, **kwargs):
+        raise OSError(EXDEV, 'Invalid cross-device link')
+    monkeypatch.setattr(file_mover.os, 'rename', rename_cross_device)
+    assert FileMover().move(Path('src/file.txt'), Path('data/label'))
+    assert 'Contents' == (tree / 'data' / 'label').read_text()
+    assert not (tree / 'src' / 'file.txt').exists()
+
+
+@pytest.mark.parametrize("is_same_device", [True, False])
+def test_move_missing_file_returns_false(tree, monkeypatch, is_same_device):
+    monkeypatch.setattr(FileMover, 'is_same_device', lambda self, data: is_same_device)
+    assert not FileMover().move(Path('src/missing.txt'), Path('data/label'))
+    assert not (tree / 'data' / 'label').exists()
+
+
+def test_move_missing_data_directory_returns_false(tree):
+    assert not FileMover().move(Path('src/file.txt'), Path('missing/label'))
+    assert (tree / 'src' / 'file.txt').exists()
@@ -0,0 +1,118 @@
+"""Testing the Incremental Build Filter.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.incremental_build import filter_existing
+from treescript_builder.tree.tree_builder import build
+
+
+_INSTRUCTIONS = (
+    InstructionData(True, Path('src')),
+    InstructionData(False, Path('src/main.py')),
+    InstructionData(True, Path('src/pkg')),
+    InstructionData(False, Path('src/pkg/module.py'), Path('data/module')),
+    InstructionData(False, Path('src/pkg/LICENSE'), Path('data/license')),
+    InstructionData(True, Path('test')),
+)
+
+
+@pytest.fixture
+def data_tree(tmp_path) -> Path:
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / 'data').mkdir()
+    (data_dir / 'module').write_text('print("module")')
+    (data_dir / 'license').write_text('License Text')
+    return tmp_path
+
+
+@pytest.fixture
+def plan() -> InstructionPlan:
+    return InstructionPlan.from_instructions(_INSTRUCTIONS)
+
+
+def test_filter_existing_empty_tree_keeps_all(data_tree, plan):
+    assert list(_INSTRUCTIONS) == list(filter_existing(plan))
+
+
+@pytest.mark.parametrize("compare", ['mtime', 'hash'])
+def test_filter_existing_built_tree_removes_all(data_tree, plan, compare):
+    assert all(build(plan))
+    assert 0 == len(filter_existing(plan, compare))
+
+
+def test_filter_existing_partial_tree_keeps_missing(data_tree, plan):
+    assert all(build(plan))
+    (data_tree / 'src' / 'pkg' / 'LICENSE').unlink()
+    (data_tree / 'test').rmdir()
+    assert [_INSTRUCTIONS[4], _INSTRUCTIONS[5]] == list(filter_existing(plan))
+
+
+def test_filter_existing_missing_directory_keeps_contents(data_tree, plan):
+    (data_tree / 'src').mkdir()
+    (data_tree / 'src' / 'main.py').touch()
+    assert list(_INSTRUCTIONS[2:]) == list(filter_existing(plan))
+
+
+def test_filter_existing_changed_size_keeps_file(data_tree, plan):
+    assert all(build(plan))
+    (data_tree / 'src' / 'pkg' / 'module.py').write_text('print("changed module")')
+    assert [_INSTRUCTIONS[3]] == list(filter_existing(plan))
+
+
+def test_filter_existing_changed_mtime_compares_hash(data_tree, plan):
+    assert all(build(plan))
+    os.utime(data_tree / 'src' / 'pkg' / 'LICENSE', (0, 0))
+    assert [_INSTRUCTIONS[4]] == list(filter_existing(plan, 'mtime'))
+    assert 0 == len(filter_existing(plan, 'hash'))
+
+
+def test_filter_existing_changed_content_hash_keeps_file(data_tree, plan):
+    assert all(build(plan))
+    (data_tree / 'src' / 'pkg' / 'LICENSE').write_text('License Txet')
+    assert [_INSTRUCTIONS[4]] == list(filter_existing(plan, 'hash'))
+
+
+def test_filter_existing_wrong_entry_type_keeps_instruction(data_tree, plan):
+    (data_tree / 'src').touch()
+    (data_tree / 'test').touch()
+    result = filter_existing(plan)
+    assert list(_INSTRUCTIONS) == list(result)
+
+
+def test_filter_existing_missing_data_file_keeps_instruction(data_tree, plan):
+    assert all(build(plan))
+    (data_tree / 'data' / 'module').unlink()
+    assert [_INSTRUCTIONS[3]] == list(filter_existing(plan))
+
+
+def test_filter_existing_scans_each_directory_once(data_tree, plan, monkeypatch):
+    from treescript_builder.tree import incremental_build
+    assert all(build(plan))
+    scanned = []
+    scan_directory = incremental_build.scan_directory
+    def _scan(path):
+        scanned.append(path)
+        return scan_directory(path)
+    monkeypatch.setattr(incremental_build, 'scan_directory', _scan)
+    filter_existing(plan)
+    assert sorted(set(scanned)) == sorted(scanned)
+
+
+def test_filter_existing_hashes_shared_data_file_once(data_tree, monkeypatch):
+    from treescript_builder.tree import file_snapshot
+    plan = InstructionPlan.from_instructions(
+        [InstructionData(True, Path('src'))] +
+        [InstructionData(False, Path(f'src/LICENSE_{n}'), Path('data/license')) for n in range(3)]
+    )
+    assert all(build(plan))
+    hashed = []
+    hash_file = file_snapshot.hash_file
+    monkeypatch.setattr(file_snapshot, 'hash_file', lambda path: hashed.append(Path(path)) or hash_file(path))
+    assert 0 == len(filter_existing(plan, 'hash'))
+    assert 1 == hashed.count(Path('data/license'))
+    assert 4 == len(hashed)
@@ -1,16 +1,18 @@
 """Testing the Tree Module Init Build Tree Method
 """
+import os
+
 import pytest
 
 from treescript_builder.input import InputData
-from treescript_builder.tree import build_tree, tree_builder, tree_trimmer
+from treescript_builder.tree import build_tree, stream_tree, tree_builder, tree_trimmer
 
 
-def mock_build_success(arg):
+def mock_build_success(arg, *args):
     return (True, )
 
 
-def mock_build_fail(arg):
+def mock_build_fail(arg, *args):
     return (False, )
 
 
@@ -48,4 +50,18 @@ def test_build_tree_single_file_trim_fails_returns_false():
         c.setattr(tree_trimmer, 'trim', mock_build_fail)
         result = build_tree(input_data)
     assert len(result) == 1
-    assert not result[0]
\ No newline at end of file
+    assert not result[0]
+
+def test_stream_tree_single_file_build_yields_result(tmp_path):
+    os.chdir(tmp_path)
+    input_data = InputData('data.txt', None, False, is_pipelined=True)
+    assert list(stream_tree(input_data)) == [True]
+    assert (tmp_path / 'data.txt').exists()
+
+
+def test_stream_tree_single_file_trim_yields_result(tmp_path):
+    os.chdir(tmp_path)
+    (tmp_path / 'data.txt').touch()
+    input_data = InputData('data.txt', None, True, is_pipelined=True)
+    assert list(stream_tree(input_data)) == [True]
+    assert not (tmp_path / 'data.txt').exists()
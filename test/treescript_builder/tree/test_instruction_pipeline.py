@@ -0,0 +1,38 @@
+"""Testing Instruction Pipeline Methods.
+"""
+import pytest
+
+from treescript_builder.tree.instruction_pipeline import pipeline_instructions
+
+
+def test_pipeline_instructions_preserves_order():
+    assert list(pipeline_instructions(iter(range(1000)), queue_size=8)) == list(range(1000))
+
+
+def test_pipeline_instructions_empty_iterator_returns_nothing():
+    assert list(pipeline_instructions(iter(()))) == []
+
+
+def test_pipeline_instructions_producer_exit_raises_exit():
+    def generate_then_exit():
+        yield 1
+        yield 2
+        exit('Invalid Tree Indentation on Line: 3')
+    generator = pipeline_instructions(generate_then_exit())
+    assert next(generator) == 1
+    assert next(generator) == 2
+    with pytest.raises(SystemExit, match='Invalid Tree Indentation on Line: 3'):
+        next(generator)
+
+
+def test_pipeline_instructions_producer_is_bounded_by_queue_size():
+    produced = []
+    def generate_and_record():
+        for n in range(100):
+            produced.append(n)
+            yield n
+    generator = pipeline_instructions(generate_and_record(), queue_size=4)
+    assert next(generator) == 0
+    generator.close()
+    # The Producer stops once the Consumer is closed, after filling the Queue at most
+    assert len(produced) <= 4 + 2
@@ -0,0 +1,63 @@
+"""Testing the Parallel Instruction Executor.
+"""
+import threading
+from pathlib import Path
+
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.tree.parallel_executor import execute_parallel
+
+
+def test_execute_parallel_results_in_original_order():
+    instructions = [InstructionData(n % 5 == 0, Path(f'node{n}')) for n in range(500)]
+    results = tuple(execute_parallel(instructions, lambda i: int(i.path.name[4:]) % 3 != 0, 4))
+    assert results == tuple(n % 3 != 0 for n in range(500))
+
+
+def test_execute_parallel_directories_run_in_dispatching_thread():
+    dispatcher = threading.get_ident()
+    threads = {}
+    def record_thread(i: InstructionData) -> bool:
+        threads[i.path] = threading.get_ident()
+        return True
+    instructions = [
+        InstructionData(True, Path('src')),
+        InstructionData(False, Path('src/a.txt')),
+        InstructionData(False, Path('src/b.txt')),
+        InstructionData(True, Path('src/sub')),
+    ]
+    assert all(execute_parallel(instructions, record_thread, 2))
+    assert threads[Path('src')] == dispatcher
+    assert threads[Path('src/sub')] == dispatcher
+
+
+def test_execute_parallel_files_follow_parent_directory():
+    created = set()
+    lock = threading.Lock()
+    def create(i: InstructionData) -> bool:
+        with lock:
+            if not i.is_dir and i.path.parent not in created:
+                return False
+            created.add(i.path)
+        return True
+    instructions = []
+    for d in range(20):
+        instructions.append(InstructionData(True, Path(f'dir{d}')))
+        instructions.extend(InstructionData(False, Path(f'dir{d}/file{f}')) for f in range(20))
+    assert all(execute_parallel(instructions, create, 8))
+
+
+def test_execute_parallel_wait_for_children_directory_follows_contents():
+    finished = set()
+    lock = threading.Lock()
+    def remove(i: InstructionData) -> bool:
+        with lock:
+            if i.is_dir:
+                # Every File inside the Directory has finished
+                return all(Path(f'dir{i.path.name[3:]}/file{f}') in finished for f in range(20))
+            finished.add(i.path)
+        return True
+    instructions = []
+    for d in range(20):
+        instructions.extend(InstructionData(False, Path(f'dir{d}/file{f}')) for f in range(20))
+        instructions.append(InstructionData(True, Path(f'dir{d}')))
+    assert all(execute_parallel(instructions, remove, 8, wait_for_children=True))
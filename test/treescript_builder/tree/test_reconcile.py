@@ -0,0 +1,149 @@
+"""Testing Tree Reconciliation.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.reconcile import plan_reconcile, _get_children
+from treescript_builder.tree.tree_builder import build
+from treescript_builder.tree.tree_trimmer import trim
+
+
+_INSTRUCTIONS = (
+    InstructionData(True, Path('src/pkg')),
+    InstructionData(False, Path('src/pkg/module.py'), Path('data/module')),
+    InstructionData(False, Path('src/main.py')),
+    InstructionData(True, Path('empty')),
+)
+
+
+@pytest.fixture
+def data_tree(tmp_path) -> Path:
+    os.chdir(tmp_path)
+    (data_dir := tmp_path / 'data').mkdir()
+    (data_dir / 'module').write_text('print("module")')
+    return tmp_path
+
+
+@pytest.fixture
+def plan() -> InstructionPlan:
+    return InstructionPlan.from_instructions(_INSTRUCTIONS)
+
+
+def _reconcile(plan: InstructionPlan, **kwargs) -> tuple[bool, ...]:
+    removals, builds = plan_reconcile(plan, **kwargs)
+    return trim(removals) + build(builds)
+
+
+def _list_tree(root: Path) -> set[str]:
+    return {x.relative_to(root).as_posix() for x in root.rglob('*')}
+
+
+_EXPECTED_TREE = {'data', 'data/module', 'src', 'src/pkg', 'src/pkg/module.py', 'src/main.py', 'empty'}
+
+
+def test_get_children_includes_parent_directories(plan):
+    assert {
+        (): {'src', 'empty'},
+        ('src',): {'pkg', 'main.py'},
+        ('src', 'pkg'): {'module.py'},
+        ('empty',): set(),
+    } == _get_children(plan)
+
+
+def test_plan_reconcile_empty_tree_builds_all(data_tree, plan):
+    removals, builds = plan_reconcile(plan)
+    assert 0 == len(removals)
+    assert list(_INSTRUCTIONS) == list(builds)
+
+
+def test_plan_reconcile_matching_tree_is_empty(data_tree, plan):
+    assert all(build(plan))
+    removals, builds = plan_reconcile(plan)
+    assert 0 == len(removals)
+    assert 0 == len(builds)
+
+
+def test_plan_reconcile_removes_strays_in_script_directories(data_tree, plan):
+    assert all(build(plan))
+    (data_tree / 'src' / 'pkg' / 'stray' / 'deep').mkdir(parents=True)
+    (data_tree / 'src' / 'pkg' / 'stray' / 'deep' / 'file.txt').touch()
+    (data_tree / 'src' / 'other.txt').touch()
+    (data_tree / 'empty' / 'junk').touch()
+    (data_tree / 'root_file.txt').touch()
+    removals, builds = plan_reconcile(plan)
+    assert 0 == len(builds)
+    assert {
+        InstructionData(False, Path('src/other.txt')),
+        InstructionData(False, Path('src/pkg/stray/deep/file.txt')),
+        InstructionData(True, Path('src/pkg/stray/deep')),
+        InstructionData(True, Path('src/pkg/stray')),
+        InstructionData(False, Path('empty/junk')),
+    } == set(removals)
+    # Each Directory is removed after its contents
+    paths = [x.path for x in removals]
+    assert paths.index(Path('src/pkg/stray/deep/file.txt')) < paths.index(Path('src/pkg/stray/deep'))
+    assert paths.index(Path('src/pkg/stray/deep')) < paths.index(Path('src/pkg/stray'))
+    assert all(trim(removals))
+    assert _EXPECTED_TREE | {'root_file.txt'} == _list_tree(data_tree)
+
+
+def test_plan_reconcile_updates_changed_data_file(data_tree, plan):
+    assert all(build(plan))
+    (data_tree / 'src' / 'pkg' / 'module.py').write_text('print("changed")')
+    (data_tree / 'src' / 'main.py').write_text('Contents are kept')
+    assert all(_reconcile(plan))
+    assert 'print("module")' == (data_tree / 'src' / 'pkg' / 'module.py').read_text()
+    assert 'Contents are kept' == (data_tree / 'src' / 'main.py').read_text()
+
+
+def test_plan_reconcile_replaces_wrong_entry_types(data_tree, plan):
+    (data_tree / 'src' / 'pkg').mkdir(parents=True)
+    (data_tree / 'src' / 'main.py' / 'inner').mkdir(parents=True)
+    (data_tree / 'empty').touch()
+    assert all(_reconcile(plan))
+    assert _EXPECTED_TREE == _list_tree(data_tree)
+    assert (data_tree / 'src' / 'main.py').is_file()
+    assert (data_tree / 'empty').is_dir()
+
+
+def test_plan_reconcile_replaces_symlink_data_file(data_tree, plan):
+    assert all(build(plan))
+    (target := data_tree / 'target.txt').write_text('Target')
+    (module := data_tree / 'src' / 'pkg' / 'module.py').unlink()
+    module.symlink_to(target)
+    assert all(_reconcile(plan))
+    assert not module.is_symlink()
+    assert 'print("module")' == module.read_text()
+    assert 'Target' == target.read_text()
+
+
+@pytest.mark.parametrize(
+    "link_name",
+    [
+        'src',
+        'src/pkg',
+        'empty',
+    ]
+)
+def test_plan_reconcile_replaces_symlink_directory(data_tree, plan, link_name):
+    (target := data_tree / 'target').mkdir()
+    (target / 'precious.txt').write_text('Precious')
+    (link := data_tree / link_name).parent.mkdir(parents=True, exist_ok=True)
+    link.symlink_to(target, target_is_directory=True)
+    assert all(_reconcile(plan))
+    assert _EXPECTED_TREE | {'target', 'target/precious.txt'} == _list_tree(data_tree)
+    assert not link.is_symlink() and link.is_dir()
+    assert 'Precious' == (target / 'precious.txt').read_text()
+
+
+def test_plan_reconcile_protected_path_is_kept(data_tree):
+    plan = InstructionPlan.from_instructions((InstructionData(False, Path('data/module')),))
+    (data_tree / 'data' / 'keep').mkdir()
+    (data_tree / 'data' / 'keep' / 'file.txt').touch()
+    (data_tree / 'data' / 'remove.txt').touch()
+    removals, builds = plan_reconcile(plan, protected=[Path('data/keep/file.txt')])
+    assert [InstructionData(False, Path('data/remove.txt'))] == list(removals)
@@ -7,16 +7,33 @@ import pytest
 
 from test.treescript_builder.tree.conftest import get_test_dir_with_sample1, sample_treescript_1
 from treescript_builder.data.instruction_data import InstructionData
-from treescript_builder.tree.tree_builder import build
+from treescript_builder.tree.tree_builder import build, build_stream
 
 
-def test_build_one_directory_already_exists_returns_true():
+def test_build_one_directory_already_exists_returns_true(tmp_path):
+	(tmp_path / 'src').mkdir()
+	instructions = (
+		InstructionData(True, tmp_path / 'src', None),
+	)
+	assert build(instructions) == (True,)
+
+
+def test_build_one_directory_already_exists_as_file_returns_false(tmp_path):
+	(tmp_path / 'src').touch()
+	instructions = (
+		InstructionData(True, tmp_path / 'src', None),
+	)
+	assert build(instructions) == (False,)
+
+
+def test_build_one_directory_does_not_check_exists(tmp_path):
 	with pytest.MonkeyPatch().context() as m:
 		instructions = (
-			InstructionData(True, Path('./src'), None),
+			InstructionData(True, tmp_path / 'src' / 'pkg', None),
 		)
-		m.setattr(Path, 'exists', lambda _: True)
+		m.setattr(Path, 'exists', MagicMock(side_effect=AssertionError))
 		assert build(instructions) == (True,)
+	assert (tmp_path / 'src' / 'pkg').is_dir()
 
 
 def test_build_one_directory_does_not_exist_succeeds_returns_true():
@@ -71,4 +88,38 @@ def test_build_file_from_data_dir_get_sample_copies_data():
 	assert build(test_input)
 	# Validate
 	assert target_path.exists()
-	assert len(target_path.read_text()) == len(sample_treescript_1())
\ No newline at end of file
+	assert len(target_path.read_text()) == len(sample_treescript_1())
+
+def test_build_stream_yields_results_in_order(tmp_path):
+	instructions = iter((
+		InstructionData(True, tmp_path / 'src', None),
+		InstructionData(False, tmp_path / 'src' / 'data.txt', None),
+	))
+	generator = build_stream(instructions)
+	assert next(generator)
+	# The Directory is created before the next Instruction is received
+	assert (tmp_path / 'src').is_dir()
+	assert next(generator)
+	assert (tmp_path / 'src' / 'data.txt').exists()
+	assert list(generator) == []
+
+
+def test_build_parallel_jobs_creates_all_files(tmp_path):
+	instructions = []
+	for d in range(10):
+		instructions.append(InstructionData(True, tmp_path / f'dir{d}' / 'sub', None))
+		instructions.extend(
+			InstructionData(False, tmp_path / f'dir{d}' / 'sub' / f'file{f}.txt', None) for f in range(10)
+		)
+	assert build(tuple(instructions), jobs=4) == (True,) * 110
+	assert 100 == len(list(tmp_path.rglob('*.txt')))
+
+
+@pytest.mark.parametrize('copy_mode', ['auto', 'hardlink'])
+def test_build_file_from_data_dir_copy_mode_copies_data(copy_mode):
+	test_dir = get_test_dir_with_sample1()
+	target_path = (test_dir_path := Path(test_dir.name)) / "target.tree"
+	data_dir_path = test_dir_path / "data" / "sample.tree"
+	test_input = (InstructionData(False, target_path, data_dir_path),)
+	assert build(test_input, copy_mode=copy_mode) == (True,)
+	assert target_path.read_text() == sample_treescript_1()
@@ -2,10 +2,10 @@
 """
 from pathlib import Path
 import pytest
-import shutil
 
 from treescript_builder.data.instruction_data import InstructionData
-from treescript_builder.tree.tree_trimmer import trim
+from treescript_builder.tree.file_mover import FileMover
+from treescript_builder.tree.tree_trimmer import trim, trim_stream
 
 
 def mock_raise_ioerror():
@@ -39,14 +39,46 @@ def test_trim_file_error_returns_false():
 		assert not results[0]
 
 
-def mock_move_method(src, dest):
+def mock_move_method(self, src, dest):
 	return True
 
 
 def test_trim_file_with_data_label_returns_true():
 	with pytest.MonkeyPatch().context() as c:
-		c.setattr(shutil, 'move', mock_move_method)
-		i = (InstructionData(False, Path('data.txt'), 'data.csv'), )
+		c.setattr(FileMover, 'move', mock_move_method)
+		i = (InstructionData(False, Path('data.txt'), Path('data.csv')), )
 		results = trim(i)
 		assert len(results) == 1
-		assert results[0]
\ No newline at end of file
+		assert results[0]
+
+def test_trim_stream_yields_results_in_order(tmp_path):
+	(src_dir := tmp_path / 'src').mkdir()
+	(src_dir / 'data.txt').touch()
+	instructions = iter((
+		InstructionData(False, src_dir / 'data.txt', None),
+		InstructionData(True, src_dir, None),
+	))
+	assert list(trim_stream(instructions)) == [True, True]
+	assert not src_dir.exists()
+
+
+def test_trim_parallel_jobs_removes_tree(tmp_path):
+	instructions = []
+	for d in range(10):
+		(sub_dir := tmp_path / f'dir{d}' / 'sub').mkdir(parents=True)
+		for f in range(10):
+			(sub_dir / f'file{f}.txt').touch()
+			instructions.append(InstructionData(False, sub_dir / f'file{f}.txt', None))
+		instructions.append(InstructionData(True, sub_dir, None))
+		instructions.append(InstructionData(True, sub_dir.parent, None))
+	assert trim(tuple(instructions), jobs=4) == (True,) * 120
+	assert list(tmp_path.iterdir()) == []
+
+
+def test_trim_file_with_data_label_moves_file(tmp_path):
+	(data_dir := tmp_path / 'data').mkdir()
+	(tmp_path / 'data.txt').write_text('Contents')
+	i = (InstructionData(False, tmp_path / 'data.txt', data_dir / 'label'), )
+	assert trim(i) == (True,)
+	assert not (tmp_path / 'data.txt').exists()
+	assert 'Contents' == (data_dir / 'label').read_text()
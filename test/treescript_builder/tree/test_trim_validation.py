@@ -8,7 +8,9 @@ from test.treescript_builder.tree.conftest import generate_simple_tree, generate
     generate_python_package_tree, generate_complex_tree, generate_gradle_module_tree_with_data, \
     generate_invalid_tree_line_1, generate_invalid_tree_line_2
 from treescript_builder.data.instruction_data import InstructionData
-from treescript_builder.tree.trim_validation import validate_trim
+from treescript_builder.data.tree_store import TreeStore
+from treescript_builder.input.line_reader import read_input_store
+from treescript_builder.tree.trim_validation import plan_trim, validate_trim
 
 
 _DATA_DIR_PATH = Path('.ftb/data/')
@@ -136,3 +138,31 @@ def test_validate_trim_with_data_dir_invalid_tree_raises_exit(generator):
         c.setattr(Path, 'exists', lambda _: True)
         with pytest.raises(SystemExit):
             validate_trim(generator, _DATA_DIR_PATH)
+
+
+def test_validate_trim_tree_store_complex_tree_returns_data():
+    store = TreeStore()
+    for node in generate_complex_tree():
+        store.append_node(node)
+    assert validate_trim(store) == validate_trim(generate_complex_tree())
+
+
+def test_plan_trim_complex_tree_returns_plan():
+    assert tuple(plan_trim(generate_complex_tree())) == validate_trim(generate_complex_tree())
+
+
+@pytest.mark.parametrize(
+    'generator', [
+        generate_simple_tree, generate_gradle_module_tree, generate_python_package_tree, generate_complex_tree,
+    ]
+)
+def test_plan_trim_tree_store_matches_generator(generator):
+    store = TreeStore()
+    for node in generator():
+        store.append_node(node)
+    assert tuple(plan_trim(store)) == validate_trim(generator())
+
+
+def test_plan_trim_tree_store_invalid_tree_raises_exit():
+    with pytest.raises(SystemExit, match='Invalid Tree Indentation on Line: 2'):
+        plan_trim(read_input_store("src/\n    data.txt"))
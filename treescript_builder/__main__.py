@@ -7,8 +7,23 @@ def main():
     from treescript_builder.input import validate_input_arguments
     input_data = validate_input_arguments(argv[1:])
     #
-    from treescript_builder.tree import build_tree
-    build_tree(input_data)
+    if input_data.is_pipelined:
+        from treescript_builder.tree import stream_tree
+        for _ in stream_tree(input_data):
+            pass
+    else:
+        from treescript_builder.tree import build_tree
+        build_tree(input_data)
+
+
+def migrate():
+    # Author: DK96-OS 2024 - 2025
+    from sys import argv
+    from treescript_builder.input import validate_migrate_arguments
+    data_dir = validate_migrate_arguments(argv[1:])
+    #
+    from treescript_builder.data.data_directory import migrate_to_sharded
+    print(f"Moved {migrate_to_sharded(data_dir)} Files into the sharded layout.")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 """ Data Directory Management.
  Author: DK96-OS 2024 - 2025
 """
+from hashlib import sha256
+from os import rename, replace, scandir, stat
+from os.path import isfile, lexists
 from pathlib import Path
 from sys import exit
-from typing import Callable
+from time import time_ns
+from typing import Callable, Iterable
 
 from treescript_builder.data.tree_data import TreeData
 from treescript_builder.input.string_validation import validate_data_label
@@ -16,12 +20,32 @@ _DATA_LABEL_INVALID_MSG = 'Invalid Data Label on line: '
 _DATA_LABEL_DUPLICATE_MSG = 'Duplicate DataLabels Are Not Allowed In This Operation. Found Duplicate on Line: '
 _DATA_LABEL_NOT_FOUND_MSG = 'Label not found in DataDirectory on Line: '
 _DATA_FILE_EXISTS_MSG = 'Data File already exists on Line: '
+_DATA_MANIFEST_INVALID_MSG = 'The Data Manifest could not be read.'
+_DATA_DIR_NOT_SHARDED_MSG = 'The DataDirectory contains DataLabel Files or blobs. Migrate it to the sharded layout with ftb-migrate.'
+_DATA_MIGRATION_FAILED_MSG = 'The DataDirectory migration failed for: '
+
+_INDEX_FILE_NAME = '.ftb_index'
+_INDEX_FILE_HEADER = 'ftb-index 1'
+
+_MANIFEST_FILE_NAME = '.ftb_manifest'
+_MANIFEST_FILE_HEADER = 'ftb-manifest 1'
+_MANIFEST_TEMP_FILE_NAME = '.ftb_manifest.tmp'
+_BLOB_DIR_NAME = '.ftb_blobs'
+
+_SHARDED_FILE_NAME = '.ftb_sharded'
+_MIGRATION_DIR_NAME = '.ftb_migration'
+_SHARD_CHARS = frozenset('0123456789abcdef')
+
+# The names in the DataDirectory that are not DataLabels
+_RESERVED_NAMES = frozenset((
+    _INDEX_FILE_NAME, _MANIFEST_FILE_NAME, _MANIFEST_TEMP_FILE_NAME, _BLOB_DIR_NAME, _SHARDED_FILE_NAME, _MIGRATION_DIR_NAME,
+))
 
 
 def _validate_node_data_label(node: TreeData) -> str | None:
     if node.data_label == '': # For compatibility with 0.1.x
         return None
-    if not validate_data_label(data_label := node.get_data_label()):
+    if not validate_data_label(data_label := node.get_data_label()) or data_label in _RESERVED_NAMES:
         exit(_DATA_LABEL_INVALID_MSG + str(node.line_number))
     return data_label
 
@@ -29,19 +53,55 @@ def _validate_node_data_label(node: TreeData) -> str | None:
 class DataDirectory:
     """ Manages Access to the Data Directory.
  - Search for a Data Label, and obtain the Path to the Data File.
+ - The Directory is scanned once, on the first search, into an index of DataLabels.
+
+ - When the index is persisted, it is stored in a sidecar file inside the Directory, and reloaded while the Directory is unchanged.
+
+ - In the content-addressed layout, a manifest maps DataLabels to the SHA-256 digest of their contents.
+ - Each distinct content is stored once, as a blob named by its digest. DataLabel Files may also be present.
+ - In the sharded layout, each DataLabel File is stored two Directories deep, named by the start of the DataLabel digest.
+ - DataLabels are found with one lookup each, instead of a scan of the DataDirectory. Blobs are sharded by their digest.
 
 **Method Summary:**
  - validate_build(TreeData): Path?
  - validate_trim(TreeData): Path?
+ - get_fingerprint(): bytes
+ - is_content_addressed(): bool
+ - get_blob_path(str): Path
+ - has_blob(str): bool
+ - add_blob_labels(dict[str, str]): bool
+ - is_sharded(): bool
+ - make_shard_dirs(Iterable[Path?])
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        use_index: bool = False,
+        rebuild_index: bool = False,
+        content_addressed: bool = False,
+        sharded: bool = False,
+    ):
         if not isinstance(data_dir, Path):
             raise TypeError
         elif not data_dir.exists():
             exit(_DATA_DIR_PATH_DOES_NOT_EXIST_MSG)
         self._data_dir: Path = data_dir
         self._expected_trim_data: set[str] = set()
+        self._label_index: set[str] | None = None
+        self._is_sharded = isfile(data_dir / _SHARDED_FILE_NAME)
+        if sharded and not self._is_sharded:
+            _create_sharded_layout(data_dir)
+            self._is_sharded = True
+        # Whether each DataLabel that has been searched for exists, in the sharded layout
+        self._sharded_labels: dict[str, bool] = {}
+        self._shard_dirs: set[Path] = set()
+        if (use_index or rebuild_index) and not self._is_sharded:
+            self._label_index = _load_persisted_index(data_dir, rebuild_index)
+        # The digest of each DataLabel in the manifest, when the layout is content-addressed
+        self._manifest: dict[str, str] | None = _read_manifest_file(data_dir / _MANIFEST_FILE_NAME)
+        if self._manifest is None and content_addressed:
+            self._manifest = {}
 
     def validate_build(self, node: TreeData) -> Path | None:
         """ Determine if the Data File supporting this Tree node is available.
@@ -82,10 +142,104 @@ class DataDirectory:
         # Check if the DataFile already exists
         if self._search_label(data_label) is not None:
             exit(_DATA_FILE_EXISTS_MSG + str(node.line_number))
-        # Add the new DataLabel to the collection
+        # Add the new DataLabel to the collection, and reserve it in the index
         self._expected_trim_data.add(data_label)
+        if self._is_sharded:
+            self._sharded_labels[data_label] = True
+        else:
+            self._get_label_index().add(data_label)
         # Return the DataLabel Path
-        return self._data_dir / data_label
+        return self._get_label_path(data_label)
+
+    def get_fingerprint(self) -> bytes:
+        """ Obtain a digest of the DataDirectory Path and the DataLabels it contains.
+ - Obtain the fingerprint before validating trim nodes, which reserve their DataLabels in the index.
+ - In the sharded layout, the marker generation is used instead of the DataLabels. It changes when trim or migration adds DataLabel Files.
+
+**Returns:**
+ bytes - The SHA-256 digest of the Directory Path, as given and absolute, and the sorted DataLabels.
+        """
+        digest = sha256(f'{self._data_dir}\0{self._data_dir.absolute()}'.encode(errors='surrogateescape'))
+        if self._is_sharded:
+            # The marker changes whenever DataLabel Files are added, so the shards are not scanned
+            digest.update(b'\0' + _SHARDED_FILE_NAME.encode() + b'\0' + _read_sharded_marker(self._data_dir))
+        else:
+            for label in sorted(self._get_label_index()):
+                digest.update(b'\0' + label.encode(errors='surrogateescape'))
+        if self._manifest is not None:
+            for label, blob in sorted(self._manifest.items()):
+                digest.update(f'\n{blob} {label}'.encode(errors='surrogateescape'))
+        return digest.digest()
+
+    def is_content_addressed(self) -> bool:
+        """ Determine whether the DataDirectory has a manifest, or was created with the content-addressed layout.
+        """
+        return self._manifest is not None
+
+    def get_blob_path(self, digest: str) -> Path:
+        """ Obtain the Path to the blob with the given content digest.
+
+**Parameters:**
+ - digest (str): The hexadecimal SHA-256 digest of the content.
+
+**Returns:**
+ Path - The Path to the blob, which may not exist.
+        """
+        if self._is_sharded:
+            return self._data_dir / _BLOB_DIR_NAME / digest[0:2] / digest[2:4] / digest
+        return self._data_dir / _BLOB_DIR_NAME / digest
+
+    def has_blob(self, digest: str) -> bool:
+        """ Determine whether the content with the given digest is stored in the DataDirectory.
+
+**Parameters:**
+ - digest (str): The hexadecimal SHA-256 digest of the content.
+
+**Returns:**
+ bool - True when the blob exists.
+        """
+        return self.get_blob_path(digest).is_file()
+
+    def add_blob_labels(self, labels: dict[str, str]) -> bool:
+        """ Add DataLabels to the manifest, and write it to the DataDirectory.
+ - The manifest is written to a temporary file, which then replaces it.
+
+**Parameters:**
+ - labels (dict[str, str]): The digest of the blob for each new DataLabel.
+
+**Returns:**
+ bool - Whether the manifest was written. When it was not, the DataLabels are not added.
+        """
+        manifest = {} if self._manifest is None else dict(self._manifest)
+        manifest.update(labels)
+        if not _write_manifest_file(self._data_dir / _MANIFEST_FILE_NAME, manifest):
+            return False
+        self._manifest = manifest
+        return True
+
+    def is_sharded(self) -> bool:
+        """ Determine whether the DataLabel Files are stored in the sharded layout.
+        """
+        return self._is_sharded
+
+    def make_shard_dirs(self, data_paths: Iterable[Path | None]):
+        """ Create the shard Directories that will contain new DataLabel Files, before they are moved there.
+ - Each Directory is created at most once. A Directory that cannot be created causes its Files to fail when moved.
+ - The sharded marker is rewritten before the first Directory, so that the fingerprint changes.
+
+**Parameters:**
+ - data_paths (Iterable[Path?]): The Paths to the new DataLabel Files, where None is ignored.
+        """
+        for data_path in data_paths:
+            if data_path is None or (shard_dir := data_path.parent) in self._shard_dirs:
+                continue
+            if len(self._shard_dirs) == 0:
+                _write_sharded_marker(self._data_dir)
+            self._shard_dirs.add(shard_dir)
+            try:
+                shard_dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                pass
 
     def _search_label(self, data_label: str) -> Path | None:
         """ Search for a DataLabel in this DataDirectory.
@@ -96,12 +250,354 @@ class DataDirectory:
 **Returns:**
  Path? - The Path to the DataFile, or None.
         """
+        if self._manifest is not None and (digest := self._manifest.get(data_label)) is not None:
+            return self.get_blob_path(digest)
+        if self._is_sharded:
+            data_path = self._get_label_path(data_label)
+            if (is_found := self._sharded_labels.get(data_label)) is None:
+                self._sharded_labels[data_label] = is_found = lexists(data_path)
+            return data_path if is_found else None
+        if data_label in self._get_label_index():
+            return self._data_dir / data_label
+        return None
+
+    def _get_label_path(self, data_label: str) -> Path:
+        """ Obtain the Path to the File of a DataLabel, in the layout of this DataDirectory.
+        """
+        if self._is_sharded:
+            shard = _get_label_shard(data_label)
+            return self._data_dir / shard[0:2] / shard[2:4] / data_label
+        return self._data_dir / data_label
+
+    def _get_label_index(self) -> set[str]:
+        """ Obtain the index of DataLabels, scanning the DataDirectory on first use.
+
+**Returns:**
+ set[str] - The names of the entries in the DataDirectory.
+        """
+        if self._label_index is None:
+            self._label_index = _scan_data_dir(self._data_dir)
+        return self._label_index
+
+
+def _scan_data_dir(data_dir: Path) -> set[str]:
+    """ Scan the DataDirectory once, and collect the names of its entries.
+
+**Parameters:**
+ - data_dir (Path): The Path to the DataDirectory.
+
+**Returns:**
+ set[str] - The entry names, or an empty set if the directory could not be read.
+    """
+    try:
+        with scandir(data_dir) as entries:
+            labels = {entry.name for entry in entries}
+    except OSError:
+        return set()
+    return labels - _RESERVED_NAMES
+
+
+def _load_persisted_index(
+    data_dir: Path,
+    rebuild: bool = False,
+) -> set[str]:
+    """ Load the DataLabel index from the sidecar file, or scan the DataDirectory and persist a new index.
+ - The index is valid while the device, inode and modification time of the Directory are unchanged.
+ - The sidecar file is created before the Directory is stat'd, so that creating it does not invalidate the index.
+
+**Parameters:**
+ - data_dir (Path): The Path to the DataDirectory.
+ - rebuild (bool): Whether to ignore the existing index file, and always rescan. Default: False.
+
+**Returns:**
+ set[str] - The names of the entries in the DataDirectory.
+    """
+    index_path = data_dir / _INDEX_FILE_NAME
+    if not rebuild and (labels := _read_index_file(index_path, _get_dir_signature(data_dir))) is not None:
+        return labels
+    try:
+        index_path.touch(exist_ok=True)
+    except OSError: # The index cannot be persisted
+        return _scan_data_dir(data_dir)
+    signature = _get_dir_signature(data_dir)
+    labels = _scan_data_dir(data_dir)
+    if signature is not None:
+        _write_index_file(index_path, signature, labels)
+    return labels
+
+
+def _get_dir_signature(data_dir: Path) -> str | None:
+    """ Obtain the device, inode and modification time of the DataDirectory, as a string.
+
+**Parameters:**
+ - data_dir (Path): The Path to the DataDirectory.
+
+**Returns:**
+ str? - The Directory signature, or None if the Directory could not be stat'd.
+    """
+    try:
+        dir_stat = stat(data_dir)
+    except OSError:
+        return None
+    return f'{dir_stat.st_dev} {dir_stat.st_ino} {dir_stat.st_mtime_ns}'
+
+
+def _read_index_file(
+    index_path: Path,
+    signature: str | None,
+) -> set[str] | None:
+    """ Read the DataLabel index from the sidecar file, if it matches the Directory signature.
+
+**Parameters:**
+ - index_path (Path): The Path to the index file.
+ - signature (str?): The current signature of the DataDirectory.
+
+**Returns:**
+ set[str]? - The DataLabels in the index, or None if the index is missing, stale or incomplete.
+    """
+    if signature is None:
+        return None
+    try:
+        lines = index_path.read_text(encoding='utf-8').split('\n')
+    except (OSError, UnicodeDecodeError):
+        return None
+    # Header Line: format version, label count, then the Directory signature
+    header = lines[0].split(' ', 3)
+    if len(header) != 4 or f'{header[0]} {header[1]}' != _INDEX_FILE_HEADER or header[3] != signature:
+        return None
+    labels = lines[1:-1]
+    # The label count detects an index file that was only partially written
+    if not header[2].isdecimal() or int(header[2]) != len(labels) or lines[-1] != '':
+        return None
+    return set(labels)
+
+
+def _write_index_file(
+    index_path: Path,
+    signature: str,
+    labels: set[str],
+):
+    """ Write the DataLabel index to the sidecar file.
+ - The file already exists, so writing it does not modify the Directory.
+ - Names containing line breaks cannot be valid DataLabels, and are not written.
+
+**Parameters:**
+ - index_path (Path): The Path to the index file.
+ - signature (str): The signature of the DataDirectory when it was scanned.
+ - labels (set[str]): The DataLabels found in the DataDirectory.
+    """
+    names = [x for x in labels if '\n' not in x and '\r' not in x]
+    try:
+        with index_path.open('w', encoding='utf-8', newline='\n') as index_file:
+            index_file.write(f'{_INDEX_FILE_HEADER} {len(names)} {signature}\n')
+            for name in names:
+                index_file.write(name + '\n')
+    except OSError:
+        pass
+
+
+def _get_label_shard(data_label: str) -> str:
+    """ Obtain the four hexadecimal characters that name the shard Directories of a DataLabel.
+    """
+    return sha256(data_label.encode(errors='surrogateescape')).hexdigest()[0:4]
+
+
+def _is_shard_name(name: str) -> bool:
+    return len(name) == 2 and _SHARD_CHARS.issuperset(name)
+
+
+def _create_sharded_layout(data_dir: Path):
+    """ Mark a DataDirectory without DataLabel Files or blobs as sharded.
+
+**Parameters:**
+ - data_dir (Path): The Path to the DataDirectory.
+
+**Raises:**
+ SystemExit - When the DataDirectory contains DataLabel Files or flat blobs, or cannot be marked.
+    """
+    if len(_scan_data_dir(data_dir)) > 0 or len(_scan_label_files(data_dir / _BLOB_DIR_NAME)) > 0:
+        exit(_DATA_DIR_NOT_SHARDED_MSG)
+    _write_sharded_marker(data_dir)
+
+
+def _write_sharded_marker(data_dir: Path):
+    """ Write a new generation into the sharded marker, which the fingerprint is computed from.
+
+**Raises:**
+ SystemExit - When the marker cannot be written.
+    """
+    try:
+        (data_dir / _SHARDED_FILE_NAME).write_text(f'{time_ns()}\n')
+    except OSError:
+        exit(_DATA_MIGRATION_FAILED_MSG + _SHARDED_FILE_NAME)
+
+
+def _read_sharded_marker(data_dir: Path) -> bytes:
+    try:
+        return (data_dir / _SHARDED_FILE_NAME).read_bytes()
+    except OSError:
+        return b''
+
+
+def migrate_to_sharded(data_dir: Path) -> int:
+    """ Move the DataLabel Files of a flat DataDirectory into the sharded layout, then mark it as sharded.
+ - Blobs of the content-addressed layout are moved into shards by their digest.
+ - A DataLabel named like a shard Directory is moved aside first, so that the shard Directory can be created.
+ - A migration that was interrupted continues when it is run again.
+
+**Parameters:**
+ - data_dir (Path): The Path to the DataDirectory.
+
+**Returns:**
+ int - The number of Files that were moved.
+
+**Raises:**
+ SystemExit - When a File cannot be moved.
+    """
+    if not data_dir.is_dir():
+        exit(_DATA_DIR_PATH_DOES_NOT_EXIST_MSG)
+    pending_dir = data_dir / _MIGRATION_DIR_NAME
+    labels = _scan_label_files(data_dir)
+    if len(conflicts := [x for x in labels if _is_shard_name(x)]) > 0:
+        _move_files(data_dir, conflicts, lambda name: pending_dir / name)
+    count = _move_files(data_dir, [x for x in labels if not _is_shard_name(x)], _get_sharded_path(data_dir))
+    if pending_dir.is_dir():
+        count += _move_files(pending_dir, _scan_label_files(pending_dir), _get_sharded_path(data_dir))
         try:
-            return next(self._data_dir.glob(data_label))
-        except StopIteration:
-            return None
+            pending_dir.rmdir()
         except OSError:
-            return None
+            exit(_DATA_MIGRATION_FAILED_MSG + _MIGRATION_DIR_NAME)
+    if (blob_dir := data_dir / _BLOB_DIR_NAME).is_dir():
+        count += _move_files(
+            blob_dir,
+            [x for x in _scan_label_files(blob_dir) if len(x) > 4],
+            lambda name: blob_dir / name[0:2] / name[2:4] / name,
+        )
+    try:
+        # The persisted index of the flat layout is no longer used
+        (data_dir / _INDEX_FILE_NAME).unlink(missing_ok=True)
+    except OSError:
+        exit(_DATA_MIGRATION_FAILED_MSG + _INDEX_FILE_NAME)
+    _write_sharded_marker(data_dir)
+    return count
+
+
+def _get_sharded_path(data_dir: Path) -> Callable[[str], Path]:
+    def _get_path(data_label: str) -> Path:
+        shard = _get_label_shard(data_label)
+        return data_dir / shard[0:2] / shard[2:4] / data_label
+    return _get_path
+
+
+def _scan_label_files(path: Path) -> list[str]:
+    """ Collect the names of the entries in a Directory that are not Directories or reserved names.
+    """
+    try:
+        with scandir(path) as entries:
+            return [x.name for x in entries if x.name not in _RESERVED_NAMES and not x.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+
+
+def _move_files(
+    source_dir: Path,
+    names: list[str],
+    get_path: Callable[[str], Path],
+) -> int:
+    """ Move Files out of a Directory, creating each target Directory once.
+
+**Parameters:**
+ - source_dir (Path): The Directory containing the Files.
+ - names (list[str]): The names of the Files to move.
+ - get_path (Callable[[str], Path]): Obtains the new Path of a File, from its name.
+
+**Returns:**
+ int - The number of Files that were moved.
+
+**Raises:**
+ SystemExit - When a File cannot be moved.
+    """
+    created: set[Path] = set()
+    for name in names:
+        path = get_path(name)
+        try:
+            if (parent := path.parent) not in created:
+                parent.mkdir(parents=True, exist_ok=True)
+                created.add(parent)
+            rename(source_dir / name, path)
+        except OSError:
+            exit(_DATA_MIGRATION_FAILED_MSG + name)
+    return len(names)
+
+
+def _read_manifest_file(manifest_path: Path) -> dict[str, str] | None:
+    """ Read the manifest of the content-addressed layout.
+
+**Parameters:**
+ - manifest_path (Path): The Path to the manifest file.
+
+**Returns:**
+ dict[str, str]? - The digest of the blob for each DataLabel, or None if there is no manifest.
+
+**Raises:**
+ SystemExit - When the manifest exists, but is incomplete or cannot be read.
+    """
+    try:
+        lines = manifest_path.read_text(encoding='utf-8').split('\n')
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError):
+        exit(_DATA_MANIFEST_INVALID_MSG)
+    # Header Line: format version, then the label count
+    header = lines[0].rsplit(' ', 1)
+    if len(header) != 2 or header[0] != _MANIFEST_FILE_HEADER or not header[1].isdecimal():
+        exit(_DATA_MANIFEST_INVALID_MSG)
+    # Each Line: the blob digest, then the DataLabel
+    entries = [x.split(' ', 1) for x in lines[1:-1]]
+    if int(header[1]) != len(entries) or lines[-1] != '' or any(len(x) != 2 for x in entries):
+        exit(_DATA_MANIFEST_INVALID_MSG)
+    return {label: digest for digest, label in entries}
+
+
+def _write_manifest_file(
+    manifest_path: Path,
+    manifest: dict[str, str],
+) -> bool:
+    """ Write the manifest of the content-addressed layout, replacing the previous manifest.
+
+**Parameters:**
+ - manifest_path (Path): The Path to the manifest file.
+ - manifest (dict[str, str]): The digest of the blob for each DataLabel.
+
+**Returns:**
+ bool - Whether the manifest was written.
+    """
+    temp_path = manifest_path.with_name(_MANIFEST_TEMP_FILE_NAME)
+    try:
+        with temp_path.open('w', encoding='utf-8', newline='\n') as manifest_file:
+            manifest_file.write(f'{_MANIFEST_FILE_HEADER} {len(manifest)}\n')
+            for label, digest in sorted(manifest.items()):
+                manifest_file.write(f'{digest} {label}\n')
+        replace(temp_path, manifest_path)
+    except OSError:
+        return False
+    return True
+
+
+def get_data_directory(
+    data_dir: Path | DataDirectory | None,
+) -> DataDirectory | None:
+    """ Obtain a DataDirectory for a Tree Validation operation.
+
+**Parameters:**
+ - data_dir (Path | DataDirectory | None): A configured DataDirectory, or a Path to create one with the default options.
+
+**Returns:**
+ DataDirectory? - The DataDirectory, or None if no DataDirectory was provided.
+    """
+    if data_dir is None or isinstance(data_dir, DataDirectory):
+        return data_dir
+    return DataDirectory(data_dir)
 
 
 def get_data_dir_validator(
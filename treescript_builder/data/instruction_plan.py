@@ -0,0 +1,391 @@
+""" Compact Instruction Plan.
+ - Stores each Instruction as a parent Directory id, a name id and an optional Data Path id.
+ - Each Directory is stored once, as its parent Directory id and a name id.
+ - Paths are created only when an Instruction is read.
+ Author: DK96-OS 2024 - 2025
+"""
+from array import array
+from pathlib import Path
+from struct import Struct, error as StructError
+from typing import Generator, Iterable
+
+from treescript_builder.data.instruction_data import InstructionData
+
+
+_ROOT_ID = -1
+_ENCODING = 'utf-8'
+# Undecodable bytes in a Path are stored as surrogates, as os.fsdecode does
+_ERRORS = 'surrogateescape'
+# The number of Directories, Instructions, names and Data Paths in an encoded Plan
+_HEADER = Struct('<4Q')
+
+
+class InstructionPlan:
+    """ A sequence of Instructions, stored as a parent-indexed tree of names.
+ - Plan memory is proportional to the number of Instructions and unique names, rather than the total Path length.
+ - Iterating the Plan provides InstructionData, with Paths created on demand.
+
+**Method Summary:**
+ - append(InstructionData)
+ - append_entry(bool, int, str, Path?)
+ - get_dir_id(int, str): int
+ - find_dir_id(int, str): int?
+ - get_dir_count(): int
+ - get_path(int): Path
+ - get_parent(int): int
+ - get_name(int): str
+ - get_data_path(int): Path?
+ - is_dir(int): bool
+ - get_dir_parts(int): tuple[str]
+ - get_dir_parent(int): int
+ - get_dir_name(int): str
+ - iter_entries: Generator[tuple[bool, tuple[str], str, Path?]]
+ - select(Iterable[int]): InstructionPlan
+ - to_bytes(): bytes
+ - from_bytes(bytes): InstructionPlan
+    """
+
+    def __init__(self):
+        # The Directory tree: the parent id and name id of each Directory
+        self._dir_parents = array('i')
+        self._dir_names = array('I')
+        self._dir_ids: dict[tuple[int, int], int] = {}
+        # The Instructions
+        self._parents = array('i')
+        self._names = array('I')
+        self._dir_bits = bytearray()
+        self._data = array('I')
+        # The tables of unique names and Data Paths, where id zero is empty
+        self._strings: list[str] = ['']
+        self._string_ids: dict[str, int] = {'': 0}
+        self._data_paths: list[Path | None] = [None]
+        self._data_ids: dict[Path, int] = {}
+        # The most recent parent Path, so sibling Instructions resolve it once
+        self._last_parent: tuple[Path | None, int] = (None, _ROOT_ID)
+
+    @classmethod
+    def from_instructions(
+        cls,
+        instructions: Iterable[InstructionData],
+    ) -> 'InstructionPlan':
+        """ Create a Plan containing every Instruction, in order.
+
+**Parameters:**
+ - instructions (Iterable[InstructionData]): The Instructions, such as a Tree Validation generator.
+
+**Returns:**
+ InstructionPlan - The compact Plan.
+        """
+        plan = cls()
+        for i in instructions:
+            plan.append(i)
+        plan._last_parent = (None, _ROOT_ID)
+        return plan
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def __getitem__(self, index: int) -> InstructionData:
+        if index < 0:
+            index += len(self._parents)
+        return InstructionData(self.is_dir(index), self.get_path(index), self.get_data_path(index))
+
+    def __iter__(self) -> Generator[InstructionData, None, None]:
+        """ Provide an InstructionData for each entry, created only when it is reached.
+ - Consecutive entries in the same Directory share one parent Path.
+        """
+        dir_id, dir_path = _ROOT_ID - 1, Path()
+        for index in range(len(self._parents)):
+            if (parent := self._parents[index]) != dir_id:
+                dir_id, dir_path = parent, Path(*self.get_dir_parts(parent))
+            yield InstructionData(
+                self.is_dir(index),
+                dir_path / self._strings[self._names[index]],
+                self._data_paths[self._data[index]],
+            )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, InstructionPlan):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def append(self, i: InstructionData):
+        """ Add an Instruction to the end of the Plan.
+
+**Parameters:**
+ - i (InstructionData): The Instruction to add.
+        """
+        if (parent := i.path.parent) == self._last_parent[0]:
+            parent_id = self._last_parent[1]
+        else:
+            parent_id = _ROOT_ID
+            for name in parent.parts:
+                parent_id = self.get_dir_id(parent_id, name)
+            self._last_parent = (parent, parent_id)
+        self.append_entry(i.is_dir, parent_id, i.path.name, i.data_path)
+
+    def append_entry(
+        self,
+        is_dir: bool,
+        parent_id: int,
+        name: str,
+        data_path: Path | None = None,
+    ):
+        """ Add an Instruction to the end of the Plan, given the id of its parent Directory.
+
+**Parameters:**
+ - is_dir (bool): Whether the Instruction relates to a Directory.
+ - parent_id (int): The id of the parent Directory, from get_dir_id, or -1 for the root.
+ - name (str): The name of the File or Directory.
+ - data_path (Path?): The Data Directory Path of the Instruction, if applicable. Default: None.
+        """
+        index = len(self._parents)
+        self._parents.append(parent_id)
+        self._names.append(self._get_string_id(name))
+        if (byte_index := index >> 3) == len(self._dir_bits):
+            self._dir_bits.append(0)
+        if is_dir:
+            self._dir_bits[byte_index] |= 1 << (index & 7)
+        self._data.append(self._get_data_id(data_path))
+
+    def get_dir_id(
+        self,
+        parent_id: int,
+        name: str,
+    ) -> int:
+        """ Obtain the id of a Directory, adding it to the Directory tree if it is new.
+
+**Parameters:**
+ - parent_id (int): The id of the parent Directory, or -1 for the root.
+ - name (str): The name of the Directory.
+
+**Returns:**
+ int - The id of the Directory.
+        """
+        key = (parent_id, self._get_string_id(name))
+        if (dir_id := self._dir_ids.get(key)) is None:
+            self._dir_ids[key] = dir_id = len(self._dir_parents)
+            self._dir_parents.append(parent_id)
+            self._dir_names.append(key[1])
+        return dir_id
+
+    def find_dir_id(
+        self,
+        parent_id: int,
+        name: str,
+    ) -> int | None:
+        """ Find the id of a Directory, without adding it to the Directory tree.
+
+**Parameters:**
+ - parent_id (int): The id of the parent Directory, or -1 for the root.
+ - name (str): The name of the Directory.
+
+**Returns:**
+ int? - The id of the Directory, or None if it is not in the Directory tree.
+        """
+        if (name_id := self._string_ids.get(name)) is None:
+            return None
+        return self._dir_ids.get((parent_id, name_id))
+
+    def get_dir_count(self) -> int:
+        return len(self._dir_parents)
+
+    def get_path(self, index: int) -> Path:
+        """ Create the Path of an Instruction.
+
+**Parameters:**
+ - index (int): The index of the Instruction.
+
+**Returns:**
+ Path - The Path of the Instruction.
+        """
+        return Path(*self.get_dir_parts(self._parents[index]), self.get_name(index))
+
+    def get_parent(self, index: int) -> int:
+        return self._parents[index]
+
+    def get_name(self, index: int) -> str:
+        return self._strings[self._names[index]]
+
+    def get_data_path(self, index: int) -> Path | None:
+        return self._data_paths[self._data[index]]
+
+    def is_dir(self, index: int) -> bool:
+        return (self._dir_bits[index >> 3] >> (index & 7)) & 1 == 1
+
+    def get_dir_parts(self, dir_id: int) -> tuple[str, ...]:
+        """ Obtain the names in the Path of a Directory, from the root.
+
+**Parameters:**
+ - dir_id (int): The id of the Directory, or -1 for the root.
+
+**Returns:**
+ tuple[str] - The Directory names, which are empty for the root.
+        """
+        parts = []
+        while dir_id != _ROOT_ID:
+            parts.append(self._strings[self._dir_names[dir_id]])
+            dir_id = self._dir_parents[dir_id]
+        parts.reverse()
+        return tuple(parts)
+
+    def get_dir_parent(self, dir_id: int) -> int:
+        return self._dir_parents[dir_id]
+
+    def get_dir_name(self, dir_id: int) -> str:
+        return self._strings[self._dir_names[dir_id]]
+
+    def iter_entries(self) -> Generator[tuple[bool, tuple[str, ...], str, Path | None], None, None]:
+        """ Provide the fields of each entry, without creating the Instruction Path.
+ - Consecutive entries in the same Directory share one tuple of parent names.
+
+**Yields:**
+ tuple[bool, tuple[str], str, Path?] - Whether the entry is a Directory, the parent Directory names, the name, and the Data Path.
+        """
+        dir_id, dir_parts = _ROOT_ID - 1, ()
+        for index in range(len(self._parents)):
+            if (parent := self._parents[index]) != dir_id:
+                dir_id, dir_parts = parent, self.get_dir_parts(parent)
+            yield (
+                self.is_dir(index),
+                dir_parts,
+                self._strings[self._names[index]],
+                self._data_paths[self._data[index]],
+            )
+
+    def select(self, indices: Iterable[int]) -> 'InstructionPlan':
+        """ Create a Plan containing the chosen Instructions of this Plan.
+ - Only the Directories required by the chosen Instructions are added to the new Plan.
+
+**Parameters:**
+ - indices (Iterable[int]): The indices of the chosen Instructions, in the order they are added.
+
+**Returns:**
+ InstructionPlan - The new Plan.
+        """
+        plan = InstructionPlan()
+        # The id in the new Plan of each Directory in this Plan
+        dir_ids: dict[int, int] = {_ROOT_ID: _ROOT_ID}
+        for index in indices:
+            if (parent_id := dir_ids.get(dir_id := self._parents[index])) is None:
+                # Map the nearest mapped ancestor, then each Directory below it
+                unmapped = []
+                while (parent_id := dir_ids.get(dir_id)) is None:
+                    unmapped.append(dir_id)
+                    dir_id = self._dir_parents[dir_id]
+                for dir_id in reversed(unmapped):
+                    dir_ids[dir_id] = parent_id = plan.get_dir_id(parent_id, self.get_dir_name(dir_id))
+            plan.append_entry(self.is_dir(index), parent_id, self.get_name(index), self.get_data_path(index))
+        return plan
+
+    def to_bytes(self) -> bytes:
+        """ Encode the Plan in a compact binary format.
+ - A header of section sizes, followed by each array in native byte order.
+ - The names and Data Paths are UTF-8 encoded, after an array of their encoded lengths.
+ - Surrogate escaped characters are encoded as the original bytes, so every Path can be encoded.
+
+**Returns:**
+ bytes - The encoded Plan.
+        """
+        strings = [x.encode(_ENCODING, _ERRORS) for x in self._strings[1:]]
+        data_paths = [str(x).encode(_ENCODING, _ERRORS) for x in self._data_paths[1:]]
+        return b''.join((
+            _HEADER.pack(len(self._dir_parents), len(self._parents), len(strings), len(data_paths)),
+            self._dir_parents.tobytes(),
+            self._dir_names.tobytes(),
+            self._parents.tobytes(),
+            self._names.tobytes(),
+            self._data.tobytes(),
+            bytes(self._dir_bits),
+            array('I', map(len, strings)).tobytes(),
+            *strings,
+            array('I', map(len, data_paths)).tobytes(),
+            *data_paths,
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InstructionPlan':
+        """ Decode a Plan from the binary format created by to_bytes.
+
+**Parameters:**
+ - data (bytes): The encoded Plan.
+
+**Returns:**
+ InstructionPlan - The decoded Plan.
+
+**Raises:**
+ ValueError - When the data is not a complete and consistent encoded Plan.
+        """
+        try:
+            dir_count, count, string_count, data_count = _HEADER.unpack_from(data)
+        except StructError:
+            raise ValueError('Incomplete Plan Header')
+        reader = _ArrayReader(data, _HEADER.size)
+        plan = cls()
+        plan._dir_parents = reader.read('i', dir_count)
+        plan._dir_names = reader.read('I', dir_count)
+        plan._parents = reader.read('i', count)
+        plan._names = reader.read('I', count)
+        plan._data = reader.read('I', count)
+        plan._dir_bits = bytearray(reader.read_bytes((count + 7) >> 3))
+        plan._strings.extend(reader.read_strings(string_count))
+        plan._data_paths.extend(map(Path, reader.read_strings(data_count)))
+        if not reader.is_complete():
+            raise ValueError('Unexpected data after the Plan')
+        # Every id must refer to an entry in its table
+        if count > 0 and (
+            max(plan._names) > string_count or max(plan._data) > data_count or
+            not _ROOT_ID <= min(plan._parents) <= max(plan._parents) < dir_count
+        ):
+            raise ValueError('Invalid Plan Entry')
+        # Each Directory is added after its parent, so a Directory cannot be its own ancestor
+        if dir_count > 0 and (
+            max(plan._dir_names) > string_count or min(plan._dir_parents) < _ROOT_ID or
+            any(parent >= dir_id for dir_id, parent in enumerate(plan._dir_parents))
+        ):
+            raise ValueError('Invalid Plan Directory')
+        plan._string_ids = {x: n for n, x in enumerate(plan._strings)}
+        plan._data_ids = {x: n for n, x in enumerate(plan._data_paths) if x is not None}
+        plan._dir_ids = {key: n for n, key in enumerate(zip(plan._dir_parents, plan._dir_names))}
+        return plan
+
+    def _get_string_id(self, value: str) -> int:
+        if (string_id := self._string_ids.get(value)) is None:
+            self._string_ids[value] = string_id = len(self._strings)
+            self._strings.append(value)
+        return string_id
+
+    def _get_data_id(self, data_path: Path | None) -> int:
+        if data_path is None:
+            return 0
+        if (data_id := self._data_ids.get(data_path)) is None:
+            self._data_ids[data_path] = data_id = len(self._data_paths)
+            self._data_paths.append(data_path)
+        return data_id
+
+
+class _ArrayReader:
+    """ Reads consecutive sections of an encoded Plan.
+    """
+
+    def __init__(self, data: bytes, offset: int):
+        self._data = memoryview(data)
+        self._offset = offset
+
+    def read_bytes(self, size: int) -> bytes:
+        if (end := self._offset + size) > len(self._data):
+            raise ValueError('Incomplete Plan')
+        section = self._data[self._offset:end].tobytes()
+        self._offset = end
+        return section
+
+    def read(self, typecode: str, count: int) -> array:
+        values = array(typecode)
+        values.frombytes(self.read_bytes(count * values.itemsize))
+        return values
+
+    def read_strings(self, count: int) -> list[str]:
+        return [self.read_bytes(length).decode(_ENCODING, _ERRORS) for length in self.read('I', count)]
+
+    def is_complete(self) -> bool:
+        return self._offset == len(self._data)
@@ -4,8 +4,12 @@
 from pathlib import Path
 
 
+_ROOT_PATH = Path("./")
+
+
 class PathStack:
     """ A Stack of Directory names in a Path.
+ - The joined Path at each level is cached, so sibling Files share one parent Path.
 
 **Method Summary:**
  - push(str)
@@ -17,6 +21,8 @@ class PathStack:
 
     def __init__(self):
         self._stack: list[str] = []
+        # The joined Path at each level, where the first element is the root
+        self._paths: list[Path] = [_ROOT_PATH]
 
     def push(self, directory_name: str):
         """ Push a directory to the Path Stack.
@@ -25,6 +31,7 @@ class PathStack:
  - directory_name (str): The name of the next directory in the Path Stack.
         """
         self._stack.append(directory_name)
+        self._paths.append(self._paths[-1] / directory_name)
 
     def pop(self) -> str | None:
         """ Pop the top of the Stack, and return the directory name.
@@ -34,17 +41,17 @@ class PathStack:
         """
         if len(self._stack) < 1:
             return None
+        self._paths.pop()
         return self._stack.pop()
 
     def join_stack(self) -> Path:
         """ Combines all elements in the path Stack to form the parent directory.
+ - The Path is cached when each element is pushed, so the same Path object is returned until the Stack changes.
 
 **Returns:**
  Path - representing the current directory.
         """
-        if len(self._stack) == 0:
-            return Path("./")
-        return Path(f"./{'/'.join(self._stack)}/")
+        return self._paths[-1]
 
     def reduce_depth(self, depth: int) -> bool:
         """ Reduce the Depth of the Path Stack.
@@ -61,6 +68,7 @@ class PathStack:
             return True
         for _ in range(current_depth, depth, -1):
             self._stack.pop()
+            self._paths.pop()
         return True
 
     def get_depth(self) -> int:
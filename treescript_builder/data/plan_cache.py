@@ -0,0 +1,96 @@
+""" Instruction Plan Cache.
+ - Stores a validated InstructionPlan in a binary file, with the key it was created for.
+ - The key is a digest of the Tree Input, the operation mode, and the DataDirectory fingerprint.
+ - A Plan is loaded only when its key matches, so reading and validation can be skipped.
+ Author: DK96-OS 2024 - 2025
+"""
+from hashlib import sha256
+from mmap import mmap
+from os import replace
+from pathlib import Path
+from sys import byteorder
+
+from treescript_builder.data.data_directory import DataDirectory
+from treescript_builder.data.instruction_plan import InstructionPlan
+
+
+_CACHE_FILE_HEADER = b'ftb-plan 1\n'
+_KEY_SIZE = 32
+
+
+def get_plan_key(
+    tree_input: object,
+    is_trim: bool,
+    data_dir: DataDirectory | None,
+) -> bytes | None:
+    """ Compute the cache key of the Plan for a Tree Input.
+ - A lazy sequence of lines cannot be hashed without consuming it, so it has no key.
+
+**Parameters:**
+ - tree_input (str | bytes | mmap | Iterable[str]): The Tree Input to the FTB operation.
+ - is_trim (bool): Whether the Plan is for the trim operation.
+ - data_dir (DataDirectory?): The DataDirectory, before any trim node has been validated.
+
+**Returns:**
+ bytes? - The SHA-256 digest identifying the Plan, or None if the Tree Input cannot be hashed.
+    """
+    if isinstance(tree_input, str):
+        tree_input = tree_input.encode(errors='surrogateescape')
+    elif not isinstance(tree_input, (bytes, bytearray, memoryview, mmap)):
+        return None
+    digest = sha256(_CACHE_FILE_HEADER)
+    digest.update(f'{byteorder} {"trim" if is_trim else "build"}\n'.encode())
+    digest.update(b'\0' * _KEY_SIZE if data_dir is None else data_dir.get_fingerprint())
+    digest.update(tree_input)
+    return digest.digest()
+
+
+def load_plan(
+    cache_path: Path,
+    key: bytes,
+) -> InstructionPlan | None:
+    """ Load the Plan from the cache file, if it was created for the given key.
+
+**Parameters:**
+ - cache_path (Path): The Path to the Plan cache file.
+ - key (bytes): The cache key of the current Tree Input.
+
+**Returns:**
+ InstructionPlan? - The cached Plan, or None if the file is missing, stale or invalid.
+    """
+    try:
+        data = cache_path.read_bytes()
+    except OSError:
+        return None
+    header_size = len(_CACHE_FILE_HEADER)
+    if data[:header_size] != _CACHE_FILE_HEADER or data[header_size:header_size + _KEY_SIZE] != key:
+        return None
+    try:
+        return InstructionPlan.from_bytes(data[header_size + _KEY_SIZE:])
+    except ValueError:
+        return None
+
+
+def save_plan(
+    cache_path: Path,
+    key: bytes,
+    plan: InstructionPlan,
+):
+    """ Save the Plan to the cache file, replacing any previous Plan.
+ - The file is written beside the cache file, then renamed, so a partially written Plan is never loaded.
+ - The cache is optional, so a failure to write it is ignored.
+
+**Parameters:**
+ - cache_path (Path): The Path to the Plan cache file.
+ - key (bytes): The cache key of the Tree Input that the Plan was created from.
+ - plan (InstructionPlan): The validated Plan.
+    """
+    temp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        temp_path.write_bytes(_CACHE_FILE_HEADER + key + plan.to_bytes())
+        replace(temp_path, cache_path)
+    except OSError:
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
@@ -107,8 +107,10 @@ class TreeState:
  Path - A Path for every Directory in the Stack, from top to bottom.
         """
         for d in range(self._stack.get_depth(), depth, -1):
-            if (entry := self._stack.pop()) is not None:
-                yield self._stack.join_stack() / entry
+            # The cached Path of the top element is obtained before it is popped
+            path = self._stack.join_stack()
+            if self._stack.pop() is not None:
+                yield path
 
     def reduce_depth(self, depth: int) -> bool:
         """ Pop an element from the stack.
@@ -0,0 +1,185 @@
+""" Compact Tree Node Store.
+ - Holds every TreeData field in a column, instead of one object per node.
+ - Names and DataLabels are ids into a table of unique strings.
+ Author: DK96-OS 2024 - 2025
+"""
+from array import array
+from typing import Generator
+
+from treescript_builder.data.tree_data import TreeData
+
+
+class TreeStore:
+    """ A columnar store of Tree Nodes, which provides TreeData on demand.
+ - Depths are stored in an unsigned short array, and line numbers in an unsigned int array.
+ - The Directory flags are stored in a bitset, one bit per node.
+ - Each unique name or DataLabel is stored once, in the string table.
+
+**Method Summary:**
+ - append(int, int, bool, str, str)
+ - append_node(TreeData)
+ - append_ids(int, int, bool, int, int)
+ - extend(TreeStore)
+ - get_string_id(str): int
+ - get_depth(int): int
+ - get_line_number(int): int
+ - is_dir(int): bool
+ - get_name(int): str
+ - get_data_label(int): str
+ - depths: array
+ - line_numbers: array
+    """
+
+    def __init__(self):
+        self._depths = array('H')
+        self._line_numbers = array('I')
+        self._dir_bits = bytearray()
+        self._names = array('I')
+        self._labels = array('I')
+        # The string table, where id zero is the empty string
+        self._strings: list[str] = ['']
+        self._string_ids: dict[str, int] = {'': 0}
+
+    def __len__(self) -> int:
+        return len(self._depths)
+
+    def __getitem__(self, index: int) -> TreeData:
+        if index < 0:
+            index += len(self._depths)
+        return TreeData(
+            line_number=self._line_numbers[index],
+            depth=self._depths[index],
+            is_dir=self.is_dir(index),
+            name=self._strings[self._names[index]],
+            data_label=self._strings[self._labels[index]],
+        )
+
+    def __iter__(self) -> Generator[TreeData, None, None]:
+        """ Provide a TreeData for each node, created only when it is reached.
+        """
+        for index in range(len(self._depths)):
+            yield self[index]
+
+    @property
+    def depths(self) -> array:
+        """ The depth of every node, in order. This array should not be modified.
+        """
+        return self._depths
+
+    @property
+    def line_numbers(self) -> array:
+        """ The line number of every node, in order. This array should not be modified.
+        """
+        return self._line_numbers
+
+    def append(
+        self,
+        line_number: int,
+        depth: int,
+        is_dir: bool,
+        name: str,
+        data_label: str = '',
+    ):
+        """ Add a Tree Node to the end of the Store.
+
+**Parameters:**
+ - line_number (int): The line number of the node in the TreeScript file.
+ - depth (int): The depth in the tree, from the root.
+ - is_dir (bool): Whether the node is a directory.
+ - name (str): The Name of the node.
+ - data_label (str): The Data Label, may be empty string. Default: empty.
+
+**Raises:**
+ OverflowError - When the depth or line number exceeds the range of its column.
+        """
+        self.append_ids(line_number, depth, is_dir, self.get_string_id(name), self.get_string_id(data_label))
+
+    def append_ids(
+        self,
+        line_number: int,
+        depth: int,
+        is_dir: bool,
+        name_id: int,
+        data_label_id: int,
+    ):
+        """ Add a Tree Node to the end of the Store, where the name and DataLabel are already in the string table.
+
+**Parameters:**
+ - line_number (int): The line number of the node in the TreeScript file.
+ - depth (int): The depth in the tree, from the root.
+ - is_dir (bool): Whether the node is a directory.
+ - name_id (int): The string id of the Name, from get_string_id.
+ - data_label_id (int): The string id of the Data Label, from get_string_id.
+
+**Raises:**
+ OverflowError - When the depth or line number exceeds the range of its column.
+        """
+        index = len(self._names)
+        self._depths.append(depth)
+        self._line_numbers.append(line_number)
+        if index & 7 == 0:
+            self._dir_bits.append(0)
+        if is_dir:
+            self._dir_bits[index >> 3] |= 1 << (index & 7)
+        self._names.append(name_id)
+        self._labels.append(data_label_id)
+
+    def append_node(self, node: TreeData):
+        """ Add a TreeData node to the end of the Store.
+
+**Parameters:**
+ - node (TreeData): The Tree Node to add.
+        """
+        self.append(node.line_number, node.depth, node.is_dir, node.name, node.data_label)
+
+    def extend(self, other: 'TreeStore'):
+        """ Add every Tree Node in another Store to the end of this Store.
+ - The string ids of the other Store are mapped into this string table once, then each column is extended in bulk.
+
+**Parameters:**
+ - other (TreeStore): The Store containing the Tree Nodes to add, such as a batch read from a part of the Input.
+        """
+        string_ids = array('I', map(self.get_string_id, other._strings))
+        offset = len(self._depths) & 7
+        self._depths.extend(other._depths)
+        self._line_numbers.extend(other._line_numbers)
+        self._names.extend(map(string_ids.__getitem__, other._names))
+        self._labels.extend(map(string_ids.__getitem__, other._labels))
+        if offset == 0:
+            self._dir_bits.extend(other._dir_bits)
+            return
+        # Shift the other bitset to continue from the last partial byte
+        bits = int.from_bytes(other._dir_bits, 'little') << offset
+        byte_count = (len(self._depths) + 7) // 8 - len(self._dir_bits) + 1
+        shifted = bits.to_bytes(byte_count, 'little')
+        self._dir_bits[-1] |= shifted[0]
+        self._dir_bits.extend(shifted[1:])
+
+    def get_depth(self, index: int) -> int:
+        return self._depths[index]
+
+    def get_line_number(self, index: int) -> int:
+        return self._line_numbers[index]
+
+    def is_dir(self, index: int) -> bool:
+        return (self._dir_bits[index >> 3] >> (index & 7)) & 1 == 1
+
+    def get_name(self, index: int) -> str:
+        return self._strings[self._names[index]]
+
+    def get_data_label(self, index: int) -> str:
+        return self._strings[self._labels[index]]
+
+    def get_string_id(self, value: str) -> int:
+        """ Obtain the id of a string, adding it to the string table if it is new.
+
+**Parameters:**
+ - value (str): The name or DataLabel.
+
+**Returns:**
+ int - The index of the string in the string table.
+        """
+        if (string_id := self._string_ids.get(value)) is None:
+            self._string_ids[value] = string_id = len(self._strings)
+            self._strings.append(value)
+        return string_id
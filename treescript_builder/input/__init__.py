@@ -3,8 +3,11 @@
  - Read Input Tree String from File.
  Author: DK96-OS 2024 - 2025
 """
-from treescript_builder.input.argument_parser import parse_arguments
-from treescript_builder.input.file_validation import validate_input_file, validate_directory
+from pathlib import Path
+
+from treescript_builder.input.argument_parser import parse_arguments, parse_migrate_arguments
+from treescript_builder.input.file_validation import validate_input_file, validate_directory, stream_input_file, \
+    map_input_file, is_large_input_file, STDIN_FILE_NAME
 from treescript_builder.input.input_data import InputData
 
 
@@ -21,8 +24,75 @@ def validate_input_arguments(arguments: list[str]) -> InputData:
  SystemExit - If Arguments, Input File or Directory names invalid.
     """
     arg_data = parse_arguments(arguments)
+    if arg_data.input_file_path_str == STDIN_FILE_NAME:
+        tree_input = stream_input_file(
+            arg_data.input_file_path_str,
+            _get_size_limit(arg_data.size_limit_kb),
+        )
+    elif arg_data.use_fast_reader or arg_data.parse_jobs > 1 or is_large_input_file(arg_data.input_file_path_str):
+        if arg_data.is_streaming or arg_data.size_limit_kb is not None:
+            tree_input = map_input_file(
+                arg_data.input_file_path_str,
+                _get_size_limit(arg_data.size_limit_kb),
+            )
+        else: # The Default Size Limit
+            tree_input = map_input_file(arg_data.input_file_path_str)
+    elif arg_data.is_streaming:
+        tree_input = stream_input_file(
+            arg_data.input_file_path_str,
+            _get_size_limit(arg_data.size_limit_kb),
+        )
+    elif arg_data.size_limit_kb is not None:
+        tree_input = validate_input_file(
+            arg_data.input_file_path_str,
+            _get_size_limit(arg_data.size_limit_kb),
+        )
+    else: # The Default Size Limit
+        tree_input = validate_input_file(arg_data.input_file_path_str)
     return InputData(
-        validate_input_file(arg_data.input_file_path_str),
+        tree_input,
         validate_directory(arg_data.data_dir_path_str),
-        arg_data.is_reversed
+        arg_data.is_reversed,
+        arg_data.use_index,
+        arg_data.rebuild_index,
+        arg_data.is_pipelined,
+        arg_data.jobs,
+        arg_data.copy_mode,
+        arg_data.use_dir_fd,
+        arg_data.parse_jobs,
+        None if arg_data.plan_cache_path_str is None else Path(arg_data.plan_cache_path_str),
+        arg_data.incremental,
+        arg_data.is_reconciled,
+        arg_data.is_content_addressed,
+        arg_data.is_sharded,
+        None if arg_data.input_file_path_str == STDIN_FILE_NAME else Path(arg_data.input_file_path_str),
     )
+
+
+def validate_migrate_arguments(arguments: list[str]) -> Path:
+    """ Parse and Validate the Arguments of the DataDirectory migration.
+
+**Parameters:**
+ - arguments (list[str]): The list of Arguments to validate.
+
+**Returns:**
+ Path - The Path to the existing Data Directory.
+
+**Raises:**
+ SystemExit - If the Arguments or the Directory name are invalid.
+    """
+    return validate_directory(parse_migrate_arguments(arguments))
+
+
+def _get_size_limit(size_limit_kb: int | None) -> int | None:
+    """ Convert the Size Limit argument into bytes.
+
+**Parameters:**
+ - size_limit_kb (int?): The Size Limit in KB. Zero or None disables the limit.
+
+**Returns:**
+ int? - The Size Limit in bytes, or None when there is no limit.
+    """
+    if not size_limit_kb:
+        return None
+    return size_limit_kb * 1024
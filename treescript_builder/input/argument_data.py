@@ -16,7 +16,37 @@ class ArgumentData:
  - input_file_path_str (str): The Name of the File containing the Tree Structure.
  - data_dir_path_str (str?): The Directory Name containing Files Used in File Tree Operation.
  - is_reversed (bool): Flag to determine if the File Tree Operation Is To be Oppositely Trimmed.
+ - use_index (bool): Flag to persist the DataDirectory index in a sidecar file. Default: False.
+ - rebuild_index (bool): Flag to rescan the DataDirectory, replacing the persisted index. Default: False.
+ - is_streaming (bool): Flag to read the Input File lazily, line by line. Default: False.
+ - size_limit_kb (int?): The Input File size limit in KB, where zero disables the limit. Default: None, the mode default.
+ - is_pipelined (bool): Flag to execute Instructions while the Tree is validated. Default: False.
+ - jobs (int): The number of worker threads used to execute Instructions. Default: 1.
+ - copy_mode (str): The method used to create Files from the Data Directory. Default: copy.
+ - use_dir_fd (bool): Flag to execute Instructions relative to open Directory file descriptors. Default: False.
+ - use_fast_reader (bool): Flag to read the memory-mapped Input File with the Bytes Line Reader. Default: False.
+ - parse_jobs (int): The number of worker processes used to read the Input File. Default: 1.
+ - plan_cache_path_str (str?): The Name of the File that caches the validated Instruction Plan. Default: None.
+ - incremental (str?): How existing Files are compared, when skipping Instructions that are already complete. Default: None, disabled.
+ - is_reconciled (bool): Flag to make the File Tree match the Tree Structure, removing entries that are not in it. Default: False.
+ - is_content_addressed (bool): Flag to store trimmed Data Files once per content, in the content-addressed DataDirectory layout. Default: False.
+ - is_sharded (bool): Flag to store DataLabel Files in the sharded DataDirectory layout. Default: False.
     """
     input_file_path_str: str
     data_dir_path_str: str | None
-    is_reversed: bool
\ No newline at end of file
+    is_reversed: bool
+    use_index: bool = False
+    rebuild_index: bool = False
+    is_streaming: bool = False
+    size_limit_kb: int | None = None
+    is_pipelined: bool = False
+    jobs: int = 1
+    copy_mode: str = 'copy'
+    use_dir_fd: bool = False
+    use_fast_reader: bool = False
+    parse_jobs: int = 1
+    plan_cache_path_str: str | None = None
+    incremental: str | None = None
+    is_reconciled: bool = False
+    is_content_addressed: bool = False
+    is_sharded: bool = False
@@ -7,6 +7,7 @@ from argparse import ArgumentParser
 from sys import exit
 
 from treescript_builder.input.argument_data import ArgumentData
+from treescript_builder.input.file_validation import STDIN_FILE_NAME
 from treescript_builder.input.string_validation import validate_name
 
 
@@ -28,16 +29,71 @@ def parse_arguments(
     except SystemExit:
         exit("Unable to Parse Arguments.")
     return _validate_arguments(
-        parsed_args.tree_file_name,
+        _get_tree_file_name(parsed_args.tree_file_name, parsed_args.stdin),
         parsed_args.data_dir,
-        parsed_args.reverse
+        parsed_args.reverse,
+        parsed_args.index,
+        parsed_args.rebuild_index,
+        parsed_args.stream,
+        parsed_args.size_limit,
+        parsed_args.pipeline,
+        parsed_args.jobs,
+        parsed_args.copy_mode,
+        parsed_args.dir_fd,
+        parsed_args.fast_reader,
+        parsed_args.parse_jobs,
+        parsed_args.plan_cache,
+        parsed_args.incremental,
+        parsed_args.reconcile,
+        parsed_args.dedup,
+        parsed_args.shard,
     )
 
 
+def _get_tree_file_name(
+    tree_file_name: str | None,
+    use_stdin: bool,
+) -> str:
+    """ Determine the Tree File argument, combining the File Name and the Standard Input flag.
+
+**Parameters:**
+ - tree_file_name (str?): The file name of the tree input, if given.
+ - use_stdin (bool): Whether the Standard Input flag was given.
+
+**Returns:**
+ str - The Tree File Name, where "-" represents Standard Input.
+
+**Raises:**
+ SystemExit - When the Tree File is missing, or given alongside the Standard Input flag.
+    """
+    if not use_stdin:
+        if tree_file_name is None:
+            exit("The Tree File argument was invalid.")
+        return tree_file_name
+    if tree_file_name is not None and tree_file_name != STDIN_FILE_NAME:
+        exit("The Tree File argument cannot be combined with Standard Input.")
+    return STDIN_FILE_NAME
+
+
 def _validate_arguments(
     tree_file_name: str,
     data_dir_name: str,
-    is_reverse: bool
+    is_reverse: bool,
+    use_index: bool = False,
+    rebuild_index: bool = False,
+    is_streaming: bool = False,
+    size_limit_kb: int | None = None,
+    is_pipelined: bool = False,
+    jobs: int = 1,
+    copy_mode: str = 'copy',
+    use_dir_fd: bool = False,
+    use_fast_reader: bool = False,
+    parse_jobs: int = 1,
+    plan_cache_name: str | None = None,
+    incremental: str | None = None,
+    is_reconciled: bool = False,
+    is_content_addressed: bool = False,
+    is_sharded: bool = False,
 ) -> ArgumentData:
     """ Checks the values received from the ArgParser.
  - Uses Validate Name method from StringValidation.
@@ -47,6 +103,21 @@ def _validate_arguments(
  - tree_file_name (str): The file name of the tree input.
  - data_dir_name (str): The Data Directory name.
  - is_reverse (bool): Whether the builder operation is reversed.
+ - use_index (bool): Whether the DataDirectory index is persisted. Default: False.
+ - rebuild_index (bool): Whether the persisted DataDirectory index is rebuilt. Default: False.
+ - is_streaming (bool): Whether the Input File is read lazily. Default: False.
+ - size_limit_kb (int?): The Input File size limit in KB, zero for no limit. Default: None.
+ - is_pipelined (bool): Whether Instructions are executed while the Tree is validated. Default: False.
+ - jobs (int): The number of worker threads used to execute Instructions. Default: 1.
+ - copy_mode (str): The method used to create Files from the Data Directory. Default: copy.
+ - use_dir_fd (bool): Whether Instructions are executed relative to open Directory file descriptors. Default: False.
+ - use_fast_reader (bool): Whether the memory-mapped Input File is read by the Bytes Line Reader. Default: False.
+ - parse_jobs (int): The number of worker processes used to read the Input File. Default: 1.
+ - plan_cache_name (str?): The Name of the File that caches the validated Instruction Plan. Default: None.
+ - incremental (str?): How existing Files are compared, when skipping complete Instructions. Default: None, disabled.
+ - is_reconciled (bool): Whether the File Tree is made to match the Tree Structure. Default: False.
+ - is_content_addressed (bool): Whether the DataDirectory uses the content-addressed layout. Default: False.
+ - is_sharded (bool): Whether the DataDirectory uses the sharded layout. Default: False.
 
 **Returns:**
  ArgumentData - A DataClass of syntactically correct arguments.
@@ -57,10 +128,60 @@ def _validate_arguments(
     # Validate Data Directory Name Syntax if Present
     if data_dir_name is not None and not validate_name(data_dir_name):
         exit("The Data Directory argument was invalid.")
+    # Validate the Size Limit if Present
+    if size_limit_kb is not None and size_limit_kb < 0:
+        exit("The Size Limit argument was invalid.")
+    if jobs < 1:
+        exit("The Jobs argument was invalid.")
+    if use_dir_fd and jobs > 1:
+        exit("The Dir FD argument cannot be combined with Jobs.")
+    if parse_jobs < 1:
+        exit("The Parse Jobs argument was invalid.")
+    if parse_jobs > 1 and is_pipelined:
+        exit("The Parse Jobs argument cannot be combined with Pipeline.")
+    if parse_jobs > 1 and tree_file_name == STDIN_FILE_NAME:
+        exit("The Parse Jobs argument cannot be combined with Standard Input.")
+    if plan_cache_name is not None:
+        if not validate_name(plan_cache_name):
+            exit("The Plan Cache argument was invalid.")
+        if is_pipelined:
+            exit("The Plan Cache argument cannot be combined with Pipeline.")
+    if incremental is not None:
+        if is_reverse:
+            exit("The Incremental argument cannot be combined with Trim.")
+        if is_pipelined:
+            exit("The Incremental argument cannot be combined with Pipeline.")
+    if is_reconciled:
+        if is_reverse:
+            exit("The Reconcile argument cannot be combined with Trim.")
+        if is_pipelined:
+            exit("The Reconcile argument cannot be combined with Pipeline.")
+    if is_content_addressed:
+        if data_dir_name is None:
+            exit("The Dedup argument requires a Data Directory.")
+        if is_pipelined:
+            exit("The Dedup argument cannot be combined with Pipeline.")
+    if is_sharded and data_dir_name is None:
+        exit("The Shard argument requires a Data Directory.")
     return ArgumentData(
         tree_file_name,
         data_dir_name,
-        is_reverse
+        is_reverse,
+        use_index,
+        rebuild_index,
+        is_streaming,
+        size_limit_kb,
+        is_pipelined,
+        jobs,
+        copy_mode,
+        use_dir_fd,
+        use_fast_reader,
+        parse_jobs,
+        plan_cache_name,
+        incremental,
+        is_reconciled,
+        is_content_addressed,
+        is_sharded,
     )
 
 
@@ -78,7 +199,9 @@ def _define_arguments() -> ArgumentParser:
     parser.add_argument(
         'tree_file_name',
         type=str,
-        help='The File containing the Tree Node Structure'
+        nargs='?',
+        default=None,
+        help='The File containing the Tree Node Structure, or - for Standard Input'
     )
     # Optional arguments
     parser.add_argument(
@@ -94,4 +217,135 @@ def _define_arguments() -> ArgumentParser:
         default=False,
         help='Flag to reverse the File Tree Operation'
     )
+    parser.add_argument(
+        '--index',
+        action='store_true',
+        default=False,
+        help='Persist the DataDirectory index in a sidecar file, reused while the DataDirectory is unchanged'
+    )
+    parser.add_argument(
+        '--rebuild-index',
+        action='store_true',
+        default=False,
+        help='Rescan the DataDirectory and replace the persisted index'
+    )
+    parser.add_argument(
+        '--stdin',
+        action='store_true',
+        default=False,
+        help='Read the Tree Node Structure from Standard Input, as it is written'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        default=False,
+        help='Read the Tree File lazily, line by line. Disables the size limit unless --size-limit is given'
+    )
+    parser.add_argument(
+        '--size-limit',
+        type=int,
+        default=None,
+        help='The Tree File size limit in KB. Zero disables the limit. Default: 32'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        default=False,
+        help='Execute Instructions while the Tree is validated, with memory bounded by the Tree depth'
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help='The number of worker threads used to execute Instructions. Default: 1'
+    )
+    parser.add_argument(
+        '--copy-mode',
+        choices=('auto', 'reflink', 'copy', 'hardlink', 'symlink'),
+        default='copy',
+        help='The method used to create Files from the Data Directory. Default: copy'
+    )
+    parser.add_argument(
+        '--dir-fd',
+        action='store_true',
+        default=False,
+        help='Execute Instructions relative to open Directory file descriptors, resolving one name per operation'
+    )
+    parser.add_argument(
+        '--fast-reader',
+        action='store_true',
+        default=False,
+        help='Read the memory-mapped Tree File as bytes. Selected automatically for Tree Files of 1 MB or more'
+    )
+    parser.add_argument(
+        '--parse-jobs',
+        type=int,
+        default=1,
+        help='The number of worker processes used to read the memory-mapped Tree File. Default: 1'
+    )
+    parser.add_argument(
+        '--plan-cache',
+        default=None,
+        help='A File that caches the validated Instructions, reused while the Tree File, mode and Data Directory are unchanged'
+    )
+    parser.add_argument(
+        '--incremental',
+        nargs='?',
+        const='mtime',
+        default=None,
+        choices=('mtime', 'hash'),
+        help='Skip build Instructions that are already complete, comparing Data Files by size and mtime (default) or hash'
+    )
+    parser.add_argument(
+        '--reconcile',
+        action='store_true',
+        default=False,
+        help='Make the File Tree match the Tree File, removing entries inside its Directories that it does not contain'
+    )
+    parser.add_argument(
+        '--dedup',
+        action='store_true',
+        default=False,
+        help='Store trimmed Data Files once per content, with a manifest mapping DataLabels to content digests'
+    )
+    parser.add_argument(
+        '--shard',
+        action='store_true',
+        default=False,
+        help='Store DataLabel Files in two levels of hash-prefix Directories. A DataDirectory with DataLabel Files must be migrated first, with ftb-migrate'
+    )
     return parser
+
+
+def parse_migrate_arguments(
+    args: list[str],
+) -> str:
+    """ Parse the command line arguments of the DataDirectory migration.
+
+**Parameters:**
+ - args(list): A list of argument strings.
+
+**Returns:**
+ str - The Data Directory name.
+
+**Raises:**
+ SystemExit - When the arguments are missing or invalid.
+    """
+    if args is None or len(args) == 0:
+        exit("No Arguments given.")
+    parser = ArgumentParser(
+        description="""TreeScript-Builder: Migrate a DataDirectory to the sharded layout."""
+    )
+    parser.add_argument(
+        'data_dir',
+        type=str,
+        help='The Data Directory'
+    )
+    try:
+        parsed_args = parser.parse_args(args)
+    except SystemExit:
+        exit("Unable to Parse Arguments.")
+    if not validate_name(parsed_args.data_dir):
+        exit("The Data Directory argument was invalid.")
+    return parsed_args.data_dir
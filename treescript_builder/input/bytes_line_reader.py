@@ -0,0 +1,309 @@
+""" Bytes Line Reader Module for Processing TreeScript.
+
+An Alternate Input Reader, for large TreeScript files.
+ - Reads the raw bytes of the TreeScript, such as a memory-mapped File.
+ - Lines are found with bytes.find, and the indentation is counted on the raw bytes.
+ - Only the Name and DataLabel of each line are decoded.
+ - Produces the same TreeData as the Default Input Reader, for lines separated by LF or CRLF.
+ - A chunk containing any other line boundary of str.splitlines, such as a lone CR, is split on every boundary.
+ - Lines with other leading whitespace or non-ASCII edges are decoded, and read by the Default Input Reader.
+ Author: DK96-OS 2024 - 2025
+"""
+from mmap import mmap
+import re
+from sys import exit
+from typing import Callable, Generator, TypeVar
+
+from treescript_builder.data.tree_data import TreeData
+from treescript_builder.data.tree_store import TreeStore
+from treescript_builder.input.line_reader import _INVALID_DEPTH_ERROR_MSG, _INVALID_NODE_NAME_ERROR_MSG, \
+    _parse_line, _validate_node_name
+
+
+_ENCODING = 'utf-8'
+_NEWLINE = b'\n'
+_CR = 13
+_COMMENT = 35
+# Bytes that require the whole line to be decoded: ASCII whitespace other than space, separators, and non-ASCII
+_DECODE_LINE_BYTES = frozenset((*range(9, 14), *range(28, 32), *range(128, 256)))
+
+# The line boundaries of str.splitlines other than LF and CRLF, as UTF-8: CR, VT, FF, FS, GS, RS, NEL, LS and PS
+_OTHER_LINE_BREAK = re.compile(rb'\r(?!\n)|[\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]')
+_LINE_BREAK = re.compile(rb'\r\n|[\n\r\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]')
+
+_CHUNK_SIZE = 1024 * 1024 # 1 MB
+_LINE_CACHE_SIZE = 64 * 1024
+_PARALLEL_PART_SIZE = 4 * 1024 * 1024 # 4 MB
+_MISSING = object()
+
+T = TypeVar('T')
+
+BytesInput = bytes | bytearray | memoryview | mmap
+
+
+def read_input_tree_bytes(
+    input_tree_data: BytesInput,
+) -> Generator[TreeData, None, None]:
+    """ Generate structured Tree Data from the raw bytes of the Input TreeScript.
+
+**Parameters:**
+ - input_tree_data (bytes | bytearray | memoryview | mmap): The encoded Input TreeScript.
+
+**Yields:**
+ TreeData - Produces TreeData from the Input Data.
+
+**Raises:**
+ SystemExit - When any Line cannot be read successfully.
+    """
+    for line_number, node in _read_nodes(input_tree_data, _identity):
+        yield TreeData(line_number, *node)
+
+
+def read_input_store_bytes(
+    input_tree_data: BytesInput,
+    first_line_number: int = 1,
+) -> TreeStore:
+    """ Read every Tree Node from the raw bytes of the Input TreeScript into a compact TreeStore.
+ - The string ids of each distinct line are cached, so a repeated line is added without any string lookups.
+
+**Parameters:**
+ - input_tree_data (bytes | bytearray | memoryview | mmap): The encoded Input TreeScript.
+ - first_line_number (int): The line number of the first line in the data. Default: 1.
+
+**Returns:**
+ TreeStore - The Tree Nodes, in order.
+
+**Raises:**
+ SystemExit - When any Line cannot be read successfully.
+    """
+    store = TreeStore()
+    def _get_string_ids(node: tuple[int, bool, str, str]) -> tuple[int, bool, int, int]:
+        return node[0], node[1], store.get_string_id(node[2]), store.get_string_id(node[3])
+    append_ids = store.append_ids
+    for line_number, node in _read_nodes(input_tree_data, _get_string_ids, first_line_number):
+        try:
+            append_ids(line_number, *node)
+        except OverflowError:
+            exit(_INVALID_DEPTH_ERROR_MSG + str(line_number))
+    return store
+
+
+def read_input_store_parallel(
+    input_tree_data: BytesInput,
+    jobs: int,
+) -> TreeStore:
+    """ Read the raw bytes of the Input TreeScript into a TreeStore, using a pool of worker processes.
+ - The data is split at line feeds into one part per job, and the first line number of each part is counted up front.
+ - Each worker reads and validates the lines of its part into a TreeStore batch.
+ - The batches are merged in order, so the first invalid line in the Input is reported.
+ - Tree depths are validated afterwards, in a single sequential pass over the merged Store.
+
+**Parameters:**
+ - input_tree_data (bytes | bytearray | memoryview | mmap): The encoded Input TreeScript.
+ - jobs (int): The maximum number of worker processes.
+
+**Returns:**
+ TreeStore - The Tree Nodes, in order.
+
+**Raises:**
+ SystemExit - When any Line cannot be read successfully.
+    """
+    if len(parts := _split_parts(input_tree_data, jobs)) < 2:
+        return read_input_store_bytes(input_tree_data)
+    from concurrent.futures import ProcessPoolExecutor
+    store = TreeStore()
+    with ProcessPoolExecutor(len(parts)) as executor:
+        for batch in executor.map(read_input_store_bytes, *zip(*parts)):
+            store.extend(batch)
+    return store
+
+
+def _split_parts(
+    data: BytesInput,
+    count: int,
+) -> list[tuple[bytes, int]]:
+    """ Split the data at line feeds into parts of similar size, for parallel reading.
+ - Each part is at least the minimum parallel part size, so small Inputs are not split.
+
+**Parameters:**
+ - data (bytes | bytearray | memoryview | mmap): The encoded Input TreeScript.
+ - count (int): The maximum number of parts.
+
+**Returns:**
+ list[tuple[bytes, int]] - The data of each part, and the line number of its first line.
+    """
+    size = len(data)
+    if (count := min(count, size // _PARALLEL_PART_SIZE)) < 2:
+        return [(data, 1)]
+    parts = []
+    start, line_number = 0, 1
+    for index in range(1, count + 1):
+        if index == count or (end := data.find(_NEWLINE, size * index // count)) < 0:
+            end = size
+        if end <= start:
+            continue
+        part = bytes(data[start:end])
+        parts.append((part, line_number))
+        if _OTHER_LINE_BREAK.search(part) is None:
+            line_number += part.count(_NEWLINE) + 1
+        else:
+            line_number += len(_split_lines(part, end < size))
+        start = end + 1
+        if start >= size:
+            break
+    return parts
+
+
+def _identity(node: T) -> T:
+    return node
+
+
+def _read_nodes(
+    data: BytesInput,
+    convert: Callable[[tuple[int, bool, str, str]], T],
+    first_line_number: int = 1,
+) -> Generator[tuple[int, T], None, None]:
+    """ Find each line in the data, and determine its properties.
+ - The properties of each distinct line are cached, because most lines are repeated in large Trees.
+
+**Parameters:**
+ - data (bytes | bytearray | memoryview | mmap): The encoded Input TreeScript.
+ - convert (Callable): Transforms the depth, whether it is a directory, the name, and the DataLabel, before they are cached.
+ - first_line_number (int): The line number of the first line in the data. Default: 1.
+
+**Yields:**
+ tuple[int, T] - The line number, and the converted properties of the line.
+
+**Raises:**
+ SystemExit - When any Line cannot be read successfully.
+    """
+    cache: dict[bytes, T | None] = {}
+    line_number = first_line_number - 1
+    for lines in _split_chunks(data):
+        for line in lines:
+            line_number += 1
+            if (node := cache.get(line, _MISSING)) is _MISSING:
+                if (node := _parse_line_bytes(line_number, line)) is not None:
+                    node = convert(node)
+                if len(cache) >= _LINE_CACHE_SIZE:
+                    cache.clear()
+                cache[line] = node
+            if node is not None:
+                yield line_number, node
+
+
+def _split_chunks(
+    data: BytesInput,
+) -> Generator[list[bytes], None, None]:
+    """ Split the data into lines, one chunk at a time.
+ - Each chunk ends at a line feed, found with bytes.rfind, so only one chunk of lines is held in memory.
+
+**Parameters:**
+ - data (bytes | bytearray | memoryview | mmap): The encoded Input TreeScript.
+
+**Yields:**
+ list[bytes] - The lines in the next chunk, without line feeds.
+    """
+    if isinstance(data, (bytearray, memoryview)):
+        # The lines are cached, so they must be hashable
+        data = bytes(data)
+    size = len(data)
+    start = 0
+    while start < size:
+        if start + _CHUNK_SIZE >= size:
+            end = size
+        elif (end := data.rfind(_NEWLINE, start, start + _CHUNK_SIZE)) < 0:
+            # A single line is longer than the chunk size
+            if (end := data.find(_NEWLINE, start + _CHUNK_SIZE)) < 0:
+                end = size
+        yield _split_lines(data[start:end], end < size)
+        start = end + 1
+
+
+def _split_lines(
+    chunk: bytes,
+    is_terminated: bool,
+) -> list[bytes]:
+    """ Split a chunk into lines, at the same boundaries as str.splitlines.
+ - Chunks with only LF and CRLF boundaries are split at line feeds. Each CR is removed when its line is read.
+
+**Parameters:**
+ - chunk (bytes): The encoded lines, without the line feed that ends the chunk.
+ - is_terminated (bool): Whether the chunk is followed by a line feed.
+
+**Returns:**
+ list[bytes] - The lines in the chunk.
+    """
+    if _OTHER_LINE_BREAK.search(chunk) is None:
+        return chunk.split(_NEWLINE)
+    if is_terminated and chunk.endswith(b'\r'):
+        # The CR of the CRLF that ends the chunk
+        chunk = chunk[:-1]
+    return _LINE_BREAK.split(chunk)
+
+
+def _parse_line_bytes(
+    line_number: int,
+    line: bytes,
+) -> tuple[int, bool, str, str] | None:
+    """ Determine the properties of a single encoded line.
+
+**Parameters:**
+ - line_number (int): The line-number in the input tree structure, starting from 1.
+ - line (bytes): A line from the input tree structure, without the line feed.
+
+**Returns:**
+ tuple? - The depth, whether it is a directory, the name, and the DataLabel. None for blank and comment lines.
+
+**Raises:**
+ SystemExit - When Line cannot be read successfully.
+    """
+    if len(line) > 0 and line[-1] == _CR:
+        line = line[:-1]
+    content = line.lstrip(b' ')
+    if len(content) == 0 or content[0] == _COMMENT:
+        return None
+    space_count = len(line) - len(content)
+    content = content.rstrip(b' ')
+    if content[0] in _DECODE_LINE_BYTES or content[-1] in _DECODE_LINE_BYTES:
+        return _decode_line(line_number, line)
+    try:
+        if (space := content.find(b' ')) < 0:
+            node_name, data_label = content.decode(_ENCODING), ''
+        else:
+            node_name = content[:space].decode(_ENCODING)
+            if (label_end := content.find(b' ', space + 1)) < 0:
+                label_end = len(content)
+            data_label = '' if content[space + 1:space + 2] == b'#' else content[space + 1:label_end].decode(_ENCODING)
+    except UnicodeDecodeError:
+        exit(_INVALID_NODE_NAME_ERROR_MSG + str(line_number))
+    is_dir, node_name = _validate_node_name(line_number, node_name)
+    # The Space Count must be divisible by 2
+    if (depth := space_count >> 1) << 1 != space_count:
+        exit(_INVALID_DEPTH_ERROR_MSG + str(line_number))
+    return depth, is_dir, node_name, data_label
+
+
+def _decode_line(
+    line_number: int,
+    line: bytes,
+) -> tuple[int, bool, str, str] | None:
+    """ Decode the whole line, and read it with the Default Input Reader.
+
+**Parameters:**
+ - line_number (int): The line-number in the input tree structure, starting from 1.
+ - line (bytes): A line from the input tree structure, without the line break.
+
+**Returns:**
+ tuple? - The depth, whether it is a directory, the name, and the DataLabel. None for blank lines.
+
+**Raises:**
+ SystemExit - When Line cannot be read successfully.
+    """
+    try:
+        text = line.decode(_ENCODING)
+    except UnicodeDecodeError:
+        exit(_INVALID_NODE_NAME_ERROR_MSG + str(line_number))
+    if len(lstr := text.lstrip()) == 0 or lstr.startswith('#'):
+        return None
+    return _parse_line(line_number, text)
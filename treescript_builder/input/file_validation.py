@@ -2,15 +2,20 @@
  - These Methods all raise SystemExit exceptions.
  Author: DK96-OS 2024 - 2025
 """
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
 from stat import S_ISLNK
 from sys import exit
+from typing import Generator, Iterable, TextIO
 
 from treescript_builder.input.string_validation import validate_name
 
 
 _FILE_SIZE_LIMIT = 32 * 1024 # 32 KB
 _FILE_SIZE_LIMIT_ERROR_MSG = "File larger than 32 KB Limit."
+_STREAM_BUFFER_SIZE = 64 * 1024 # 64 KB
+_FAST_READER_SIZE = 1024 * 1024 # 1 MB
+STDIN_FILE_NAME = '-'
 _FILE_SYMLINK_DISABLED_MSG = "Symlink file paths are disabled."
 
 _FILE_DOES_NOT_EXIST_MSG = "The File does not Exist."
@@ -21,28 +26,27 @@ _NOT_A_DIR_ERROR_MSG = "Not a Directory."
 _DIR_DOES_NOT_EXIST_MSG = "The Directory does not exist."
 
 
-def validate_input_file(file_name: str) -> str | None:
+def validate_input_file(
+    file_name: str,
+    size_limit: int | None = _FILE_SIZE_LIMIT,
+) -> str | None:
     """ Read the Input File, Validate (non-blank) data, and return Input str.
- - Max FileSize is 32 KB.
+ - Max FileSize is 32 KB, by default.
  - Symlink type file paths are disabled.
 
 **Parameters:**
  - file_name (str): The Name of the Input File.
+ - size_limit (int?): The maximum File size in bytes, or None to disable the limit. Default: 32 KB.
 
 **Returns:**
  str - The String Contents of the Input File.
 
 **Raises:**
- SystemExit - If the File does not exist, or is empty, blank, over 32 KB, or if the read or validation operation failed.
+ SystemExit - If the File does not exist, or is empty, blank, over the size limit, or if the read or validation operation failed.
     """
     file_path = Path(file_name)
     try:
-        if not file_path.exists():
-            exit(_FILE_DOES_NOT_EXIST_MSG)
-        if S_ISLNK((stat := file_path.lstat()).st_mode):
-            exit(_FILE_SYMLINK_DISABLED_MSG)
-        if stat.st_size > _FILE_SIZE_LIMIT:
-            exit(_FILE_SIZE_LIMIT_ERROR_MSG)
+        _validate_input_path(file_path, size_limit)
         if (data := file_path.read_text()) is not None:
             if validate_name(data):
                 return data
@@ -53,6 +57,140 @@ def validate_input_file(file_name: str) -> str | None:
     return None
 
 
+def stream_input_file(
+    file_name: str,
+    size_limit: int | None = None,
+) -> Generator[str, None, None]:
+    """ Open the Input File, and provide its lines lazily.
+ - The File is read in buffered chunks, so only the current line is held in memory.
+ - Lines are split on every str.splitlines boundary, as the other readers split them.
+ - The File Name "-" reads from Standard Input, as the producer writes to it.
+ - There is no size limit, by default. The size limit does not apply to Standard Input.
+ - Symlink type file paths are disabled.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File, or "-" for Standard Input.
+ - size_limit (int?): The maximum File size in bytes, or None to disable the limit. Default: None.
+
+**Returns:**
+ Generator[str] - The lines of the Input File. The File is closed when the Generator is exhausted.
+
+**Raises:**
+ SystemExit - If the File does not exist, or is empty, over the size limit, or if the File cannot be opened.
+    """
+    if file_name == STDIN_FILE_NAME:
+        return _generate_stdin_lines()
+    file_path = Path(file_name)
+    try:
+        _validate_input_path(file_path, size_limit)
+        input_file = file_path.open(buffering=_STREAM_BUFFER_SIZE)
+    except OSError:
+        exit(_FILE_READ_OSERROR_MSG)
+    return _generate_lines(input_file)
+
+
+def map_input_file(
+    file_name: str,
+    size_limit: int | None = _FILE_SIZE_LIMIT,
+) -> mmap:
+    """ Map the Input File into memory, so that its bytes are read on demand.
+ - The mapping is read-only, and remains valid after the File is closed.
+ - Symlink type file paths are disabled.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File.
+ - size_limit (int?): The maximum File size in bytes, or None to disable the limit. Default: 32 KB.
+
+**Returns:**
+ mmap - The read-only memory map of the Input File.
+
+**Raises:**
+ SystemExit - If the File does not exist, or is empty, blank, over the size limit, or if the File cannot be mapped.
+    """
+    file_path = Path(file_name)
+    try:
+        _validate_input_path(file_path, size_limit)
+        with file_path.open('rb') as input_file:
+            data = mmap(input_file.fileno(), 0, access=ACCESS_READ)
+    except (OSError, ValueError):
+        exit(_FILE_READ_OSERROR_MSG)
+    if _is_blank(data):
+        data.close()
+        exit(_FILE_VALIDATION_ERROR_MSG)
+    return data
+
+
+def is_large_input_file(file_name: str) -> bool:
+    """ Determine whether the Input File is large enough to be read by the Bytes Line Reader.
+
+**Parameters:**
+ - file_name (str): The Name of the Input File.
+
+**Returns:**
+ bool - True when the File size is at least 1 MB. False if the File cannot be stat'd.
+    """
+    try:
+        return Path(file_name).lstat().st_size >= _FAST_READER_SIZE
+    except OSError:
+        return False
+
+
+def _validate_input_path(
+    file_path: Path,
+    size_limit: int | None,
+):
+    """ Ensure that the Input File exists, is not a symlink, and is within the size limit.
+
+**Parameters:**
+ - file_path (Path): The Path to the Input File.
+ - size_limit (int?): The maximum File size in bytes, or None to disable the limit.
+
+**Raises:**
+ SystemExit - If the File does not exist, is a symlink, is empty, or is over the size limit.
+ OSError - If the File could not be stat'd.
+    """
+    if not file_path.exists():
+        exit(_FILE_DOES_NOT_EXIST_MSG)
+    if S_ISLNK((stat := file_path.lstat()).st_mode):
+        exit(_FILE_SYMLINK_DISABLED_MSG)
+    if stat.st_size == 0:
+        exit(_FILE_VALIDATION_ERROR_MSG)
+    if size_limit is not None and stat.st_size > size_limit:
+        if size_limit == _FILE_SIZE_LIMIT:
+            exit(_FILE_SIZE_LIMIT_ERROR_MSG)
+        exit(f"File larger than {size_limit // 1024} KB Limit.")
+
+
+def _is_blank(data: mmap) -> bool:
+    """ Determine whether the mapped bytes contain only whitespace, as validate_name does for the text readers.
+ - The bytes are decoded one buffer at a time, stopping at the first buffer with other characters.
+    """
+    for offset in range(0, len(data), _STREAM_BUFFER_SIZE):
+        # The extra bytes complete a UTF-8 character that crosses the end of the buffer
+        if validate_name(data[offset:offset + _STREAM_BUFFER_SIZE + 3].decode(errors='ignore')):
+            return False
+    return True
+
+
+def _generate_lines(input_file: TextIO) -> Generator[str, None, None]:
+    """ Yield the lines of an open text File, then close it.
+
+**Parameters:**
+ - input_file (TextIO): The open Input File.
+
+**Yields:**
+ str - Each line of the File, without the line break.
+
+**Raises:**
+ SystemExit - If the read operation failed.
+    """
+    with input_file:
+        try:
+            yield from _split_lines(input_file)
+        except OSError:
+            exit(_FILE_READ_OSERROR_MSG)
+
+
 def validate_directory(dir_path_str: str | None) -> Path | None:
     """ Ensure that if the Directory argument is present, it Exists.
  - Allows None to pass through the method.
@@ -73,3 +211,27 @@ def validate_directory(dir_path_str: str | None) -> Path | None:
             return path
         exit(_NOT_A_DIR_ERROR_MSG)
     exit(_DIR_DOES_NOT_EXIST_MSG)
+
+
+def _generate_stdin_lines() -> Generator[str, None, None]:
+    """ Yield the lines of Standard Input, as they become available.
+ - Standard Input is not closed.
+
+**Yields:**
+ str - Each line received, without the line break.
+
+**Raises:**
+ SystemExit - If the read operation failed.
+    """
+    from sys import stdin
+    try:
+        yield from _split_lines(stdin)
+    except OSError:
+        exit(_FILE_READ_OSERROR_MSG)
+
+
+def _split_lines(lines: Iterable[str]) -> Generator[str, None, None]:
+    """ Split each buffered line on every str.splitlines boundary, so that the lines match the other readers.
+    """
+    for line in lines:
+        yield from line.splitlines()
@@ -2,7 +2,9 @@
  Author: DK96-OS 2024 - 2025
 """
 from dataclasses import dataclass
+from mmap import mmap
 from pathlib import Path
+from typing import Iterable
 
 
 @dataclass(frozen=True)
@@ -10,10 +12,36 @@ class InputData:
     """A Data Class Containing Program Input.
 
 **Fields:**
- - tree_input (str): The Tree Input to the FTB operation.
+ - tree_input (str | Iterable[str] | mmap): The Tree Input to the FTB operation, either the whole text, a lazy sequence of lines, or the memory-mapped File.
  - data_dir (Path?): An Optional Path to the Data Directory.
  - is_reversed (bool): Whether this FTB operation is reversed.
+ - use_index (bool): Whether the DataDirectory index is persisted in a sidecar file. Default: False.
+ - rebuild_index (bool): Whether the persisted DataDirectory index is rebuilt. Default: False.
+ - is_pipelined (bool): Whether Instructions are executed while the Tree is validated. Default: False.
+ - jobs (int): The number of worker threads used to execute Instructions. Default: 1.
+ - copy_mode (str): The method used to create Files from the Data Directory. Default: copy.
+ - use_dir_fd (bool): Whether Instructions are executed relative to open Directory file descriptors. Default: False.
+ - parse_jobs (int): The number of worker processes used to read the memory-mapped Tree Input. Default: 1.
+ - plan_cache (Path?): The Path to the File that caches the validated Instruction Plan. Default: None.
+ - incremental (str?): How existing Files are compared, when skipping Instructions that are already complete. Default: None, disabled.
+ - is_reconciled (bool): Whether the File Tree is made to match the Tree Input, removing entries that are not in it. Default: False.
+ - is_content_addressed (bool): Whether the DataDirectory uses the content-addressed layout, even before it has a manifest. Default: False.
+ - is_sharded (bool): Whether the DataDirectory uses the sharded layout, even before it is marked as sharded. Default: False.
+ - tree_input_path (Path?): The Path to the File containing the Tree Input, or None for Standard Input. Default: None.
     """
-    tree_input: str
+    tree_input: str | Iterable[str] | mmap
     data_dir: Path | None
-    is_reversed: bool
\ No newline at end of file
+    is_reversed: bool
+    use_index: bool = False
+    rebuild_index: bool = False
+    is_pipelined: bool = False
+    jobs: int = 1
+    copy_mode: str = 'copy'
+    use_dir_fd: bool = False
+    parse_jobs: int = 1
+    plan_cache: Path | None = None
+    incremental: str | None = None
+    is_reconciled: bool = False
+    is_content_addressed: bool = False
+    is_sharded: bool = False
+    tree_input_path: Path | None = None
@@ -9,24 +9,33 @@ The Default Input Reader.
  - Comments are filtered out by starting a line with the # character. A comment after a file name is also filtered.
  Author: DK96-OS 2024 - 2025
 """
-from sys import exit
-from typing import Generator
+from functools import lru_cache
+from mmap import mmap
+from sys import exit, intern
+from typing import Generator, Iterable
 
 from treescript_builder.data.tree_data import TreeData
+from treescript_builder.data.tree_store import TreeStore
 from treescript_builder.input.string_validation import validate_dir_name, validate_name
 
 
 _INVALID_DEPTH_ERROR_MSG = "Invalid Indentation (Number of Spaces) in Line: "
 _INVALID_NODE_NAME_ERROR_MSG = "Invalid Name in Line: "
+# The number of distinct node name tokens whose parsed result is cached
+_NODE_NAME_CACHE_SIZE = 8192
+# The Input types that are read by the Bytes Line Reader
+_BYTES_TYPES = (bytes, bytearray, memoryview, mmap)
 
 
 def read_input_tree(
-    input_tree_data: str,
+    input_tree_data: str | Iterable[str] | bytes | mmap,
 ) -> Generator[TreeData, None, None]:
     """ Generate structured Tree Data from the Input Data String.
+ - When given an Iterable of lines, such as an open File, the lines are consumed lazily.
+ - When given bytes, such as a memory-mapped File, the Bytes Line Reader is used.
 
 **Parameters:**
- - input_data (InputData): The Input.
+ - input_tree_data (str | Iterable[str] | bytes | mmap): The Input TreeScript, its lines, or its encoded bytes.
 
 **Yields:**
  TreeData - Produces TreeData from the Input Data.
@@ -34,12 +43,56 @@ def read_input_tree(
 **Raises:**
  SystemExit - When any Line cannot be read successfully.
     """
-    for line_number, line in enumerate(input_tree_data.splitlines(), start=1):
+    if isinstance(input_tree_data, _BYTES_TYPES):
+        from treescript_builder.input.bytes_line_reader import read_input_tree_bytes
+        yield from read_input_tree_bytes(input_tree_data)
+        return
+    if isinstance(input_tree_data, str):
+        input_tree_data = input_tree_data.splitlines()
+    for line_number, line in enumerate(input_tree_data, start=1):
         if len(lstr := line.lstrip()) == 0 or lstr.startswith('#'):
             continue
         yield _process_line(line_number, line)
 
 
+def read_input_store(
+    input_tree_data: str | Iterable[str] | bytes | mmap,
+    jobs: int = 1,
+) -> TreeStore:
+    """ Read every Tree Node from the Input into a compact TreeStore.
+ - No TreeData objects are created while the Input is read.
+ - When given bytes, such as a memory-mapped File, the Bytes Line Reader is used.
+ - When given bytes and more than one job, the bytes are read in parallel by worker processes.
+
+**Parameters:**
+ - input_tree_data (str | Iterable[str] | bytes | mmap): The Input TreeScript, its lines, or its encoded bytes.
+ - jobs (int): The maximum number of worker processes that read bytes Input. Default: 1.
+
+**Returns:**
+ TreeStore - The Tree Nodes, in order.
+
+**Raises:**
+ SystemExit - When any Line cannot be read successfully.
+    """
+    if isinstance(input_tree_data, _BYTES_TYPES):
+        if jobs > 1:
+            from treescript_builder.input.bytes_line_reader import read_input_store_parallel
+            return read_input_store_parallel(input_tree_data, jobs)
+        from treescript_builder.input.bytes_line_reader import read_input_store_bytes
+        return read_input_store_bytes(input_tree_data)
+    if isinstance(input_tree_data, str):
+        input_tree_data = input_tree_data.splitlines()
+    store = TreeStore()
+    for line_number, line in enumerate(input_tree_data, start=1):
+        if len(lstr := line.lstrip()) == 0 or lstr.startswith('#'):
+            continue
+        try:
+            store.append(line_number, *_parse_line(line_number, line))
+        except OverflowError:
+            exit(_INVALID_DEPTH_ERROR_MSG + str(line_number))
+    return store
+
+
 def _process_line(
     line_number: int,
     line: str,
@@ -54,6 +107,32 @@ def _process_line(
 **Returns:**
  TreeData - A Tree Node Data object.
 
+**Raises:**
+ SystemExit - When Line cannot be read successfully.
+    """
+    depth, is_dir, node_name, data_label = _parse_line(line_number, line)
+    return TreeData(
+        line_number=line_number,
+        depth=depth,
+        is_dir=is_dir,
+        name=node_name,
+        data_label=data_label,
+    )
+
+
+def _parse_line(
+    line_number: int,
+    line: str,
+) -> tuple[int, bool, str, str]:
+    """ Determine the properties of a single line of the input tree structure.
+
+**Parameters:**
+ - line_number (int): The line-number in the input tree structure, starting from 1.
+ - line (str): A line from the input tree structure.
+
+**Returns:**
+ tuple[int, bool, str, str] - The depth, whether it is a directory, the node name, and the DataLabel.
+
 **Raises:**
  SystemExit - When Line cannot be read successfully.
     """
@@ -69,13 +148,7 @@ def _process_line(
     else: # Was Not Split
         is_dir, node_name = _validate_node_name(line_number, args)
         data_label = ''
-    return TreeData(
-        line_number=line_number,
-        depth=_calculate_depth(line_number, line),
-        is_dir=is_dir,
-        name=node_name,
-        data_label=data_label,
-    )
+    return _calculate_depth(line_number, line), is_dir, node_name, data_label
 
 
 def _validate_node_name(
@@ -93,16 +166,32 @@ def _validate_node_name(
 
 **Raises:**
  SystemExit - When the directory name is invalid.
+    """
+    if (result := _parse_node_name(node_name)) is None:
+        exit(_INVALID_NODE_NAME_ERROR_MSG + str(line_number))
+    return result
+
+
+@lru_cache(maxsize=_NODE_NAME_CACHE_SIZE)
+def _parse_node_name(node_name: str) -> tuple[bool, str] | None:
+    """ Parse a node name token, caching the result for names that are repeated throughout the Tree.
+ - Names are interned, so that repeated names share one string object.
+
+**Parameters:**
+ - node_name (str): The argument received for the node name.
+
+**Returns:**
+ tuple[bool, str]? - Node information: is a directory, name of node. None if the name is invalid.
     """
     try: # Check if the line contains any slash characters
         if (dir_name := validate_dir_name(node_name)) is not None:
-            return True, dir_name
+            return True, intern(dir_name)
         # Fall-Through to File Node
     except ValueError: # An error in the dir name validation method, such that it cannot be a file either
-        exit(_INVALID_NODE_NAME_ERROR_MSG + str(line_number))
+        return None
     if not validate_name(node_name):
-        exit(_INVALID_NODE_NAME_ERROR_MSG + str(line_number))
-    return False, node_name # Is a FileNode
+        return None
+    return False, intern(node_name) # Is a FileNode
 
 
 def _calculate_depth(
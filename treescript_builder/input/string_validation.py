@@ -1,10 +1,24 @@
 """ String Validation Methods.
  Author: DK96-OS 2024 - 2025
 """
-from itertools import permutations, repeat
+import re
+from functools import lru_cache
+from itertools import product
 from typing import Literal
 
 
+# The punctuation chars that are only valid in DataLabels longer than two chars
+_SMALL_STRING_CHARS = ('.', '_', '-')
+# Every string of one or two punctuation chars, including the dot directories
+_INVALID_SMALL_STRINGS = frozenset(
+    ''.join(chars) for length in (1, 2) for chars in product(_SMALL_STRING_CHARS, repeat=length)
+)
+# Letters, numbers and the approved punctuation (-._), with at most 99 chars
+_DATA_LABEL_PATTERN = re.compile(r'[A-Za-z0-9._-]{1,99}')
+# The number of distinct DataLabels whose validation result is cached
+_DATA_LABEL_CACHE_SIZE = 4096
+
+
 def validate_name(argument) -> bool:
     """ Determine whether an argument is a non-empty string.
  - Does not count whitespace.
@@ -23,12 +37,14 @@ def validate_name(argument) -> bool:
     return True
 
 
+@lru_cache(maxsize=_DATA_LABEL_CACHE_SIZE)
 def validate_data_label(data_label: str) -> bool:
     """ Determine whether a Data Label is Valid.
  - Allows the approved non-alphanumeric chars.
  - The exclamation point (!) is a valid DataLabel, if by itself.
  - If a slash char is found in the string, it is invalid.
  - Small strings (length <= 2) consisting of only punctuation are invalid.
+ - The result is cached, because the same few DataLabels are reused by many nodes.
 
 **Parameters:**
  - data_label (str): The String to check for validity.
@@ -36,22 +52,11 @@ def validate_data_label(data_label: str) -> bool:
 **Returns:**
  bool - Whether the String is a valid Data Label.
     """
-    if len(data_label) < 3:
-        if '!' == data_label: # 33
-            return True
-        if data_label == '' or _is_invalid_small_tree_string(data_label):
-            return False
-    elif len(data_label) > 99:
+    if '!' == data_label:
+        return True
+    if _is_invalid_small_tree_string(data_label):
         return False
-    for ch in data_label:
-        n = ord(ch)
-        # ALLOWED: Special Punctuation (-._) Codes: 45, 46, 95
-        # Numbers: 48 - 57
-        # UpperCase: 65 - 90
-        # LowerCase: 97 - 122
-        if not (n != 47 and 45 <= n <= 57 if n < 65 else n <= 90 or n <= 122 and (n == 95 or 97 <= n)):
-            return False
-    return True
+    return _DATA_LABEL_PATTERN.fullmatch(data_label) is not None
 
 
 def validate_dir_name(dir_name: str) -> str | None:
@@ -89,9 +94,7 @@ def _is_invalid_small_tree_string(tree_string: str) -> bool:
 **Returns:**
  bool - True, if the given parameter is invalid, given the specific filtering criteria.
     """
-    return tree_string in (invalid_chars := ('.', '_', '-')) or \
-        tree_string in (''.join(repeat(x, 2)) for x in invalid_chars) or \
-        tree_string in permutations(invalid_chars, 2)
+    return tree_string in _INVALID_SMALL_STRINGS
 
 
 def _validate_slash_char(dir_name: str) -> Literal['\\', '/'] | None:
@@ -1,7 +1,12 @@
 """The Tree Module.
 """
+from typing import Generator, Iterable
+
+from treescript_builder.data.data_directory import DataDirectory
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
 from treescript_builder.input.input_data import InputData
-from treescript_builder.input.line_reader import read_input_tree
+from treescript_builder.input.line_reader import read_input_store, read_input_tree
 
 
 def build_tree(input_data: InputData) -> tuple[bool, ...]:
@@ -16,26 +21,170 @@ def build_tree(input_data: InputData) -> tuple[bool, ...]:
 **Raises:**
  SystemExit - If a Tree Validation error occurs.
 	"""
+    data_dir = _get_data_directory(input_data)
+    instructions = _plan_tree(input_data, data_dir)
     if input_data.is_reversed:
-        from treescript_builder.tree.trim_validation import validate_trim
-        instructions = validate_trim(
-            read_input_tree(input_data.tree_input),
-            input_data.data_dir
-        )
-        from treescript_builder.tree.tree_trimmer import trim
-        results = trim(instructions)
+        if data_dir is not None and data_dir.is_content_addressed():
+            from treescript_builder.tree.blob_trim import trim_blobs
+            results = trim_blobs(instructions, data_dir, input_data.jobs, input_data.use_dir_fd)
+        else:
+            if data_dir is not None and data_dir.is_sharded():
+                data_dir.make_shard_dirs(instructions.get_data_path(x) for x in range(len(instructions)))
+            from treescript_builder.tree.tree_trimmer import trim
+            results = trim(instructions, input_data.jobs, input_data.use_dir_fd)
+    elif input_data.is_reconciled:
+        results = _reconcile_tree(input_data, instructions)
     else:
-        from treescript_builder.tree.build_validation import validate_build
-        instructions = validate_build(
-            read_input_tree(input_data.tree_input),
-            input_data.data_dir
-        )
+        if input_data.incremental is not None:
+            from treescript_builder.tree.incremental_build import filter_existing
+            instructions = filter_existing(instructions, input_data.incremental)
         from treescript_builder.tree.tree_builder import build
-        results = build(instructions)
+        results = build(instructions, input_data.jobs, input_data.copy_mode, input_data.use_dir_fd)
     #
     return results
 
 
+def stream_tree(input_data: InputData) -> Generator[bool, None, None]:
+    """ Build The Tree as defined by the InputData, executing Instructions while the Tree is validated.
+ - Validation runs in a producer thread, connected to the executor by a bounded queue.
+ - Memory is proportional to the Tree depth and the queue size, rather than the number of nodes.
+ - Instructions before an invalid node are executed before the Validation error is raised.
+
+**Parameters:**
+ - input_data (InputData): The InputData produced by the Input Module.
+
+**Yields:**
+ bool - The result of each individual Builder operation, as it completes.
+
+**Raises:**
+ SystemExit - If a Tree Validation error occurs.
+    """
+    from treescript_builder.tree.instruction_pipeline import pipeline_instructions
+    data_dir = _get_data_directory(input_data)
+    if input_data.is_reversed:
+        from treescript_builder.tree.trim_validation import validate_trim_stream
+        from treescript_builder.tree.tree_trimmer import trim_stream
+        instructions = validate_trim_stream(read_input_tree(input_data.tree_input), data_dir)
+        if data_dir is not None and data_dir.is_sharded():
+            instructions = _make_shard_dirs(instructions, data_dir)
+        yield from trim_stream(
+            pipeline_instructions(instructions),
+            input_data.jobs,
+            input_data.use_dir_fd,
+        )
+    else:
+        from treescript_builder.tree.build_validation import validate_build_stream
+        from treescript_builder.tree.tree_builder import build_stream
+        yield from build_stream(
+            pipeline_instructions(
+                validate_build_stream(read_input_tree(input_data.tree_input), data_dir)
+            ),
+            input_data.jobs,
+            input_data.copy_mode,
+            input_data.use_dir_fd,
+        )
+
+
+def _make_shard_dirs(
+    instructions: Iterable[InstructionData],
+    data_dir: DataDirectory,
+) -> Generator[InstructionData, None, None]:
+    """ Create the shard Directory of each Data File, before its trim Instruction is executed.
+    """
+    for instruction in instructions:
+        if instruction.data_path is not None:
+            data_dir.make_shard_dirs((instruction.data_path,))
+        yield instruction
+
+
+def _reconcile_tree(
+    input_data: InputData,
+    instructions: InstructionPlan,
+) -> tuple[bool, ...]:
+    """ Make the File Tree match the validated build Instructions.
+ - The removals are executed in trim mode, then the remaining build Instructions are executed.
+ - The Data Directory, the Plan cache and the Tree Input File are never removed.
+
+**Parameters:**
+ - input_data (InputData): The InputData produced by the Input Module.
+ - instructions (InstructionPlan): The validated build Instructions.
+
+**Returns:**
+ tuple[bool, ...] - The results of each removal, followed by the results of each build operation.
+    """
+    from treescript_builder.tree.reconcile import plan_reconcile
+    removals, builds = plan_reconcile(
+        instructions,
+        'mtime' if input_data.incremental is None else input_data.incremental,
+        [x for x in (input_data.data_dir, input_data.plan_cache, input_data.tree_input_path) if x is not None],
+    )
+    from treescript_builder.tree.tree_trimmer import trim
+    from treescript_builder.tree.tree_builder import build
+    return (
+        trim(removals, input_data.jobs, input_data.use_dir_fd) +
+        build(builds, input_data.jobs, input_data.copy_mode, input_data.use_dir_fd)
+    )
+
+
+def _plan_tree(
+    input_data: InputData,
+    data_dir: DataDirectory | None,
+) -> InstructionPlan:
+    """ Read and validate the Tree Input into an InstructionPlan, or load the Plan from the cache.
+ - When a Plan cache is given, the Plan is loaded if its key matches, and saved otherwise.
+ - A build Plan is optimized before it is saved, so that each Directory is created once.
+ - The whole Tree Input is read before the Tree is validated. A Name or indentation error on any line is reported before a Tree depth or DataLabel error.
+
+**Parameters:**
+ - input_data (InputData): The InputData produced by the Input Module.
+ - data_dir (DataDirectory?): The DataDirectory, if present.
+
+**Returns:**
+ InstructionPlan - The validated Instructions.
+
+**Raises:**
+ SystemExit - If a Tree Validation error occurs.
+    """
+    key = None
+    if input_data.plan_cache is not None:
+        from treescript_builder.data.plan_cache import get_plan_key, load_plan
+        if (key := get_plan_key(input_data.tree_input, input_data.is_reversed, data_dir)) is not None:
+            if (plan := load_plan(input_data.plan_cache, key)) is not None:
+                return plan
+    tree_store = read_input_store(input_data.tree_input, input_data.parse_jobs)
+    if input_data.is_reversed:
+        from treescript_builder.tree.trim_validation import plan_trim
+        plan = plan_trim(tree_store, data_dir)
+    else:
+        from treescript_builder.tree.build_optimizer import optimize_build
+        from treescript_builder.tree.build_validation import plan_build
+        plan = optimize_build(plan_build(tree_store, data_dir))
+    if key is not None:
+        from treescript_builder.data.plan_cache import save_plan
+        save_plan(input_data.plan_cache, key, plan)
+    return plan
+
+
+def _get_data_directory(input_data: InputData) -> DataDirectory | None:
+    """ Create the DataDirectory described by the InputData, if present.
+
+**Parameters:**
+ - input_data (InputData): The InputData produced by the Input Module.
+
+**Returns:**
+ DataDirectory? - The DataDirectory, or None when no DataDirectory argument was given.
+    """
+    if input_data.data_dir is None:
+        return None
+    return DataDirectory(
+        input_data.data_dir,
+        use_index=input_data.use_index,
+        rebuild_index=input_data.rebuild_index,
+        content_addressed=input_data.is_content_addressed,
+        sharded=input_data.is_sharded,
+    )
+
+
 def process_results(results: tuple[bool, ...]) -> str:
     """ Process and Summarize the Results.
 
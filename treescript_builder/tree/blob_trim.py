@@ -0,0 +1,143 @@
+""" Content-Addressed Trim.
+ - Hashes the Data Files of a trim Plan in parallel, before any File is changed.
+ - Each distinct content is stored in the DataDirectory once, as a blob. The Files stay in the Tree until the manifest is written.
+ - A blob is always a separate File, reflinked or copied, so a File that cannot be removed from the Tree never shares its contents with the blob.
+ - The DataLabels are added to the manifest, then the Files are removed from the Tree.
+ Author: DK96-OS 2024 - 2025
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from treescript_builder.data.data_directory import DataDirectory
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.file_copier import FileCopier
+from treescript_builder.tree.file_snapshot import hash_file
+from treescript_builder.tree.tree_trimmer import trim
+
+
+def trim_blobs(
+    plan: InstructionPlan,
+    data_dir: DataDirectory,
+    jobs: int = 1,
+    use_dir_fd: bool = False,
+) -> tuple[bool, ...]:
+    """ Execute a trim Plan, storing its Data Files in the content-addressed layout of the DataDirectory.
+ - The Data File Instructions are completed first, then the remaining Instructions are executed in order.
+ - A File that cannot be hashed or stored is left in the Tree, and its Instruction fails.
+ - When the manifest cannot be written, the new blobs are removed and every Data File is left in the Tree.
+
+**Parameters:**
+ - plan (InstructionPlan): The validated trim Instructions.
+ - data_dir (DataDirectory): The content-addressed DataDirectory.
+ - jobs (int): The number of worker threads that hash, store and remove Files. Default: 1.
+ - use_dir_fd (bool): Whether the remaining Instructions are executed relative to Directory file descriptors. Default: False.
+
+**Returns:**
+ tuple[bool] - The success or failure of each Instruction.
+    """
+    indices = [x for x in range(len(plan)) if plan.get_data_path(x) is not None]
+    if len(indices) == 0:
+        return trim(plan, jobs, use_dir_fd)
+    paths = [plan.get_path(x) for x in indices]
+    # The positions of the Files with each digest, in Plan order
+    groups: dict[str, list[int]] = {}
+    results = [True] * len(plan)
+    for position, digest in enumerate(_map(_get_digest, paths, jobs)):
+        if digest is None:
+            results[indices[position]] = False
+        else:
+            groups.setdefault(digest, []).append(position)
+    copier = FileCopier('auto')
+    def _store(item: tuple[str, list[int]]) -> Path | bool:
+        digest, positions = item
+        return _store_blob(copier, data_dir, digest, paths[positions[0]])
+    labels: dict[str, str] = {}
+    # The Files to remove from the Tree, and the blobs created by this trim
+    stored: list[int] = []
+    new_blobs: list[Path] = []
+    for (digest, positions), blob in zip(groups.items(), _map(_store, groups.items(), jobs)):
+        if blob is False:
+            for position in positions:
+                results[indices[position]] = False
+            continue
+        if blob is not True:
+            new_blobs.append(blob)
+        for position in positions:
+            labels[plan.get_data_path(indices[position]).name] = digest
+        stored.extend(positions)
+    if len(labels) > 0 and not data_dir.add_blob_labels(labels):
+        for blob in new_blobs:
+            _unlink(blob)
+        for index in indices:
+            results[index] = False
+    else:
+        for position, is_removed in zip(stored, _map(_unlink, [paths[x] for x in stored], jobs)):
+            results[indices[position]] = is_removed
+    remaining = [x for x in range(len(plan)) if plan.get_data_path(x) is None]
+    for index, result in zip(remaining, trim(plan.select(remaining), jobs, use_dir_fd)):
+        results[index] = result
+    return tuple(results)
+
+
+def _store_blob(
+    copier: FileCopier,
+    data_dir: DataDirectory,
+    digest: str,
+    path: Path,
+) -> Path | bool:
+    """ Store the content of a File as a blob, leaving the File in the Tree.
+ - The blob is reflinked when the file system supports it, and copied otherwise. It is never hardlinked to the File.
+ - A copy is written to a temporary File, which then replaces the blob, so that a blob is never partially written.
+
+**Parameters:**
+ - copier (FileCopier): Reflinks or copies the File.
+ - data_dir (DataDirectory): The content-addressed DataDirectory.
+ - digest (str): The content digest of the File.
+ - path (Path): The Path to the File in the Tree.
+
+**Returns:**
+ Path | bool - The Path to the new blob, True when the blob was already stored, or False when it could not be stored.
+    """
+    if data_dir.has_blob(digest):
+        return True
+    blob_path = data_dir.get_blob_path(digest)
+    temp_path = blob_path.with_name(digest + '.tmp')
+    try:
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        if copier.copy(path, temp_path):
+            os.replace(temp_path, blob_path)
+            return blob_path
+    except OSError:
+        pass
+    _unlink(temp_path)
+    return False
+
+
+def _unlink(path: Path) -> bool:
+    """ Remove a File, returning whether it was removed.
+    """
+    try:
+        os.unlink(path)
+    except OSError:
+        return False
+    return True
+
+
+def _get_digest(path: Path) -> str | None:
+    """ Compute the hexadecimal SHA-256 digest of a File, or None if it cannot be read.
+    """
+    try:
+        return hash_file(path).hex()
+    except OSError:
+        return None
+
+
+def _map(operation, items, jobs: int) -> list:
+    """ Apply the operation to each item, in worker threads when jobs is greater than one.
+    """
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(operation, items))
+    return [operation(x) for x in items]
+
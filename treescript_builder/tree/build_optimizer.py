@@ -0,0 +1,36 @@
+""" Build Plan Optimizer.
+ - Removes the Directory Instructions whose Directory has already been created by an earlier Instruction.
+ - Runs between Tree Validation and the build executor, so that each Directory is created once.
+ Author: DK96-OS 2024 - 2025
+"""
+from treescript_builder.data.instruction_plan import InstructionPlan
+
+
+def optimize_build(plan: InstructionPlan) -> InstructionPlan:
+    """ Remove the redundant Directory Instructions from a build Plan.
+ - A Directory Instruction also creates each missing parent Directory.
+ - A repeated Directory, or the parent of a Directory created earlier, is removed from the Plan.
+ - File Instructions are kept, in their original order.
+
+**Parameters:**
+ - plan (InstructionPlan): The validated build Instructions.
+
+**Returns:**
+ InstructionPlan - The Plan with each Directory created at most once. The same Plan is returned when nothing is removed.
+    """
+    # Directories are identified by their parent Directory id and name
+    created: set[tuple[int, str]] = set()
+    remaining = []
+    for index in range(len(plan)):
+        if plan.is_dir(index):
+            if (key := (parent := plan.get_parent(index), plan.get_name(index))) in created:
+                continue
+            created.add(key)
+            # The parent Directories are created along with the Directory
+            while parent >= 0 and (key := (plan.get_dir_parent(parent), plan.get_dir_name(parent))) not in created:
+                created.add(key)
+                parent = key[0]
+        remaining.append(index)
+    if len(remaining) == len(plan):
+        return plan
+    return plan.select(remaining)
@@ -1,41 +1,87 @@
 """ Tree Validation Methods for the Build Operation.
  Author: DK96-OS 2024 - 2025
 """
+from array import array
 from pathlib import Path
-from typing import Generator, Callable
+from typing import Callable, Generator, Iterable
 
-from treescript_builder.data.data_directory import DataDirectory, get_data_dir_validator
+from treescript_builder.data.data_directory import DataDirectory, get_data_directory, get_data_dir_validator
 from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
 from treescript_builder.data.tree_data import TreeData
 from treescript_builder.data.tree_state import TreeState
+from treescript_builder.data.tree_store import TreeStore
+from treescript_builder.tree.depth_validation import get_parent_id, validate_depths
 
 
 def validate_build(
-    tree_data: Generator[TreeData, None, None],
-    data_dir_path: Path | None = None,
+    tree_data: Iterable[TreeData],
+    data_dir: Path | DataDirectory | None = None,
 ) -> tuple[InstructionData, ...]:
     """ Validate the Build Instructions.
 
 **Parameters:**
- - tree_data (Generator[TreeData]): The Generator that provides TreeData.
- - data_dir_path (Path?): The optional Data Directory Path. Default: None.
+ - tree_data (Iterable[TreeData]): The Generator or TreeStore that provides TreeData.
+ - data_dir (Path | DataDirectory | None): The optional Data Directory, or its Path. Default: None.
 
 **Returns:**
  tuple[InstructionData] - A generator that yields Instructions.
     """
-    return tuple(
-        _validate_build_generator(
+    return tuple(validate_build_stream(tree_data, data_dir))
+
+
+def plan_build(
+    tree_data: Iterable[TreeData],
+    data_dir: Path | DataDirectory | None = None,
+) -> InstructionPlan:
+    """ Validate the Build Instructions, storing them in a compact InstructionPlan.
+ - Instruction Paths are created when the Plan is read, rather than held for every Instruction.
+ - A TreeStore is validated in bulk, and planned from its parent indices without creating any Paths.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The Generator or TreeStore that provides TreeData.
+ - data_dir (Path | DataDirectory | None): The optional Data Directory, or its Path. Default: None.
+
+**Returns:**
+ InstructionPlan - The Instructions, in order.
+    """
+    if isinstance(tree_data, TreeStore):
+        return _plan_build_store(
             tree_data,
             get_data_dir_validator(
-                data_dir=DataDirectory(data_dir_path) if data_dir_path is not None else None,
+                data_dir=get_data_directory(data_dir),
                 is_trim=False,
             ),
         )
+    return InstructionPlan.from_instructions(validate_build_stream(tree_data, data_dir))
+
+
+def validate_build_stream(
+    tree_data: Iterable[TreeData],
+    data_dir: Path | DataDirectory | None = None,
+) -> Generator[InstructionData, None, None]:
+    """ Validate the Build Instructions lazily, one TreeData node at a time.
+ - Memory is proportional to the Tree depth, rather than the number of nodes.
+ - Validation errors are raised when the invalid node is reached.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The Generator or TreeStore that provides TreeData.
+ - data_dir (Path | DataDirectory | None): The optional Data Directory, or its Path. Default: None.
+
+**Returns:**
+ Generator[InstructionData] - A generator that yields Instructions.
+    """
+    return _validate_build_generator(
+        tree_data,
+        get_data_dir_validator(
+            data_dir=get_data_directory(data_dir),
+            is_trim=False,
+        ),
     )
 
 
 def _validate_build_generator(
-    tree_data: Generator[TreeData, None, None],
+    tree_data: Iterable[TreeData],
     data_dir_validator: Callable[[TreeData], Path | None],
 ) -> Generator[InstructionData, None, None]:
     tree_state = TreeState()
@@ -72,3 +118,47 @@ def _validate_build_generator(
     # Always Finish Build Sequence with ProcessQueue
     if (dir := tree_state.process_queue()) is not None:
         yield InstructionData(True, dir)
+
+
+def _plan_build_store(
+    store: TreeStore,
+    data_dir_validator: Callable[[TreeData], Path | None],
+) -> InstructionPlan:
+    """ Plan the Build Instructions from a TreeStore, in the same order as the Build generator.
+ - Consecutive Directories are queued, and only the deepest is built.
+
+**Parameters:**
+ - store (TreeStore): The Tree Nodes.
+ - data_dir_validator (Callable[[TreeData], Path?]): Transforms TreeData with a DataLabel to a Data Path.
+
+**Returns:**
+ InstructionPlan - The Instructions, in order.
+    """
+    parents = validate_depths(store)
+    plan = InstructionPlan()
+    # The Plan Directory id of each Directory node
+    dir_ids = array('i', (-1,)) * len(store)
+    queued = -1
+    current_depth = 0
+    for index in range(len(store)):
+        parent_id = get_parent_id(parents, dir_ids, index)
+        depth, is_dir, name = store.get_depth(index), store.is_dir(index), store.get_name(index)
+        # Build the queued Directory when a File is reached, or the Tree depth decreases
+        if queued >= 0 and (not is_dir or depth < current_depth):
+            plan.append_entry(True, get_parent_id(parents, dir_ids, queued), store.get_name(queued))
+            queued = -1
+        if is_dir:
+            dir_ids[index] = plan.get_dir_id(parent_id, name)
+            queued = index
+            current_depth = depth + 1
+        else:
+            plan.append_entry(
+                False,
+                parent_id,
+                name,
+                None if store.get_data_label(index) == '' else data_dir_validator(store[index]),
+            )
+            current_depth = depth
+    if queued >= 0:
+        plan.append_entry(True, get_parent_id(parents, dir_ids, queued), store.get_name(queued))
+    return plan
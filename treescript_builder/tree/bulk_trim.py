@@ -0,0 +1,214 @@
+""" Bulk Subtree Removal.
+ - Finds the Directory subtrees of a trim Plan that contain no Data Files, so each entry in them is only removed.
+ - Removes each subtree with a single scan per Directory, using unlink and rmdir relative to open Directory file descriptors.
+ - Only the names in the Plan are removed. Any other entry is kept, so its Directory is not removed.
+ Author: DK96-OS 2024 - 2025
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from treescript_builder.data.instruction_plan import InstructionPlan
+
+
+_DIR_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_NOFOLLOW', 0)
+
+# The indices of the File Instructions in each Directory, by name
+_FileIndex = dict[int, dict[str, list[int]]]
+# The id and the indices of the Directory Instructions in each Directory, by name
+_DirIndex = dict[int, dict[str, tuple[int | None, list[int]]]]
+
+
+def is_bulk_trim_supported() -> bool:
+    """ Determine whether this platform supports bulk removal relative to Directory file descriptors.
+    """
+    return os.scandir in os.supports_fd and {os.open, os.rmdir, os.unlink} <= os.supports_dir_fd
+
+
+def remove_subtrees(
+    plan: InstructionPlan,
+    jobs: int = 1,
+) -> set[int]:
+    """ Remove the Directory subtrees of a trim Plan that contain no Data Files.
+ - An Instruction that is not completed by the bulk removal is left for the trim executor.
+
+**Parameters:**
+ - plan (InstructionPlan): The validated trim Instructions.
+ - jobs (int): The number of worker threads that remove subtrees. Default: 1.
+
+**Returns:**
+ set[int] - The indices of the Instructions that were completed.
+    """
+    files, dirs, roots = _index_subtrees(plan)
+    if len(roots) == 0:
+        return set()
+    operation = partial(_remove_subtree, files=files, dirs=dirs)
+    if jobs > 1 and len(roots) > 1:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(roots))) as executor:
+            results = list(executor.map(lambda x: operation(*x), roots))
+    else:
+        results = [operation(*x) for x in roots]
+    removed = set()
+    for indices in results:
+        removed.update(indices)
+    return removed
+
+
+def _index_subtrees(
+    plan: InstructionPlan,
+) -> tuple[_FileIndex, _DirIndex, list[tuple[Path, int, list[int]]]]:
+    """ Index the Instructions by Directory, and find the largest subtrees that can be removed in bulk.
+ - A subtree is excluded when it contains a Data File, or a Directory without an Instruction.
+
+**Parameters:**
+ - plan (InstructionPlan): The validated trim Instructions.
+
+**Returns:**
+ tuple - The File index, the Directory index, and the Path, id and Instruction indices of each subtree.
+    """
+    files: _FileIndex = {}
+    dirs: _DirIndex = {}
+    excluded: set[int] = set()
+    instructed: set[int] = set()
+    for index in range(len(plan)):
+        parent = plan.get_parent(index)
+        name = plan.get_name(index)
+        if plan.is_dir(index):
+            dir_id = plan.find_dir_id(parent, name)
+            dirs.setdefault(parent, {}).setdefault(name, (dir_id, []))[1].append(index)
+            if dir_id is not None:
+                instructed.add(dir_id)
+        elif plan.get_data_path(index) is None:
+            files.setdefault(parent, {}).setdefault(name, []).append(index)
+        else:
+            _exclude(plan, excluded, parent)
+    for dir_id in range(plan.get_dir_count()):
+        if dir_id not in instructed:
+            _exclude(plan, excluded, dir_id)
+    roots = [
+        (Path(*plan.get_dir_parts(parent), name), dir_id, indices)
+        for parent, names in dirs.items() if parent < 0 or parent in excluded
+        for name, (dir_id, indices) in names.items() if dir_id is not None and dir_id not in excluded
+    ]
+    return files, dirs, roots
+
+
+def _exclude(
+    plan: InstructionPlan,
+    excluded: set[int],
+    dir_id: int,
+):
+    """ Exclude a Directory and its ancestors from bulk removal.
+    """
+    while dir_id >= 0 and dir_id not in excluded:
+        excluded.add(dir_id)
+        dir_id = plan.get_dir_parent(dir_id)
+
+
+def _remove_subtree(
+    path: Path,
+    dir_id: int,
+    indices: list[int],
+    files: _FileIndex,
+    dirs: _DirIndex,
+) -> list[int]:
+    """ Remove a Directory subtree, visiting each Directory once.
+ - Symbolic links are removed, and never followed.
+
+**Parameters:**
+ - path (Path): The Path to the root Directory of the subtree.
+ - dir_id (int): The Plan id of the root Directory.
+ - indices (list[int]): The indices of the Instructions that remove the root Directory.
+ - files (_FileIndex): The File Instructions in each Directory.
+ - dirs (_DirIndex): The Directory Instructions in each Directory.
+
+**Returns:**
+ list[int] - The indices of the Instructions that were completed.
+    """
+    removed: list[int] = []
+    try:
+        fd = os.open(path, _DIR_FLAGS)
+    except OSError:
+        return removed
+    # Each Directory being visited: its file descriptor, the subdirectories left to visit, its name and indices
+    stack = [(fd, _clear_directory(fd, dir_id, files, dirs, removed), '', indices)]
+    try:
+        while len(stack) > 0:
+            fd, subdirs, _, _ = stack[-1]
+            if len(subdirs) == 0:
+                _, _, name, dir_indices = stack.pop()
+                os.close(fd)
+                if len(stack) > 0:
+                    _remove_dir(name, stack[-1][0], dir_indices, removed)
+                continue
+            name, child_id, child_indices = subdirs.pop()
+            if child_id is None:
+                _remove_dir(name, fd, child_indices, removed)
+                continue
+            try:
+                child_fd = os.open(name, _DIR_FLAGS, dir_fd=fd)
+            except OSError:
+                continue
+            stack.append((child_fd, _clear_directory(child_fd, child_id, files, dirs, removed), name, child_indices))
+    finally:
+        for fd, _, _, _ in stack:
+            os.close(fd)
+    try:
+        os.rmdir(path)
+    except OSError:
+        return removed
+    removed.extend(indices)
+    return removed
+
+
+def _clear_directory(
+    fd: int,
+    dir_id: int,
+    files: _FileIndex,
+    dirs: _DirIndex,
+    removed: list[int],
+) -> list[tuple[str, int | None, list[int]]]:
+    """ Scan a Directory once, and remove the Files in the Plan.
+
+**Parameters:**
+ - fd (int): The file descriptor of the Directory.
+ - dir_id (int): The Plan id of the Directory.
+ - files (_FileIndex): The File Instructions in each Directory.
+ - dirs (_DirIndex): The Directory Instructions in each Directory.
+ - removed (list[int]): The indices of the completed Instructions, which is extended.
+
+**Returns:**
+ list[tuple[str, int?, list[int]]] - The name, Plan id and Instruction indices of each subdirectory in the Plan.
+    """
+    try:
+        with os.scandir(fd) as entries:
+            is_dir = {entry.name: entry.is_dir(follow_symlinks=False) for entry in entries}
+    except OSError:
+        return []
+    for name, indices in files.get(dir_id, {}).items():
+        if is_dir.get(name) is False:
+            try:
+                os.unlink(name, dir_fd=fd)
+            except OSError:
+                continue
+            removed.extend(indices)
+    return [
+        (name, child_id, indices) for name, (child_id, indices) in dirs.get(dir_id, {}).items()
+        if is_dir.get(name) is True
+    ]
+
+
+def _remove_dir(
+    name: str,
+    parent_fd: int,
+    indices: list[int],
+    removed: list[int],
+):
+    """ Remove an empty Directory, relative to its parent.
+    """
+    try:
+        os.rmdir(name, dir_fd=parent_fd)
+    except OSError:
+        return
+    removed.extend(indices)
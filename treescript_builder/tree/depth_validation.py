@@ -0,0 +1,65 @@
+""" Bulk Depth Validation for a TreeStore.
+ - Checks the indentation of every node in a single pass over the depth column.
+ - Produces the parent Directory index of every node, so the Tree can be planned without a TreeState.
+ Author: DK96-OS 2024 - 2025
+"""
+from array import array
+from sys import exit
+
+from treescript_builder.data.tree_store import TreeStore
+
+
+_INVALID_TREE_INDENT_MSG = 'Invalid Tree Indentation on Line: '
+_ROOT_INDEX = -1
+
+
+def validate_depths(store: TreeStore) -> array:
+    """ Validate the depth of every node, and determine its parent Directory.
+ - A node may be at most one level deeper than the preceding Directory, and no deeper than a preceding File.
+ - Odd indentation has already been rejected while the TreeStore was read.
+
+**Parameters:**
+ - store (TreeStore): The Tree Nodes to validate.
+
+**Returns:**
+ array - The index of the parent Directory node of every node, where -1 is the root.
+
+**Raises:**
+ SystemExit - When a node is deeper than its position in the Tree allows.
+    """
+    depths = store.depths
+    parents = array('i', (_ROOT_INDEX,)) * len(depths)
+    # The indices of the Directories on the current path, by depth
+    path: list[int] = []
+    limit = 0
+    for index, depth in enumerate(depths):
+        if depth > limit:
+            exit(_INVALID_TREE_INDENT_MSG + str(store.get_line_number(index)))
+        if depth < len(path):
+            del path[depth:]
+        if depth > 0:
+            parents[index] = path[-1]
+        if store.is_dir(index):
+            path.append(index)
+            limit = depth + 1
+        else:
+            limit = depth
+    return parents
+
+
+def get_parent_id(
+    parents: array,
+    dir_ids: array,
+    index: int,
+) -> int:
+    """ Obtain the Plan Directory id of the parent of a node, where -1 is the root.
+
+**Parameters:**
+ - parents (array): The index of the parent Directory node of every node, from validate_depths.
+ - dir_ids (array): The Plan Directory id of each Directory node.
+ - index (int): The index of the node.
+
+**Returns:**
+ int - The Plan Directory id of the parent Directory.
+    """
+    return -1 if (parent := parents[index]) < 0 else dir_ids[parent]
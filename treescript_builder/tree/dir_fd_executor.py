@@ -0,0 +1,228 @@
+""" Directory File Descriptor Executor.
+ - Keeps an open file descriptor for each Directory in the current Path.
+ - Each operation resolves a single name, relative to its parent Directory.
+ - Available on platforms where os.supports_dir_fd includes the required methods.
+ Author: DK96-OS 2024 - 2025
+"""
+import os
+from pathlib import Path
+from typing import Generator, Iterable
+
+from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.file_copier import CopyMode, FileCopier
+from treescript_builder.tree.file_mover import FileMover
+
+
+_DIR_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+_TOUCH_FLAGS = os.O_WRONLY | os.O_CREAT
+
+
+def is_dir_fd_supported() -> bool:
+    """ Determine whether this platform supports the Directory File Descriptor methods.
+
+**Returns:**
+ bool - True when every method used by the executor accepts a dir_fd argument.
+    """
+    return hasattr(os, 'O_DIRECTORY') and {
+        os.open, os.mkdir, os.rmdir, os.unlink, os.rename, os.utime, os.link, os.symlink,
+    } <= os.supports_dir_fd
+
+
+def execute_dir_fd(
+    instructions: Iterable[InstructionData],
+    is_trim: bool,
+    copy_mode: CopyMode = 'copy',
+) -> Generator[bool, None, None]:
+    """ Execute the Instructions relative to open Directory file descriptors.
+ - The Instructions in an InstructionPlan are executed without creating their Paths.
+
+**Parameters:**
+ - instructions (Iterable[InstructionData]): The Instructions to execute, or an InstructionPlan.
+ - is_trim (bool): Whether the Instructions are executed in trim mode.
+ - copy_mode (CopyMode): The method used to create Files from the Data Directory. Default: copy.
+
+**Yields:**
+ bool - The success or failure of each Instruction, after it is executed.
+    """
+    with DirFdExecutor(FileCopier(copy_mode)) as executor:
+        if isinstance(instructions, InstructionPlan):
+            operation = executor.trim_at if is_trim else executor.build_at
+            for entry in instructions.iter_entries():
+                yield operation(*entry)
+            return
+        operation = executor.trim if is_trim else executor.build
+        for i in instructions:
+            yield operation(i)
+
+
+class DirFdExecutor:
+    """ Executes Instructions relative to a stack of open Directory file descriptors.
+ - The stack follows the parent Directory of the current Instruction.
+ - Consecutive Instructions in the same Directory reuse the open file descriptor.
+
+**Method Summary:**
+ - build(InstructionData): bool
+ - build_at(bool, tuple[str], str, Path?): bool
+ - trim(InstructionData): bool
+ - trim_at(bool, tuple[str], str, Path?): bool
+ - close()
+    """
+
+    def __init__(self, copier: FileCopier | None = None):
+        self._copier = FileCopier() if copier is None else copier
+        self._mover = FileMover()
+        self._base_fd = os.open('.', _DIR_FLAGS)
+        self._names: list[str] = []
+        self._fds: list[int] = []
+
+    def __enter__(self) -> 'DirFdExecutor':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def build(self, i: InstructionData) -> bool:
+        """ Execute a single Instruction in build mode.
+
+**Parameters:**
+ - i (InstructionData): The data required to execute the operation.
+
+**Returns:**
+ bool - Whether the given operation succeeded.
+        """
+        return self.build_at(i.is_dir, i.path.parent.parts, i.path.name, i.data_path)
+
+    def build_at(
+        self,
+        is_dir: bool,
+        parent_parts: tuple[str, ...],
+        name: str,
+        data_path: Path | None = None,
+    ) -> bool:
+        """ Execute a single Instruction in build mode, given the names of its parent Directory.
+
+**Parameters:**
+ - is_dir (bool): Whether the Instruction relates to a Directory.
+ - parent_parts (tuple[str]): The names in the Path of the parent Directory.
+ - name (str): The name of the File or Directory.
+ - data_path (Path?): The Data Directory Path of the Instruction, if applicable. Default: None.
+
+**Returns:**
+ bool - Whether the given operation succeeded.
+        """
+        try:
+            dir_fd = self._open_parent(parent_parts, create=True)
+            if is_dir:
+                try:
+                    os.mkdir(name, dir_fd=dir_fd)
+                except FileExistsError:
+                    pass
+                return True
+            if data_path is not None:
+                return self._copier.copy_at(data_path, name, dir_fd)
+            try: # Update the timestamps of an existing File, like Path.touch
+                os.utime(name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                os.close(os.open(name, _TOUCH_FLAGS, 0o666, dir_fd=dir_fd))
+        except OSError:
+            return False
+        return True
+
+    def trim(self, i: InstructionData) -> bool:
+        """ Execute a single Instruction in trim mode.
+
+**Parameters:**
+ - i (InstructionData): The data required to execute the operation.
+
+**Returns:**
+ bool - Whether the given operation succeeded.
+        """
+        return self.trim_at(i.is_dir, i.path.parent.parts, i.path.name, i.data_path)
+
+    def trim_at(
+        self,
+        is_dir: bool,
+        parent_parts: tuple[str, ...],
+        name: str,
+        data_path: Path | None = None,
+    ) -> bool:
+        """ Execute a single Instruction in trim mode, given the names of its parent Directory.
+ - A Directory Instruction follows its contents, so its file descriptor has been closed before it is removed.
+
+**Parameters:**
+ - is_dir (bool): Whether the Instruction relates to a Directory.
+ - parent_parts (tuple[str]): The names in the Path of the parent Directory.
+ - name (str): The name of the File or Directory.
+ - data_path (Path?): The Data Directory Path of the Instruction, if applicable. Default: None.
+
+**Returns:**
+ bool - Whether the given operation succeeded.
+        """
+        try:
+            dir_fd = self._open_parent(parent_parts, create=False)
+            if is_dir:
+                os.rmdir(name, dir_fd=dir_fd)
+            elif data_path is None:
+                try:
+                    os.unlink(name, dir_fd=dir_fd)
+                except FileNotFoundError:
+                    pass
+            else:
+                return self._mover.move_at(name, dir_fd, data_path)
+        except OSError:
+            return False
+        return True
+
+    def close(self):
+        """ Close every open Directory file descriptor.
+        """
+        self._close_to(0)
+        if self._base_fd >= 0:
+            os.close(self._base_fd)
+            self._base_fd = -1
+
+    def _open_parent(
+        self,
+        parts: tuple[str, ...],
+        create: bool,
+    ) -> int:
+        """ Move the stack to the given Directory, opening each name relative to its parent.
+
+**Parameters:**
+ - parts (tuple[str]): The names in the Path of the Directory.
+ - create (bool): Whether missing Directories are created.
+
+**Returns:**
+ int - The file descriptor of the Directory.
+
+**Raises:**
+ OSError - When a Directory cannot be opened or created.
+        """
+        depth = 0
+        limit = min(len(parts), len(self._names))
+        while depth < limit and parts[depth] == self._names[depth]:
+            depth += 1
+        self._close_to(depth)
+        for name in parts[depth:]:
+            parent_fd = self._fds[-1] if len(self._fds) > 0 else self._base_fd
+            try:
+                fd = os.open(name, _DIR_FLAGS, dir_fd=parent_fd)
+            except FileNotFoundError:
+                if not create:
+                    raise
+                os.mkdir(name, dir_fd=parent_fd)
+                fd = os.open(name, _DIR_FLAGS, dir_fd=parent_fd)
+            self._names.append(name)
+            self._fds.append(fd)
+        return self._fds[-1] if len(self._fds) > 0 else self._base_fd
+
+    def _close_to(self, depth: int):
+        """ Close the file descriptors above the given depth.
+
+**Parameters:**
+ - depth (int): The number of file descriptors to keep open.
+        """
+        while len(self._fds) > depth:
+            self._names.pop()
+            os.close(self._fds.pop())
@@ -0,0 +1,330 @@
+""" Data File Copy Strategies.
+ - copy: The shutil copy2 method, which copies data and metadata.
+ - auto: Tries a reflink (FICLONE), then copy_file_range, then sendfile, then copy2.
+ - reflink: Shares the data blocks of the Data File, on file systems that support it.
+ - hardlink: Links the new File to the Data File.
+ - symlink: Creates a symbolic link to the Data File.
+ Author: DK96-OS 2024 - 2025
+"""
+import os
+from errno import EBADF, EINVAL, ENOSYS, ENOTSOCK, ENOTSUP, ENOTTY, EOPNOTSUPP, EXDEV
+from pathlib import Path
+from shutil import copy2, copystat
+from stat import S_IMODE
+from sys import platform
+from threading import Lock
+from typing import Callable, Literal
+
+
+CopyMode = Literal['auto', 'reflink', 'copy', 'hardlink', 'symlink']
+COPY_MODES: tuple[CopyMode, ...] = ('auto', 'reflink', 'copy', 'hardlink', 'symlink')
+
+# The Linux ioctl request code that clones a file: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+# These errors indicate that a copy method is not supported by the pair of file systems
+_UNSUPPORTED_ERRNO = frozenset((EBADF, EINVAL, ENOSYS, ENOTSOCK, ENOTSUP, ENOTTY, EOPNOTSUPP, EXDEV))
+_CHUNK_SIZE = 8 * 1024 * 1024 # 8 MB
+
+_OPEN_SRC_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+_OPEN_DST_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+
+def _reflink(src_fd: int, dst_fd: int, size: int):
+    """ Clone the source File into the destination, sharing data blocks.
+    """
+    from fcntl import ioctl
+    ioctl(dst_fd, _FICLONE, src_fd)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int):
+    """ Copy the source File into the destination within the kernel, using copy_file_range.
+
+**Raises:**
+ OSError - With EOPNOTSUPP when fewer bytes than the size are copied, as some file systems copy nothing.
+    """
+    copied = 0
+    while copied < size:
+        if (n := os.copy_file_range(src_fd, dst_fd, min(_CHUNK_SIZE, size - copied))) == 0:
+            _raise_short_copy(copied, size)
+        copied += n
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int):
+    """ Copy the source File into the destination within the kernel, using sendfile.
+
+**Raises:**
+ OSError - With EOPNOTSUPP when fewer bytes than the size are copied.
+    """
+    copied = 0
+    while copied < size:
+        if (n := os.sendfile(dst_fd, src_fd, copied, min(_CHUNK_SIZE, size - copied))) == 0:
+            _raise_short_copy(copied, size)
+        copied += n
+
+
+def _raise_short_copy(copied: int, size: int):
+    """ Reject a kernel copy that ended early, so that the next method copies the File from the start.
+    """
+    raise OSError(EOPNOTSUPP, f'The kernel copied {copied} of {size} bytes')
+
+
+def _get_auto_methods() -> tuple[Callable[[int, int, int], None], ...]:
+    """ Determine the kernel copy methods available on this platform, in order of preference.
+
+**Returns:**
+ tuple[Callable] - The copy methods that operate on file descriptors.
+    """
+    methods = []
+    if platform.startswith('linux'):
+        methods.append(_reflink)
+    if hasattr(os, 'copy_file_range'):
+        methods.append(_copy_file_range)
+    if hasattr(os, 'sendfile') and platform.startswith('linux'):
+        methods.append(_sendfile)
+    return tuple(methods)
+
+
+class FileCopier:
+    """ Copies Data Files into the Tree, using the configured Copy Mode.
+ - In auto mode, the copy method is chosen once per pair of source and destination devices.
+ - When a method is not supported by a pair of devices, the next method is chosen for that pair.
+
+**Method Summary:**
+ - copy(Path, Path): bool
+ - copy_at(Path, str, int): bool
+ - copy_fd(int, int): bool
+    """
+
+    def __init__(self, mode: CopyMode = 'copy'):
+        if mode not in COPY_MODES:
+            raise ValueError(f'Unknown Copy Mode: {mode}')
+        self._mode: CopyMode = mode
+        if mode == 'auto':
+            self._methods = _get_auto_methods()
+        elif mode == 'reflink':
+            self._methods = (_reflink,) if platform.startswith('linux') else ()
+        else:
+            self._methods = ()
+        # The index of the chosen method, for each pair of devices
+        self._device_methods: dict[tuple[int, int], int] = {}
+        self._lock = Lock()
+
+    def copy(
+        self,
+        data: Path,
+        path: Path,
+    ) -> bool:
+        """ Create a File at the given path, with data from the Data Directory.
+
+**Parameters:**
+ - data (Path): A Data Directory Path to be copied to the new File.
+ - path (Path): The Path to the File to be created.
+
+**Returns:**
+ bool - Whether the File operation succeeded.
+        """
+        try:
+            match self._mode:
+                case 'copy':
+                    copy2(data, path)
+                case 'hardlink':
+                    _replace_with(path, lambda: os.link(data, path))
+                case 'symlink':
+                    _replace_with(path, lambda: os.symlink(data.absolute(), path))
+                case _:
+                    return self._copy_kernel(data, path)
+        except OSError:
+            return False
+        return True
+
+    def _copy_kernel(
+        self,
+        data: Path,
+        path: Path,
+    ) -> bool:
+        """ Copy the File with the method chosen for this pair of devices, falling back to copy2.
+
+**Parameters:**
+ - data (Path): A Data Directory Path to be copied to the new File.
+ - path (Path): The Path to the File to be created.
+
+**Returns:**
+ bool - Whether the File operation succeeded.
+
+**Raises:**
+ OSError - When the Files cannot be opened, or a supported copy method fails.
+        """
+        if len(self._methods) == 0:
+            if self._mode == 'reflink':
+                return False
+            copy2(data, path)
+            return True
+        src_fd = os.open(data, _OPEN_SRC_FLAGS)
+        try:
+            dst_fd = _replace_with(path, lambda: os.open(path, _OPEN_DST_FLAGS, 0o666))
+            try:
+                is_copied = self._copy_descriptors(src_fd, dst_fd, os.fstat(src_fd))
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        if not is_copied:
+            if self._mode == 'reflink':
+                return False
+            copy2(data, path)
+            return True
+        copystat(data, path)
+        return True
+
+    def copy_at(
+        self,
+        data: Path,
+        name: str,
+        dir_fd: int,
+    ) -> bool:
+        """ Create a File in an open Directory, with data from the Data Directory.
+ - The File name is resolved relative to the Directory file descriptor.
+ - The copy mode uses a userspace copy of the file descriptors, instead of copy2.
+
+**Parameters:**
+ - data (Path): A Data Directory Path to be copied to the new File.
+ - name (str): The name of the File to be created.
+ - dir_fd (int): The file descriptor of the Directory that contains the new File.
+
+**Returns:**
+ bool - Whether the File operation succeeded.
+        """
+        def _unlink():
+            os.unlink(name, dir_fd=dir_fd)
+        try:
+            match self._mode:
+                case 'hardlink':
+                    _replace_with(_unlink, lambda: os.link(data, name, dst_dir_fd=dir_fd))
+                    return True
+                case 'symlink':
+                    _replace_with(_unlink, lambda: os.symlink(data.absolute(), name, dir_fd=dir_fd))
+                    return True
+            src_fd = os.open(data, _OPEN_SRC_FLAGS)
+            try:
+                dst_fd = _replace_with(_unlink, lambda: os.open(name, _OPEN_DST_FLAGS, 0o666, dir_fd=dir_fd))
+                try:
+                    return self.copy_fd(src_fd, dst_fd)
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+        except OSError:
+            return False
+
+    def copy_fd(
+        self,
+        src_fd: int,
+        dst_fd: int,
+    ) -> bool:
+        """ Copy between open Files, along with the permissions and timestamps of the source.
+ - Uses the kernel method chosen for this pair of devices, then a userspace copy, except in reflink mode.
+
+**Parameters:**
+ - src_fd (int): The file descriptor of the File to copy.
+ - dst_fd (int): The file descriptor of the new, empty File.
+
+**Returns:**
+ bool - Whether the File was copied.
+
+**Raises:**
+ OSError - When the File cannot be read or written.
+        """
+        if not self._copy_descriptors(src_fd, dst_fd, src_stat := os.fstat(src_fd)):
+            if self._mode == 'reflink':
+                return False
+            _copy_userspace(src_fd, dst_fd)
+        # Copy the permissions and timestamps, like copystat
+        os.chmod(dst_fd, S_IMODE(src_stat.st_mode))
+        os.utime(dst_fd, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        return True
+
+    def _copy_descriptors(
+        self,
+        src_fd: int,
+        dst_fd: int,
+        src_stat: os.stat_result,
+    ) -> bool:
+        """ Copy between open Files, with the kernel method chosen for this pair of devices.
+
+**Parameters:**
+ - src_fd (int): The file descriptor of the Data File.
+ - dst_fd (int): The file descriptor of the new, empty File.
+ - src_stat (stat_result): The status of the Data File.
+
+**Returns:**
+ bool - Whether a kernel method copied the File. When False, the new File is empty.
+
+**Raises:**
+ OSError - When a supported copy method fails.
+        """
+        devices = (src_stat.st_dev, os.fstat(dst_fd).st_dev)
+        while (index := self._device_methods.get(devices, 0)) < len(self._methods):
+            try:
+                self._methods[index](src_fd, dst_fd, src_stat.st_size)
+                return True
+            except OSError as error:
+                if error.errno not in _UNSUPPORTED_ERRNO:
+                    raise
+                self._demote(devices, index)
+                # Discard any partial copy before trying the next method
+                os.ftruncate(dst_fd, 0)
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+        return False
+
+    def _demote(
+        self,
+        devices: tuple[int, int],
+        index: int,
+    ):
+        """ Choose the next copy method for a pair of devices.
+
+**Parameters:**
+ - devices (tuple[int, int]): The source and destination device numbers.
+ - index (int): The index of the method that is not supported.
+        """
+        with self._lock:
+            if self._device_methods.get(devices, 0) <= index:
+                self._device_methods[devices] = index + 1
+
+
+def _replace_with(
+    path: Path | Callable[[], None],
+    create: Callable[[], object],
+):
+    """ Create a new File at the path, replacing any existing File.
+ - The existing File is unlinked rather than truncated, because it may share data with a Data File.
+
+**Parameters:**
+ - path (Path | Callable): The Path to the File to be created, or a method that unlinks it.
+ - create (Callable): The method that creates the File, raising FileExistsError if the path exists.
+
+**Returns:**
+ The value returned by the create method.
+    """
+    try:
+        return create()
+    except FileExistsError:
+        if isinstance(path, Path):
+            path.unlink()
+        else:
+            path()
+        return create()
+
+
+def _copy_userspace(src_fd: int, dst_fd: int):
+    """ Copy the remaining data between open Files, through a userspace buffer.
+
+**Parameters:**
+ - src_fd (int): The file descriptor to read from.
+ - dst_fd (int): The file descriptor to write to.
+    """
+    while len(chunk := os.read(src_fd, _CHUNK_SIZE)) > 0:
+        view = memoryview(chunk)
+        while len(view) > 0:
+            view = view[os.write(dst_fd, view):]
@@ -0,0 +1,136 @@
+""" Data File Move Strategy.
+ - The devices of the Tree and the Data Directory are compared once, before the first File is moved.
+ - On the same device, each File is renamed into the Data Directory.
+ - Across devices, each File is copied by the kernel, such as with copy_file_range, then unlinked.
+ Author: DK96-OS 2024 - 2025
+"""
+import os
+from errno import ENOTSUP, EXDEV
+from pathlib import Path
+from typing import Callable
+
+from treescript_builder.tree.file_copier import FileCopier, _OPEN_DST_FLAGS, _OPEN_SRC_FLAGS, _replace_with
+
+
+class FileMover:
+    """ Moves Files from the Tree into the Data Directory.
+ - The Tree is the current working directory, which every Instruction Path is relative to.
+ - A File on a separate mount inside the Tree is copied when its rename is rejected.
+
+**Method Summary:**
+ - move(Path, Path): bool
+ - move_at(str, int, Path): bool
+ - is_same_device(Path): bool
+    """
+
+    def __init__(self):
+        self._is_same_device: bool | None = None
+        self._copier = FileCopier('auto')
+
+    def move(
+        self,
+        path: Path,
+        data: Path,
+    ) -> bool:
+        """ Move a File from the Tree to the Data Directory, replacing any existing Data File.
+
+**Parameters:**
+ - path (Path): The Path to the File in the Tree.
+ - data (Path): A Path to a File in the Data Directory.
+
+**Returns:**
+ bool - Whether the entire operation succeeded.
+        """
+        try:
+            self._move(
+                lambda: os.rename(path, data),
+                lambda: os.open(path, _OPEN_SRC_FLAGS),
+                lambda: os.unlink(path),
+                data,
+            )
+        except OSError:
+            return False
+        return True
+
+    def move_at(
+        self,
+        name: str,
+        dir_fd: int,
+        data: Path,
+    ) -> bool:
+        """ Move a File in an open Directory to the Data Directory, replacing any existing Data File.
+
+**Parameters:**
+ - name (str): The name of the File.
+ - dir_fd (int): The file descriptor of the Directory that contains the File.
+ - data (Path): A Path to a File in the Data Directory.
+
+**Returns:**
+ bool - Whether the entire operation succeeded.
+        """
+        try:
+            self._move(
+                lambda: os.rename(name, data, src_dir_fd=dir_fd),
+                lambda: os.open(name, _OPEN_SRC_FLAGS, dir_fd=dir_fd),
+                lambda: os.unlink(name, dir_fd=dir_fd),
+                data,
+            )
+        except OSError:
+            return False
+        return True
+
+    def is_same_device(self, data: Path) -> bool:
+        """ Determine whether the Tree and the Data Directory are on the same device, checking only once.
+
+**Parameters:**
+ - data (Path): A Path to a File in the Data Directory.
+
+**Returns:**
+ bool - True when Files can be renamed into the Data Directory.
+
+**Raises:**
+ OSError - When the Data Directory cannot be found.
+        """
+        if self._is_same_device is None:
+            self._is_same_device = os.stat('.').st_dev == os.stat(data.parent).st_dev
+        return self._is_same_device
+
+    def _move(
+        self,
+        rename: Callable[[], None],
+        open_file: Callable[[], int],
+        unlink: Callable[[], None],
+        data: Path,
+    ):
+        """ Rename the File on the same device, or copy it and unlink it across devices.
+
+**Parameters:**
+ - rename (Callable): Renames the File to the Data Path.
+ - open_file (Callable): Opens the File for reading.
+ - unlink (Callable): Removes the File from the Tree.
+ - data (Path): A Path to a File in the Data Directory.
+
+**Raises:**
+ OSError - When the File cannot be moved. The File is only unlinked after all of its bytes have been copied.
+        """
+        if self.is_same_device(data):
+            try:
+                rename()
+                return
+            except OSError as error:
+                if error.errno != EXDEV:
+                    raise
+        src_fd = open_file()
+        try:
+            dst_fd = _replace_with(data, lambda: os.open(data, _OPEN_DST_FLAGS, 0o666))
+            try:
+                is_copied = self._copier.copy_fd(src_fd, dst_fd) and \
+                    os.fstat(dst_fd).st_size == os.fstat(src_fd).st_size
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        if not is_copied:
+            os.unlink(data)
+            raise OSError(ENOTSUP, 'The File was not copied', str(data))
+        unlink()
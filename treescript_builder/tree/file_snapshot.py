@@ -0,0 +1,107 @@
+""" File Snapshot Methods.
+ - Shared by the Tree operations that compare existing Files before changing them.
+ - Each Directory is scanned into a snapshot of its entries, using os.scandir.
+ - Existing Files are compared with their Data Files by size, and by modification time or hash.
+ Author: DK96-OS 2024 - 2025
+"""
+from hashlib import file_digest
+from os import DirEntry, scandir, stat, stat_result
+from pathlib import Path
+from typing import Literal
+
+
+CompareMode = Literal['mtime', 'hash']
+COMPARE_MODES: tuple[CompareMode, ...] = ('mtime', 'hash')
+
+
+def scan_directory(path: Path) -> dict[str, DirEntry] | None:
+    """ Scan a Directory once, collecting its entries by name.
+
+**Parameters:**
+ - path (Path): The Path to the Directory.
+
+**Returns:**
+ dict[str, DirEntry]? - The entries of the Directory, or None if it could not be scanned.
+    """
+    try:
+        with scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return None
+
+
+def is_dir_entry(entry: DirEntry, follow_symlinks: bool = True) -> bool:
+    """ Determine whether an entry is a Directory, treating an error as False.
+    """
+    try:
+        return entry.is_dir(follow_symlinks=follow_symlinks)
+    except OSError:
+        return False
+
+
+def is_file_entry(entry: DirEntry) -> bool:
+    """ Determine whether an entry is a File, treating an error as False.
+    """
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def is_same_file(
+    entry: DirEntry,
+    data_path: Path,
+    data_stats: dict[Path, stat_result | None],
+    compare: CompareMode,
+    data_digests: dict[Path, bytes | None],
+) -> bool:
+    """ Determine whether an existing File matches its Data File.
+ - In hash mode, each Data File is hashed at most once, and only after a File of the same size is found.
+
+**Parameters:**
+ - entry (DirEntry): The existing entry in the File Tree.
+ - data_path (Path): The Data File that the entry would be created from.
+ - data_stats (dict[Path, stat_result?]): The status of each Data File, obtained once.
+ - compare (CompareMode): Whether the modification time or the hash is compared.
+ - data_digests (dict[Path, bytes?]): The digest of each Data File, obtained once.
+
+**Returns:**
+ bool - True when the File has the same size, and the same modification time or hash.
+    """
+    if (data_stat := data_stats.get(data_path, data_stats)) is data_stats:
+        try:
+            data_stats[data_path] = data_stat = stat(data_path)
+        except OSError:
+            data_stats[data_path] = data_stat = None
+    try:
+        if data_stat is None or not entry.is_file():
+            return False
+        entry_stat = entry.stat()
+        if entry_stat.st_size != data_stat.st_size:
+            return False
+        if compare == 'mtime':
+            return entry_stat.st_mtime_ns == data_stat.st_mtime_ns
+        if (data_digest := data_digests.get(data_path, data_digests)) is data_digests:
+            try:
+                data_digests[data_path] = data_digest = hash_file(data_path)
+            except OSError:
+                data_digests[data_path] = data_digest = None
+        return data_digest is not None and hash_file(entry.path) == data_digest
+    except OSError:
+        return False
+
+
+def hash_file(path: Path | str) -> bytes:
+    """ Compute the SHA-256 digest of a File.
+
+**Parameters:**
+ - path (Path | str): The Path to the File.
+
+**Returns:**
+ bytes - The digest of the File contents.
+
+**Raises:**
+ OSError - When the File cannot be read.
+    """
+    with open(path, 'rb') as file:
+        return file_digest(file, 'sha256').digest()
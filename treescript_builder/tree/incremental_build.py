@@ -0,0 +1,51 @@
+""" Incremental Build Filter.
+ - Takes a single snapshot of each Directory in the Plan, using os.scandir.
+ - Removes the Instructions whose outcome already holds, before the Plan is executed.
+ Author: DK96-OS 2024 - 2025
+"""
+from os import DirEntry, stat_result
+from pathlib import Path
+
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.file_snapshot import CompareMode, is_dir_entry, is_file_entry, is_same_file, scan_directory
+
+
+def filter_existing(
+    plan: InstructionPlan,
+    compare: CompareMode = 'mtime',
+) -> InstructionPlan:
+    """ Remove the build Instructions that would not change the File Tree.
+ - A Directory Instruction is removed when the Directory exists.
+ - An empty File Instruction is removed when the File exists.
+ - A Data File Instruction is removed when the File has the same size as the Data File, and the same modification time or hash.
+ - Each Directory is scanned at most once. Missing Directories are not scanned, and their Instructions are kept.
+
+**Parameters:**
+ - plan (InstructionPlan): The validated build Instructions.
+ - compare (CompareMode): How the contents of existing Data Files are compared. Default: mtime.
+
+**Returns:**
+ InstructionPlan - The Instructions that must be executed, in order.
+    """
+    snapshot: dict[int, dict[str, DirEntry] | None] = {}
+    data_stats: dict[Path, stat_result | None] = {}
+    data_digests: dict[Path, bytes | None] = {}
+    remaining = []
+    for index in range(len(plan)):
+        parent = plan.get_parent(index)
+        if (entries := snapshot.get(parent, snapshot)) is snapshot:
+            snapshot[parent] = entries = scan_directory(Path(*plan.get_dir_parts(parent)))
+        name = plan.get_name(index)
+        data_path = plan.get_data_path(index)
+        if entries is not None and (entry := entries.get(name)) is not None:
+            if plan.is_dir(index):
+                if is_dir_entry(entry):
+                    continue
+            elif data_path is None:
+                if is_file_entry(entry):
+                    continue
+            elif is_same_file(entry, data_path, data_stats, compare, data_digests):
+                continue
+        remaining.append(index)
+    return plan.select(remaining)
+
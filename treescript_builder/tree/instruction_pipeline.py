@@ -0,0 +1,111 @@
+""" Instruction Pipeline Methods.
+ - Runs Tree Validation in a producer thread, while the Instructions are executed.
+ Author: DK96-OS 2024 - 2025
+"""
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Generator, Iterator, TypeVar
+
+
+_QUEUE_SIZE = 256
+_QUEUE_TIMEOUT = 0.1 # Seconds
+
+T = TypeVar('T')
+
+
+class _PipelineEnd:
+    """ Marks the end of the Pipeline, and carries any exception raised by the producer.
+    """
+
+    def __init__(self, error: BaseException | None = None):
+        self.error = error
+
+
+def pipeline_instructions(
+    instructions: Iterator[T],
+    queue_size: int = _QUEUE_SIZE,
+) -> Generator[T, None, None]:
+    """ Consume an Iterator in a producer thread, passing its elements through a bounded Queue.
+ - At most queue_size elements are held between the producer and the consumer.
+ - Exceptions raised by the producer, including SystemExit, are raised again in the consumer.
+
+**Parameters:**
+ - instructions (Iterator[T]): The Iterator that provides the elements, such as a Tree Validation generator.
+ - queue_size (int): The maximum number of elements waiting in the Queue. Default: 256.
+
+**Yields:**
+ T - The elements of the Iterator, in order.
+
+**Raises:**
+ BaseException - Any exception raised while producing the elements.
+    """
+    queue: Queue = Queue(maxsize=queue_size)
+    stop = Event()
+    producer = Thread(
+        target=_produce,
+        args=(instructions, queue, stop),
+        daemon=True,
+    )
+    producer.start()
+    try:
+        while True:
+            try:
+                item = queue.get(timeout=_QUEUE_TIMEOUT)
+            except Empty:
+                if not producer.is_alive() and queue.empty():
+                    return
+                continue
+            if isinstance(item, _PipelineEnd):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally: # Release the producer when the consumer stops early
+        stop.set()
+        producer.join()
+
+
+def _produce(
+    instructions: Iterator[T],
+    queue: Queue,
+    stop: Event,
+):
+    """ Put every element of the Iterator into the Queue, followed by the end marker.
+
+**Parameters:**
+ - instructions (Iterator[T]): The Iterator that provides the elements.
+ - queue (Queue): The bounded Queue shared with the consumer.
+ - stop (Event): Set by the consumer when it no longer reads from the Queue.
+    """
+    try:
+        for item in instructions:
+            if not _put(queue, item, stop):
+                return
+    except BaseException as error: # Includes SystemExit from Tree Validation
+        _put(queue, _PipelineEnd(error), stop)
+        return
+    _put(queue, _PipelineEnd(), stop)
+
+
+def _put(
+    queue: Queue,
+    item,
+    stop: Event,
+) -> bool:
+    """ Put an item into the Queue, waiting while it is full.
+
+**Parameters:**
+ - queue (Queue): The bounded Queue.
+ - item: The element to add to the Queue.
+ - stop (Event): When set, the item is discarded.
+
+**Returns:**
+ bool - Whether the item was added to the Queue.
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_QUEUE_TIMEOUT)
+            return True
+        except Full:
+            continue
+    return False
@@ -0,0 +1,94 @@
+""" Parallel Instruction Executor.
+ - File Instructions are executed by a pool of worker threads.
+ - Directory Instructions are executed in order, by the dispatching thread.
+ - In trim mode, a Directory Instruction waits for the Instructions inside the Directory.
+ - Results are provided in the original Instruction order.
+ Author: DK96-OS 2024 - 2025
+"""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Generator, Iterable
+
+from treescript_builder.data.instruction_data import InstructionData
+
+
+_WINDOW_PER_JOB = 64
+
+
+def execute_parallel(
+    instructions: Iterable[InstructionData],
+    operation: Callable[[InstructionData], bool],
+    jobs: int,
+    wait_for_children: bool = False,
+) -> Generator[bool, None, None]:
+    """ Execute the Instructions with a pool of worker threads.
+ - Each File Instruction depends only on its parent Directory Instruction, which always precedes it.
+ - Directory Instructions run in the dispatching thread, so they complete before any later File is submitted.
+ - When waiting for children, the Directory Instruction follows its contents, and runs after they have finished.
+ - The number of pending results is bounded, so Instructions may be provided lazily.
+
+**Parameters:**
+ - instructions (Iterable[InstructionData]): The Instructions to execute.
+ - operation (Callable[[InstructionData], bool]): The method that executes a single Instruction.
+ - jobs (int): The number of worker threads.
+ - wait_for_children (bool): Whether a Directory Instruction waits for the File Instructions inside it. Default: False.
+
+**Yields:**
+ bool - The success or failure of each Instruction, in the original order.
+    """
+    window = jobs * _WINDOW_PER_JOB
+    pending: deque[Future | bool] = deque()
+    # The submitted File Instructions, by parent Directory
+    children: dict[Path, list[Future]] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for i in instructions:
+            if i.is_dir:
+                if wait_for_children and (dir_children := children.pop(i.path, None)) is not None:
+                    wait(dir_children)
+                pending.append(operation(i))
+            else:
+                pending.append(future := executor.submit(operation, i))
+                if wait_for_children:
+                    _add_child(children, i.path.parent, future, window)
+            while len(pending) > window:
+                yield _get_result(pending.popleft())
+        while len(pending) > 0:
+            yield _get_result(pending.popleft())
+
+
+def _add_child(
+    children: dict[Path, list[Future]],
+    parent: Path,
+    future: Future,
+    limit: int,
+):
+    """ Add a File Future to the collection of its parent Directory.
+ - Completed Futures are discarded when the collection exceeds the limit.
+
+**Parameters:**
+ - children (dict[Path, list[Future]]): The submitted File Instructions, by parent Directory.
+ - parent (Path): The parent Directory of the File.
+ - future (Future): The Future of the submitted File Instruction.
+ - limit (int): The collection size at which completed Futures are discarded.
+    """
+    if (dir_children := children.get(parent)) is None:
+        children[parent] = [future]
+        return
+    dir_children.append(future)
+    if len(dir_children) > limit:
+        children[parent] = [x for x in dir_children if not x.done()]
+
+
+def _get_result(result: Future | bool) -> bool:
+    """ Obtain the result of an Instruction, waiting for it if necessary.
+
+**Parameters:**
+ - result (Future | bool): The Future of a submitted Instruction, or the result of an Instruction that has run.
+
+**Returns:**
+ bool - Whether the Instruction succeeded.
+    """
+    if isinstance(result, Future):
+        return result.result()
+    return result
@@ -0,0 +1,197 @@
+""" Tree Reconciliation.
+ - Compares the File Tree with a validated build Plan, scanning each Directory in the Plan once.
+ - Produces a removal Plan and a build Plan which, executed in that order, make the File Tree match the TreeScript.
+ Author: DK96-OS 2024 - 2025
+"""
+from os import DirEntry, scandir, stat_result
+from os.path import abspath
+from pathlib import Path
+from typing import Iterable
+
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.file_snapshot import CompareMode, is_dir_entry, is_file_entry, is_same_file, scan_directory
+
+
+def plan_reconcile(
+    plan: InstructionPlan,
+    compare: CompareMode = 'mtime',
+    protected: Iterable[Path] = (),
+) -> tuple[InstructionPlan, InstructionPlan]:
+    """ Determine the operations that make the File Tree match the build Plan.
+ - Missing Files and Directories are created, and Data Files that differ from their Data File are copied again.
+ - An entry of the wrong type is removed, before it is created again. A symbolic link where a Directory belongs is removed, and never followed.
+ - Entries that are not in the TreeScript are removed, only inside the Directories of the TreeScript.
+ - Existing Files without a DataLabel keep their contents.
+
+**Parameters:**
+ - plan (InstructionPlan): The validated build Instructions.
+ - compare (CompareMode): How the contents of existing Data Files are compared. Default: mtime.
+ - protected (Iterable[Path]): Paths that are never removed, along with the Directories that contain them. Default: empty.
+
+**Returns:**
+ tuple[InstructionPlan, InstructionPlan] - The removal Plan, in trim order, followed by the build Plan.
+    """
+    children = _get_children(plan)
+    snapshot = _scan_tree(children)
+    protected = tuple(Path(abspath(x)) for x in protected)
+    removals, builds = InstructionPlan(), InstructionPlan()
+    removal_dirs: dict[tuple[str, ...], int] = {}
+    build_dirs: dict[tuple[str, ...], int] = {}
+    data_stats: dict[Path, stat_result | None] = {}
+    data_digests: dict[Path, bytes | None] = {}
+    planned_dirs: set[tuple[str, ...]] = set()
+    for is_dir, parts, name, data_path in plan.iter_entries():
+        if is_dir:
+            planned_dirs.add(parts + (name,))
+        if (entries := snapshot.get(parts)) is not None and (entry := entries.get(name)) is not None:
+            if is_dir:
+                if is_dir_entry(entry, follow_symlinks=False):
+                    continue
+            elif data_path is None:
+                if is_file_entry(entry):
+                    continue
+            elif is_same_file(entry, data_path, data_stats, compare, data_digests):
+                continue
+            # A Data File that differs is copied again, replacing any link, or an entry of the wrong type
+            if is_dir or is_dir_entry(entry) or entry.is_symlink():
+                _append_removal(removals, removal_dirs, parts, name, entry)
+        builds.append_entry(is_dir, _get_dir_id(builds, build_dirs, parts), name, data_path)
+    # Remove the entries of the wrong type where a parent Directory belongs, which the Directory Instructions create
+    for parts in children:
+        if len(parts) == 0 or parts in planned_dirs or (entries := snapshot[parts[:-1]]) is None:
+            continue
+        if (entry := entries.get(parts[-1])) is not None and not is_dir_entry(entry, follow_symlinks=False):
+            _append_removal(removals, removal_dirs, parts[:-1], parts[-1], entry)
+    # Remove the entries that are not in the TreeScript, except in the root Directory
+    for parts, names in children.items():
+        if len(parts) == 0 or (entries := snapshot[parts]) is None:
+            continue
+        for name, entry in entries.items():
+            if name not in names and not _is_protected(Path(abspath(Path(*parts, name))), protected):
+                _append_removal(removals, removal_dirs, parts, name, entry)
+    return removals, builds
+
+
+def _get_children(plan: InstructionPlan) -> dict[tuple[str, ...], set[str]]:
+    """ Collect the names in each Directory of the Plan, including Directories that only contain other Directories.
+
+**Parameters:**
+ - plan (InstructionPlan): The validated build Instructions.
+
+**Returns:**
+ dict[tuple[str], set[str]] - The names of the entries in each Directory, by the names in its Path.
+    """
+    children: dict[tuple[str, ...], set[str]] = {(): set()}
+    for is_dir, parts, name, _ in plan.iter_entries():
+        _add_directory(children, parts).add(name)
+        if is_dir:
+            _add_directory(children, parts + (name,))
+    return children
+
+
+def _add_directory(
+    children: dict[tuple[str, ...], set[str]],
+    parts: tuple[str, ...],
+) -> set[str]:
+    """ Add a Directory to the collection, registering it and any missing ancestor in their parent.
+
+**Parameters:**
+ - children (dict[tuple[str], set[str]]): The names of the entries in each Directory.
+ - parts (tuple[str]): The names in the Path of the Directory.
+
+**Returns:**
+ set[str] - The names of the entries in the Directory.
+    """
+    if (names := children.get(parts)) is not None:
+        return names
+    missing = [parts]
+    while (parent := missing[-1][:-1]) not in children:
+        missing.append(parent)
+    for dir_parts in reversed(missing):
+        children[dir_parts[:-1]].add(dir_parts[-1])
+        children[dir_parts] = set()
+    return children[parts]
+
+
+def _scan_tree(children: dict[tuple[str, ...], set[str]]) -> dict[tuple[str, ...], dict[str, DirEntry] | None]:
+    """ Scan each Directory of the Plan once, from the root down.
+ - A Directory is only scanned when its parent contains it as a Directory, rather than a symbolic link.
+
+**Parameters:**
+ - children (dict[tuple[str], set[str]]): The names of the entries in each Directory.
+
+**Returns:**
+ dict[tuple[str], dict[str, DirEntry]?] - The entries of each Directory, or None if it was not scanned.
+    """
+    snapshot: dict[tuple[str, ...], dict[str, DirEntry] | None] = {}
+    for parts in sorted(children, key=len):
+        if len(parts) > 0 and (
+            (entries := snapshot[parts[:-1]]) is None or
+            (entry := entries.get(parts[-1])) is None or
+            not is_dir_entry(entry, follow_symlinks=False)
+        ):
+            snapshot[parts] = None
+        else:
+            snapshot[parts] = scan_directory(Path(*parts))
+    return snapshot
+
+
+def _append_removal(
+    removals: InstructionPlan,
+    removal_dirs: dict[tuple[str, ...], int],
+    parts: tuple[str, ...],
+    name: str,
+    entry: DirEntry,
+):
+    """ Add the removal of an entry to the Plan. A Directory is removed after its contents.
+
+**Parameters:**
+ - removals (InstructionPlan): The removal Plan.
+ - removal_dirs (dict[tuple[str], int]): The ids of the Directories in the removal Plan.
+ - parts (tuple[str]): The names in the Path of the Directory that contains the entry.
+ - name (str): The name of the entry.
+ - entry (DirEntry): The entry to remove.
+    """
+    stack = [(parts, name, entry, False)]
+    while len(stack) > 0:
+        parts, name, entry, is_expanded = stack.pop()
+        if is_expanded or not is_dir_entry(entry, follow_symlinks=False):
+            removals.append_entry(is_expanded, _get_dir_id(removals, removal_dirs, parts), name)
+            continue
+        stack.append((parts, name, entry, True))
+        try:
+            with scandir(entry.path) as entries:
+                stack.extend((parts + (name,), x.name, x, False) for x in entries)
+        except OSError:
+            pass
+
+
+def _get_dir_id(
+    plan: InstructionPlan,
+    dir_ids: dict[tuple[str, ...], int],
+    parts: tuple[str, ...],
+) -> int:
+    """ Obtain the id of a Directory in a Plan, from the names in its Path.
+
+**Parameters:**
+ - plan (InstructionPlan): The Plan containing the Directory.
+ - dir_ids (dict[tuple[str], int]): The ids that have already been obtained.
+ - parts (tuple[str]): The names in the Path of the Directory.
+
+**Returns:**
+ int - The id of the Directory, or -1 for the root.
+    """
+    if (dir_id := dir_ids.get(parts)) is None:
+        dir_id = -1
+        for name in parts:
+            dir_id = plan.get_dir_id(dir_id, name)
+        dir_ids[parts] = dir_id
+    return dir_id
+
+
+def _is_protected(
+    path: Path,
+    protected: tuple[Path, ...],
+) -> bool:
+    return any(path == x or path in x.parents for x in protected)
+
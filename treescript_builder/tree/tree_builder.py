@@ -1,29 +1,76 @@
 """Tree Building Operations.
  Author: DK96-OS 2024 - 2025
 """
+from functools import partial
 from pathlib import Path
 from shutil import copy2
+from typing import Generator, Iterable
 
 from treescript_builder.data.instruction_data import InstructionData
-
-
-def build(instructions: tuple[InstructionData, ...]) -> tuple[bool, ...]:
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.dir_fd_executor import execute_dir_fd, is_dir_fd_supported
+from treescript_builder.tree.file_copier import CopyMode, FileCopier
+from treescript_builder.tree.parallel_executor import execute_parallel
+
+
+def build(
+    instructions: tuple[InstructionData, ...] | InstructionPlan,
+    jobs: int = 1,
+    copy_mode: CopyMode = 'copy',
+    use_dir_fd: bool = False,
+) -> tuple[bool, ...]:
     """ Execute the Instructions in build mode.
 
 **Parameters:**
- - instructions(tuple[InstructionData]): The Instructions to execute.
+ - instructions(tuple[InstructionData] | InstructionPlan): The Instructions to execute.
+ - jobs (int): The number of worker threads that create Files. Default: 1.
+ - copy_mode (CopyMode): The method used to create Files from the Data Directory. Default: copy.
+ - use_dir_fd (bool): Whether to execute relative to open Directory file descriptors, when supported. Default: False.
 
 **Returns:**
  tuple[bool] - The success or failure of each instruction.
     """
-    return tuple(_build(i) for i in instructions)
+    return tuple(build_stream(instructions, jobs, copy_mode, use_dir_fd))
+
+
+def build_stream(
+    instructions: Iterable[InstructionData],
+    jobs: int = 1,
+    copy_mode: CopyMode = 'copy',
+    use_dir_fd: bool = False,
+) -> Generator[bool, None, None]:
+    """ Execute the Instructions in build mode, as they are received.
+ - The Directory file descriptor executor runs in a single thread, so jobs is not used with it.
 
+**Parameters:**
+ - instructions(Iterable[InstructionData]): The Instructions to execute.
+ - jobs (int): The number of worker threads that create Files. Default: 1.
+ - copy_mode (CopyMode): The method used to create Files from the Data Directory. Default: copy.
+ - use_dir_fd (bool): Whether to execute relative to open Directory file descriptors, when supported. Default: False.
 
-def _build(i: InstructionData) -> bool:
+**Yields:**
+ bool - The success or failure of each instruction, after it is executed.
+    """
+    if use_dir_fd and is_dir_fd_supported():
+        yield from execute_dir_fd(instructions, False, copy_mode)
+        return
+    operation = _build if copy_mode == 'copy' else partial(_build, copier=FileCopier(copy_mode))
+    if jobs > 1:
+        yield from execute_parallel(instructions, operation, jobs)
+        return
+    for i in instructions:
+        yield operation(i)
+
+
+def _build(
+    i: InstructionData,
+    copier: FileCopier | None = None,
+) -> bool:
     """ Execute a single instruction.
 
 **Parameters:**
  - instruction(InstructionData): The data required to execute the operation.
+ - copier (FileCopier?): The FileCopier used for Data Files, or None to use copy2. Default: None.
 
 **Returns:**
  bool - Whether the given operation succeeded.
@@ -33,6 +80,8 @@ def _build(i: InstructionData) -> bool:
     elif i.data_path is None:
         i.path.touch(exist_ok=True)
         return True
+    elif copier is not None:
+        return copier.copy(i.data_path, i.path)
     else:
         return _create_file(i.path, i.data_path)
 
@@ -61,6 +110,7 @@ def _make_dir_exist(
     path: Path
 ) -> bool:
     """ Ensure that the Directory at the given Path exists.
+ - The Directory is created without checking for it first, as mkdir reports an existing Directory.
 
 **Parameters:**
  - path (Path): The Path to the File to be created, and written to.
@@ -68,8 +118,6 @@ def _make_dir_exist(
 **Returns:**
  bool - True if the Operation Succeeded, or if the Path already exists.
     """
-    if path.exists():
-        return True
     try:
         path.mkdir(parents=True, exist_ok=True)
     except OSError:
@@ -1,25 +1,86 @@
 """Tree Trimming Methods.
  Author: DK96-OS 2024 - 2025
 """
+from functools import partial
 from pathlib import Path
-from shutil import move
+from typing import Generator, Iterable
 
 from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
+from treescript_builder.tree.dir_fd_executor import execute_dir_fd, is_dir_fd_supported
+from treescript_builder.tree.file_mover import FileMover
+from treescript_builder.tree.parallel_executor import execute_parallel
 
 
-def trim(instructions: tuple[InstructionData, ...]) -> tuple[bool, ...]:
+def trim(
+    instructions: tuple[InstructionData, ...] | InstructionPlan,
+    jobs: int = 1,
+    use_dir_fd: bool = False,
+) -> tuple[bool, ...]:
     """ Execute the Instructions in trim mode.
+ - The subtrees of an InstructionPlan that contain no Data Files are removed in bulk, where supported.
+ - The Instructions not completed in bulk are then executed individually, in order.
 
 **Parameters:**
- - instructions(tuple[InstructionData]): The Instructions to execute.
+ - instructions(tuple[InstructionData] | InstructionPlan): The Instructions to execute.
+ - jobs (int): The number of worker threads that move and remove Files. Default: 1.
+ - use_dir_fd (bool): Whether to execute relative to open Directory file descriptors, when supported. Default: False.
 
 **Returns:**
  tuple[bool] - The success or failure of each instruction.
     """
-    return tuple(_trim(i) for i in instructions)
+    if isinstance(instructions, InstructionPlan) and len(instructions) > 0:
+        from treescript_builder.tree.bulk_trim import is_bulk_trim_supported, remove_subtrees
+        if is_bulk_trim_supported() and len(removed := remove_subtrees(instructions, jobs)) > 0:
+            results = [True] * len(instructions)
+            remaining = [x for x in range(len(instructions)) if x not in removed]
+            for index, result in zip(remaining, _execute(instructions.select(remaining), jobs, use_dir_fd)):
+                results[index] = result
+            return tuple(results)
+    return tuple(_execute(instructions, jobs, use_dir_fd))
 
 
-def _trim(instruct: InstructionData) -> bool:
+def trim_stream(
+    instructions: Iterable[InstructionData],
+    jobs: int = 1,
+    use_dir_fd: bool = False,
+) -> Generator[bool, None, None]:
+    """ Execute the Instructions in trim mode, as they are received.
+
+**Parameters:**
+ - instructions(Iterable[InstructionData]): The Instructions to execute.
+ - jobs (int): The number of worker threads that move and remove Files. Default: 1.
+ - use_dir_fd (bool): Whether to execute relative to open Directory file descriptors, when supported. Default: False.
+
+**Yields:**
+ bool - The success or failure of each instruction, after it is executed.
+    """
+    yield from _execute(instructions, jobs, use_dir_fd)
+
+
+def _execute(
+    instructions: Iterable[InstructionData],
+    jobs: int,
+    use_dir_fd: bool,
+) -> Generator[bool, None, None]:
+    """ Execute each of the Instructions in trim mode, in order.
+ - The Files moved to the Data Directory share one FileMover, which checks the devices once.
+    """
+    if use_dir_fd and is_dir_fd_supported():
+        yield from execute_dir_fd(instructions, True)
+        return
+    operation = partial(_trim, mover=FileMover())
+    if jobs > 1:
+        yield from execute_parallel(instructions, operation, jobs, wait_for_children=True)
+    else:
+        for i in instructions:
+            yield operation(i)
+
+
+def _trim(
+    instruct: InstructionData,
+    mover: FileMover,
+) -> bool:
     if instruct.is_dir:
         return _remove_dir(instruct.path)
     if instruct.data_path is None:
@@ -28,27 +89,7 @@ def _trim(instruct: InstructionData) -> bool:
         except OSError:
             return False
         return True
-    return _extract_file(instruct.path, instruct.data_path)
-
-
-def _extract_file(
-    path: Path,
-    data: Path
-) -> bool:
-    """ Moves the File to the Data Directory.
-
-**Parameters:**
- - path (Path): The path to the File in the Tree.
- - data (Path): A Path to a File in the Data Directory.
-
-**Returns:**
- bool - Whether the entire operation succeeded.
-    """
-    try:
-        move(path, data)
-    except OSError:
-        return False
-    return True
+    return mover.move(instruct.path, instruct.data_path)
 
 
 def _remove_dir(
@@ -1,41 +1,87 @@
 """Tree Validation Methods for the Trim Operation.
  Author: DK96-OS 2024 - 2025
 """
+from array import array
 from pathlib import Path
-from typing import Generator, Callable
+from typing import Callable, Generator, Iterable
 
-from treescript_builder.data.data_directory import DataDirectory, get_data_dir_validator
+from treescript_builder.data.data_directory import DataDirectory, get_data_directory, get_data_dir_validator
 from treescript_builder.data.instruction_data import InstructionData
+from treescript_builder.data.instruction_plan import InstructionPlan
 from treescript_builder.data.tree_data import TreeData
 from treescript_builder.data.tree_state import TreeState
+from treescript_builder.data.tree_store import TreeStore
+from treescript_builder.tree.depth_validation import get_parent_id, validate_depths
 
 
 def validate_trim(
-    tree_data: Generator[TreeData, None, None],
-    data_dir_path: Path | None = None,
+    tree_data: Iterable[TreeData],
+    data_dir: Path | DataDirectory | None = None,
 ) -> tuple[InstructionData, ...]:
     """ Validate the Trim Instructions.
 
 **Parameters:**
- - tree_data (Generator[TreeData]): The Generator that provides TreeData.
- - data_dir_path (Path?): The optional Path to a Data Directory. Default: None.
+ - tree_data (Iterable[TreeData]): The Generator or TreeStore that provides TreeData.
+ - data_dir (Path | DataDirectory | None): The optional Data Directory, or its Path. Default: None.
 
 **Returns:**
  tuple[InstructionData] - A tuple of InstructionData.
     """
-    return tuple(
-        _validate_trim_generator(
+    return tuple(validate_trim_stream(tree_data, data_dir))
+
+
+def plan_trim(
+    tree_data: Iterable[TreeData],
+    data_dir: Path | DataDirectory | None = None,
+) -> InstructionPlan:
+    """ Validate the Trim Instructions, storing them in a compact InstructionPlan.
+ - Instruction Paths are created when the Plan is read, rather than held for every Instruction.
+ - A TreeStore is validated in bulk, and planned from its parent indices without creating any Paths.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The Generator or TreeStore that provides TreeData.
+ - data_dir (Path | DataDirectory | None): The optional Data Directory, or its Path. Default: None.
+
+**Returns:**
+ InstructionPlan - The Instructions, in order.
+    """
+    if isinstance(tree_data, TreeStore):
+        return _plan_trim_store(
             tree_data,
             get_data_dir_validator(
-                data_dir=DataDirectory(data_dir_path) if data_dir_path is not None else None,
+                data_dir=get_data_directory(data_dir),
                 is_trim=True,
             ),
         )
+    return InstructionPlan.from_instructions(validate_trim_stream(tree_data, data_dir))
+
+
+def validate_trim_stream(
+    tree_data: Iterable[TreeData],
+    data_dir: Path | DataDirectory | None = None,
+) -> Generator[InstructionData, None, None]:
+    """ Validate the Trim Instructions lazily, one TreeData node at a time.
+ - Memory is proportional to the Tree depth, rather than the number of nodes.
+ - Validation errors are raised when the invalid node is reached.
+
+**Parameters:**
+ - tree_data (Iterable[TreeData]): The Generator or TreeStore that provides TreeData.
+ - data_dir (Path | DataDirectory | None): The optional Data Directory, or its Path. Default: None.
+
+**Returns:**
+ Generator[InstructionData] - A generator that yields Instructions.
+    """
+    return _validate_trim_generator(
+        tree_data,
+        get_data_dir_validator(
+            data_dir=get_data_directory(data_dir),
+            is_trim=True,
+        ),
     )
 
 
 def _validate_trim_generator(
-    tree_data: Generator[TreeData, None, None],
+    tree_data: Iterable[TreeData],
     data_dir_validator: Callable[[TreeData], Path | None],
 ) -> Generator[InstructionData, None, None]:
     tree_state = TreeState()
@@ -53,3 +99,45 @@ def _validate_trim_generator(
             )
     for i in tree_state.process_stack(0):                   # Pop Remaining Stack Dirs
         yield InstructionData(True, i)
+
+
+def _plan_trim_store(
+    store: TreeStore,
+    data_dir_validator: Callable[[TreeData], Path | None],
+) -> InstructionPlan:
+    """ Plan the Trim Instructions from a TreeStore, in the same order as the Trim generator.
+ - Each Directory is removed after its contents.
+
+**Parameters:**
+ - store (TreeStore): The Tree Nodes.
+ - data_dir_validator (Callable[[TreeData], Path?]): Transforms TreeData with a DataLabel to a Data Path.
+
+**Returns:**
+ InstructionPlan - The Instructions, in order.
+    """
+    parents = validate_depths(store)
+    plan = InstructionPlan()
+    # The Plan Directory id of each Directory node
+    dir_ids = array('i', (-1,)) * len(store)
+    # The Directory nodes on the current path
+    path: list[int] = []
+    for index in range(len(store)):
+        depth = store.get_depth(index)
+        while len(path) > depth:
+            dir_index = path.pop()
+            plan.append_entry(True, get_parent_id(parents, dir_ids, dir_index), store.get_name(dir_index))
+        parent_id = get_parent_id(parents, dir_ids, index)
+        if store.is_dir(index):
+            dir_ids[index] = plan.get_dir_id(parent_id, store.get_name(index))
+            path.append(index)
+        else:
+            plan.append_entry(
+                False,
+                parent_id,
+                store.get_name(index),
+                None if store.get_data_label(index) == '' else data_dir_validator(store[index]),
+            )
+    while len(path) > 0:
+        dir_index = path.pop()
+        plan.append_entry(True, get_parent_id(parents, dir_ids, dir_index), store.get_name(dir_index))
+    return plan